@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark full-project generation with the application generator.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_application_generator.py
+
+Generates example-app-spec.json (GestionClients) and synthetic specs with
+more models into a temporary directory, several times each, and prints the
+duration of every pipeline stage. The first run of a process also compiles
+the templates and fills the render cache (a temporary SQLite database); the
+following runs show the steady state. A last scenario adds a property to one
+model of the largest spec, so that only that model is rendered again.
+"""
+
+import asyncio
+import copy
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.application_generator_service import ApplicationGeneratorService  # noqa: E402
+from services.render_cache import SQLiteRenderCache  # noqa: E402
+
+EXAMPLE_SPEC = Path(__file__).resolve().parents[2] / "example-app-spec.json"
+MODEL_COUNTS = [None, 50, 200]
+RUNS = 3
+STAGES = ["normalize_ms", "context_ms", "render_ms", "write_ms", "total_ms"]
+
+
+def make_spec(model_count):
+    """The example spec, or its models repeated under new names"""
+    spec = json.loads(EXAMPLE_SPEC.read_text())
+    if model_count is None:
+        return spec
+    base = spec["models"]
+    models = []
+    for i in range(model_count):
+        model = copy.deepcopy(base[i % len(base)])
+        model["name"] = f"{model['name']}{i}"
+        models.append(model)
+    spec["models"] = models
+    return spec
+
+
+async def bench(service, spec):
+    rows = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = await service.generate_application(spec)
+        wall = (time.perf_counter() - start) * 1000
+        rows.append((result["files_generated"], wall, result["render_cache"], result["timings"]))
+    return rows
+
+
+def print_rows(label, rows):
+    for files, wall, cache, timings in rows:
+        print(
+            f"{label:>9} {files:>6} {cache['rendered']:>8} {wall:>8.1f} "
+            + " ".join(f"{timings[stage]:>10.1f}" for stage in STAGES)
+        )
+
+
+def main():
+    with tempfile.TemporaryDirectory() as output_dir:
+        service = ApplicationGeneratorService(
+            render_cache=SQLiteRenderCache(Path(output_dir) / "render_cache.sqlite3", max_bytes=1 << 30)
+        )
+        service.output_dir = Path(output_dir)
+
+        print(
+            f"{'models':>9} {'files':>6} {'rendered':>8} {'wall ms':>8} "
+            + " ".join(f"{stage[:-3]:>10}" for stage in STAGES)
+        )
+        for count in MODEL_COUNTS:
+            spec = make_spec(count)
+            print_rows(str(len(spec["models"])), asyncio.run(bench(service, spec)))
+
+        spec["models"][0]["properties"].append({"name": "benchNote", "type": "text", "required": False})
+        print_rows("1 changed", asyncio.run(bench(service, spec))[:1])
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Load-test /api/chat/stream against the offline stub LLM backend.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_chat_stream.py
+
+Drives an increasing number of concurrent SSE streams straight through the
+ASGI app (no server, no network, no API key) and reports time-to-first-event, total duration and
+events per second. With the default stub pacing every stream should take
+about first-token delay + tokens x token delay, independent of fan-out until
+LLM_MAX_CONCURRENCY is reached and streams start queueing.
+"""
+
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import json  # noqa: E402
+
+from fastapi import FastAPI  # noqa: E402
+
+from config import settings  # noqa: E402
+
+settings.LLM_BACKEND = "stub"
+settings.LLM_CACHE_ENABLED = False
+
+from routes import chat  # noqa: E402
+
+CONCURRENCY = [1, 8, 32, 128]
+
+
+async def one_stream(app: FastAPI, index: int):
+    """Call the ASGI app directly, timestamping every body chunk as it is sent"""
+    body = json.dumps({"message": f"request {index}"}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "POST", "scheme": "http", "path": "/api/chat/stream", "raw_path": b"/api/chat/stream",
+        "query_string": b"", "root_path": "", "server": ("bench", 80), "client": ("bench", 1),
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+    }
+    sent = False
+    finished = asyncio.Event()
+    start = time.perf_counter()
+    first = None
+    events = 0
+
+    async def receive():
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first, events
+        if message["type"] == "http.response.body":
+            chunk = message.get("body", b"")
+            if chunk:
+                events += chunk.count(b"data:")
+                if first is None:
+                    first = time.perf_counter() - start
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return first, time.perf_counter() - start, events
+
+
+async def run(app: FastAPI, concurrency: int):
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one_stream(app, i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    ttfb = [r[0] for r in results]
+    durations = [r[1] for r in results]
+    events = sum(r[2] for r in results)
+    print(
+        f"{concurrency:>5} streams  ttfb p50 {statistics.median(ttfb) * 1000:7.1f} ms"
+        f"  max {max(ttfb) * 1000:7.1f} ms  stream p50 {statistics.median(durations) * 1000:7.1f} ms"
+        f"  {events / elapsed:9.0f} events/s"
+    )
+
+
+async def run_all():
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/chat")
+    for concurrency in CONCURRENCY:
+        await run(app, concurrency)
+
+
+def main():
+    print(
+        f"stub: {settings.LLM_STUB_RESPONSE_TOKENS} tokens, {settings.LLM_STUB_TOKENS_PER_CHUNK}/chunk, "
+        f"{settings.LLM_STUB_TOKEN_DELAY * 1000:.0f} ms between chunks, "
+        f"max concurrency {settings.LLM_MAX_CONCURRENCY}"
+    )
+    asyncio.run(run_all())
+
+
+if __name__ == "__main__":
+    main()
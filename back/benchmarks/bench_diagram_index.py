@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark the UML diagram index against the per-class relation scan.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_diagram_index.py
+
+For each synthetic diagram size it times building the DiagramIndex plus one
+relation lookup per class, and the legacy list comprehension over every
+relation (skipped above 5k classes, where it takes minutes). The index time
+per class should stay flat as the diagram grows.
+"""
+
+import gc
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from models.uml import UMLDiagram  # noqa: E402
+from models.diagram_index import DiagramIndex  # noqa: E402
+
+SIZES = [1_000, 2_500, 5_000, 10_000]
+SCAN_LIMIT = 5_000
+
+
+def make_diagram(class_count: int) -> UMLDiagram:
+    """Build a diagram with two relations per class, one of them inheritance"""
+    classes = [
+        {
+            "id": f"class-{i}",
+            "name": f"Class{i}",
+            "attributes": [{"id": f"attr-{i}", "name": "id", "type": "String"}],
+        }
+        for i in range(class_count)
+    ]
+    relations = []
+    for i in range(1, class_count):
+        relations.append({"id": f"assoc-{i}", "sourceId": f"class-{i}", "targetId": f"class-{i - 1}", "type": "association"})
+        relations.append({"id": f"inh-{i}", "sourceId": f"class-{i}", "targetId": f"class-{i // 2}", "type": "inheritance"})
+    return UMLDiagram(classes=classes, relations=relations)
+
+
+def bench_index(diagram: UMLDiagram) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    index = DiagramIndex.from_diagram(diagram)
+    for cls in diagram.classes:
+        index.relations_for(cls.id)
+    return time.perf_counter() - start
+
+
+def bench_scan(diagram: UMLDiagram) -> float:
+    gc.collect()
+    start = time.perf_counter()
+    for cls in diagram.classes:
+        [r for r in diagram.relations if r.sourceId == cls.id or r.targetId == cls.id]
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{'classes':>8} {'relations':>10} {'index ms':>10} {'us/class':>9} {'scan ms':>10}")
+    for size in SIZES:
+        diagram = make_diagram(size)
+        index_time = bench_index(diagram)
+        scan = f"{bench_scan(diagram) * 1000:10.1f}" if size <= SCAN_LIMIT else f"{'-':>10}"
+        print(
+            f"{size:>8} {len(diagram.relations):>10} {index_time * 1000:>10.1f} "
+            f"{index_time / size * 1e6:>9.2f} {scan}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Benchmark the memoised naming conversions on the Angular entity templates.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_naming.py
+
+Normalises a 500-model spec (the example models repeated under new names),
+builds its contexts and renders the four entity page templates (list and
+details, .ts and .html) of every model, with the naming caches and with the
+undecorated conversions. Then times the Jinja naming filters alone against
+the previous implementations, which imported re and compiled their patterns
+on every call. Prints the naming cache counters at the end.
+"""
+
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services import application_generator_service as generator_module  # noqa: E402
+from services import naming  # noqa: E402
+from services import spec_normalizer as normalizer_module  # noqa: E402
+from services.application_generator_service import MODEL_TEMPLATES, ApplicationGeneratorService  # noqa: E402
+
+EXAMPLE_SPEC = Path(__file__).resolve().parents[2] / "example-app-spec.json"
+MODEL_COUNT = 500
+RUNS = 3
+FILTER_CALLS = 200_000
+
+ENTITY_TEMPLATES = [template for template, _, kind in MODEL_TEMPLATES if kind == "entity"]
+# Modules calling the identifier conversions, and the conversions they import
+CONVERSION_USERS = {
+    generator_module: ["camel_name", "kebab_name", "upper_snake_name"],
+    normalizer_module: ["camel_name", "kebab_name", "pascal_name", "plural_name", "upper_snake_name"],
+}
+
+
+def legacy_snake_case(text):
+    import re
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
+    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower().replace('-', '_')
+
+
+def legacy_kebab_case(text):
+    import re
+    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', text)
+    return re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1).lower().replace('_', '-')
+
+
+def make_spec():
+    spec = json.loads(EXAMPLE_SPEC.read_text())
+    base = spec["models"]
+    models = []
+    for i in range(MODEL_COUNT):
+        model = copy.deepcopy(base[i % len(base)])
+        model["name"] = f"{model['name']}{i}"
+        models.append(model)
+    spec["models"] = models
+    return spec
+
+
+def render_entities(service, spec):
+    start = time.perf_counter()
+    app = service.normalize_spec(spec)
+    contexts = [service.build_model_contexts(model, app) for model in app.models]
+    built = time.perf_counter()
+    for context in contexts:
+        for template in ENTITY_TEMPLATES:
+            service.template_service.render_template(template, context["entity"])
+    end = time.perf_counter()
+    return (built - start) * 1000, (end - built) * 1000
+
+
+def bench_entities(service, spec, label):
+    for _ in range(RUNS):
+        context_ms, render_ms = render_entities(service, spec)
+        print(f"{label:>10} {context_ms:>12.1f} {render_ms:>10.1f} {context_ms + render_ms:>10.1f}")
+
+
+def bench_filters(names):
+    print(f"\n{'filter':>12} {'legacy ms':>10} {'cached ms':>10}")
+    for label, legacy, cached in [
+        ("snake_case", legacy_snake_case, naming.snake_case),
+        ("kebab_case", legacy_kebab_case, naming.kebab_case),
+    ]:
+        timings = []
+        for conversion in (legacy, cached):
+            start = time.perf_counter()
+            for i in range(FILTER_CALLS):
+                conversion(names[i % len(names)])
+            timings.append((time.perf_counter() - start) * 1000)
+        print(f"{label:>12} {timings[0]:>10.1f} {timings[1]:>10.1f}")
+
+
+def main():
+    service = ApplicationGeneratorService()
+    spec = make_spec()
+    names = [model["name"] for model in spec["models"][:20]]
+    names += [prop["name"] for prop in spec["models"][0]["properties"]]
+
+    # Compile the templates once so that both runs measure rendering only
+    render_entities(service, spec)
+
+    print(f"{MODEL_COUNT} models, {len(ENTITY_TEMPLATES)} entity templates each")
+    print(f"{'naming':>10} {'contexts ms':>12} {'render ms':>10} {'total ms':>10}")
+
+    naming.clear_caches()
+    bench_entities(service, spec, "cached")
+    stats = naming.cache_stats()
+
+    try:
+        for module, names_used in CONVERSION_USERS.items():
+            for name in names_used:
+                setattr(module, name, getattr(naming, name).__wrapped__)
+        bench_entities(service, spec, "uncached")
+    finally:
+        for module, names_used in CONVERSION_USERS.items():
+            for name in names_used:
+                setattr(module, name, getattr(naming, name))
+
+    bench_filters(names)
+
+    print(f"\nnaming cache: {stats['hits']} hits, {stats['misses']} misses")
+    for name, counters in stats["conversions"].items():
+        if counters["hits"] or counters["misses"]:
+            print(f"  {name:>16}: {counters['hits']:>7} hits {counters['misses']:>6} misses")
+
+
+if __name__ == "__main__":
+    main()
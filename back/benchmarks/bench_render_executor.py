@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-class rendering of large UML diagrams on the render pool.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_render_executor.py
+
+Renders one template per class, as ScaffoldingService does, in thread and
+process mode. In process mode the diagram is passed as the shared context
+of render_many, which sends it to each worker once; the "per job" column
+submits one render per class with the diagram in its context, so it is
+pickled once per class (skipped above 1k classes, where it takes minutes).
+"""
+
+import asyncio
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from benchmarks.bench_diagram_index import make_diagram  # noqa: E402
+from models.diagram_index import DiagramIndex  # noqa: E402
+from services.render_executor import RenderExecutor  # noqa: E402
+from services.template_service import TemplateService  # noqa: E402
+
+SIZES = [250, 1_000, 2_000, 5_000]
+PER_JOB_LIMIT = 1_000
+TEMPLATE = "class {{ class.name }}:  # {{ relations | length }} relations, {{ all_classes | length }} classes\n"
+
+
+def make_jobs(diagram):
+    index = DiagramIndex.from_diagram(diagram)
+    return [
+        ("class.py.j2", {"class": cls, "relations": index.relations_for(cls.id), "timestamp": "now"})
+        for cls in diagram.classes
+    ]
+
+
+async def bench(executor, jobs, shared, per_job):
+    start = time.perf_counter()
+    if per_job:
+        results = await asyncio.gather(
+            *(executor.render(name, {**shared, **context}) for name, context in jobs),
+            return_exceptions=True
+        )
+    else:
+        results = await executor.render_many(jobs, shared)
+    elapsed = time.perf_counter() - start
+    failed = [result for result in results if isinstance(result, BaseException)]
+    if failed:
+        raise failed[0]
+    return elapsed
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        templates_dir = Path(directory) / "templates"
+        templates_dir.mkdir()
+        (templates_dir / "class.py.j2").write_text(TEMPLATE)
+        templates = TemplateService(templates_dir=templates_dir, cache_dir=Path(directory) / "cache")
+
+        print(f"{'classes':>8} {'thread ms':>10} {'process ms':>10} {'per job ms':>10}")
+        for size in SIZES:
+            diagram = make_diagram(size)
+            jobs = make_jobs(diagram)
+            shared = {"all_classes": diagram.classes}
+            runs = [("thread", False), ("process", False)]
+            if size <= PER_JOB_LIMIT:
+                runs.append(("process", True))
+            timings = []
+            for mode, per_job in runs:
+                executor = RenderExecutor(mode=mode, templates=templates)
+                try:
+                    # Start the workers outside the measurement
+                    asyncio.run(bench(executor, jobs[:1], shared, False))
+                    timings.append(asyncio.run(bench(executor, jobs, shared, per_job)))
+                finally:
+                    executor.shutdown()
+            columns = [f"{t * 1000:>10.1f}" for t in timings] + [f"{'-':>10}"] * (3 - len(timings))
+            print(f"{size:>8} " + " ".join(columns))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Benchmark watch-mode regenerations (edit-to-output latency).
+
+Run from the back/ directory:
+
+    python benchmarks/bench_spec_watch.py
+
+Writes synthetic specs (the example models repeated under new names) to a
+temporary directory and generates them once, as `python watch.py` does on
+start. Then edits one property of one model, saves the spec and times the
+incremental regeneration, several times; a last regeneration runs with no
+change. The render cache lives in the temporary directory, so the first
+generation renders everything. As in watch.py, the objects left by the
+first generation are then frozen out of the garbage collector.
+File watching and debouncing are not included.
+"""
+
+import asyncio
+import copy
+import gc
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.application_generator_service import ApplicationGeneratorService  # noqa: E402
+from services.render_cache import MemoryRenderCache, SQLiteRenderCache  # noqa: E402
+from services.spec_watch_service import SpecWatchSession  # noqa: E402
+
+EXAMPLE_SPEC = Path(__file__).resolve().parents[2] / "example-app-spec.json"
+MODEL_COUNTS = [3, 50, 200]
+EDITS = 5
+STAGES = ["read_ms", "normalize_ms", "context_ms", "render_ms", "write_ms", "total_ms"]
+
+
+def make_spec(model_count):
+    spec = json.loads(EXAMPLE_SPEC.read_text())
+    base = spec["models"]
+    models = []
+    for i in range(model_count):
+        model = copy.deepcopy(base[i % len(base)])
+        model["name"] = f"{model['name']}{i}"
+        models.append(model)
+    spec["models"] = models
+    return spec
+
+
+def print_event(label, event):
+    timings = event["timings"]
+    files = event["files"]
+    print(
+        f"{label:>8} {event['render_cache']['rendered']:>8} {files['added'] + files['changed']:>8} "
+        + " ".join(f"{timings[stage]:>9.1f}" for stage in STAGES)
+    )
+
+
+async def bench(directory, model_count):
+    cache = MemoryRenderCache(SQLiteRenderCache(directory / f"cache-{model_count}.sqlite3", max_bytes=1 << 30))
+    generator = ApplicationGeneratorService(render_cache=cache)
+    generator.output_dir = directory
+
+    spec = make_spec(model_count)
+    spec_path = directory / f"spec-{model_count}.json"
+    spec_path.write_text(json.dumps(spec, indent=2))
+    session = SpecWatchSession(spec_path, generator)
+
+    print(f"\n{model_count} models")
+    print(f"{'event':>8} {'rendered':>8} {'written':>8} " + " ".join(f"{stage[:-3]:>9}" for stage in STAGES))
+    print_event("start", await session.regenerate("start"))
+    gc.freeze()
+    for i in range(EDITS):
+        spec["models"][i % model_count]["properties"][0]["label"] = f"Edited {i}"
+        spec_path.write_text(json.dumps(spec, indent=2))
+        print_event(f"edit {i}", await session.regenerate())
+    print_event("no-op", await session.regenerate())
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        for count in MODEL_COUNTS:
+            asyncio.run(bench(Path(directory), count))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Benchmark the jsonschema and compiled DSL validation engines.
+
+Run from the back/ directory:
+
+    python benchmarks/bench_validation.py
+
+Validates example-app-spec.json and synthetic specs with thousands of
+models with both engines (result cache disabled) and prints the throughput
+and speed-up of the compiled engine.
+"""
+
+import copy
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from services.dsl_validation_service import DSLValidationService  # noqa: E402
+
+ROOT = Path(__file__).resolve().parents[2]
+MODEL_COUNTS = [1_000, 5_000]
+
+
+def make_spec(model_count: int) -> dict:
+    """Repeat the example models, with one invalid property every 100 models"""
+    example = json.loads((ROOT / "example-app-spec.json").read_text())
+    models = []
+    for i in range(model_count):
+        model = copy.deepcopy(example["models"][i % len(example["models"])])
+        model["name"] = f"Model{i}"
+        if i % 100 == 0:
+            model["properties"][0]["type"] = "unknown"
+        models.append(model)
+    return {"config": example["config"], "models": models}
+
+
+def throughput(service: DSLValidationService, spec: dict, min_seconds: float = 1.0) -> float:
+    """Return validations per second"""
+    service.validate_spec(spec)
+    runs = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < min_seconds:
+        service.validate_spec(spec)
+        runs += 1
+    return runs / (time.perf_counter() - start)
+
+
+def main():
+    reference = DSLValidationService(engine="jsonschema", cache_size=0)
+    compiled = DSLValidationService(engine="compiled", cache_size=0)
+
+    cases = [("example-app-spec.json", json.loads((ROOT / "example-app-spec.json").read_text()))]
+    cases += [(f"synthetic {count} models", make_spec(count)) for count in MODEL_COUNTS]
+
+    print(f"{'spec':<26} {'jsonschema/s':>13} {'compiled/s':>11} {'speed-up':>9}")
+    for name, spec in cases:
+        assert compiled.validate_spec(spec) == reference.validate_spec(spec)
+        slow = throughput(reference, spec)
+        fast = throughput(compiled, spec)
+        print(f"{name:<26} {slow:>13.1f} {fast:>11.1f} {fast / slow:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
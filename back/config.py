@@ -21,10 +21,62 @@ class Settings(BaseSettings):
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
     OPENAI_TEMPERATURE: float = 0.7
     OPENAI_MAX_TOKENS: int = 4000
+    LLM_BACKEND: str = "openai"  # openai or stub (offline, deterministic)
+    LLM_STUB_RESPONSE_TOKENS: int = 64
+    LLM_STUB_TOKENS_PER_CHUNK: int = 1
+    LLM_STUB_TOKEN_DELAY: float = 0.02  # seconds between chunks
+    LLM_STUB_FIRST_TOKEN_DELAY: float = 0.2
+    SSE_COALESCE_MAX_CHARS: int = 256
+    SSE_COALESCE_MAX_DELAY: float = 0.05  # seconds, 0 = one event per chunk
+    SSE_HEARTBEAT_INTERVAL: float = 15.0  # seconds, 0 = no heartbeats
+    CHAT_SESSION_MAX: int = 1000
+    CHAT_SESSION_TTL_SECONDS: int = 24 * 3600  # idle time, 0 = never expires
+    CHAT_HISTORY_TOKEN_BUDGET: int = 3000
+    CHAT_SUMMARY_TOKEN_BUDGET: int = 500
+    LLM_MAX_CONCURRENCY: int = 8
+    LLM_QUEUE_TIMEOUT: float = 30.0
+    LLM_REQUEST_TIMEOUT: float = 120.0
+    LLM_MAX_CONNECTIONS: int = 20
+    LLM_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    LLM_KEEPALIVE_EXPIRY: float = 30.0
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_BACKEND: str = "sqlite"  # sqlite or none
+    LLM_CACHE_PATH: Path = Path("./.cache/llm_cache.sqlite3")
+    LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600  # 0 = never expires
+    LLM_CACHE_MAX_BYTES: int = 64 * 1024 * 1024
     
     # Templates
     TEMPLATES_DIR: Path = Path("./templates")
     OUTPUT_DIR: Path = Path("./output")
+    TEMPLATE_CACHE_ENABLED: bool = True
+    TEMPLATE_CACHE_DIR: Path = Path("./.cache/templates")
+    TEMPLATE_WARMUP_ON_STARTUP: bool = True
+    TEMPLATE_WATCH_ENABLED: bool = True  # Keep the template manifest in sync with file changes
+    
+    # Rendering
+    RENDER_EXECUTOR: str = "thread"  # thread or process
+    RENDER_WORKERS: int = 0  # 0 = one worker per CPU
+    RENDER_CACHE_ENABLED: bool = True  # Reuse rendered files of unchanged models
+    RENDER_CACHE_PATH: Path = Path("./.cache/render_cache.sqlite3")
+    RENDER_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    
+    # Scaffolding
+    SCAFFOLDING_LLM_MODE: str = "pipelined"  # pipelined or sequential
+    LLM_INSIGHTS_TIMEOUT: float = 30.0
+    
+    # Application generator
+    ASSET_COPY_MODE: str = "copy"  # copy (copy_file_range/sendfile), hardlink or read
+    SPEC_WATCH_DEBOUNCE_MS: int = 50  # Quiet period before watch mode regenerates
+    
+    # Background jobs
+    JOB_WORKERS: int = 2
+    JOB_QUEUE_SIZE: int = 32
+    JOB_HISTORY_SIZE: int = 1000
+    
+    # DSL validation
+    VALIDATION_ENGINE: str = "jsonschema"  # jsonschema or compiled
+    VALIDATION_CACHE_SIZE: int = 512
+    VALIDATION_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
     
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -1,9 +1,14 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import uvicorn
 
 from routes import chat, scaffolding, application, validation
+from services.template_service import template_service
+from services.render_executor import render_executor
+from services.job_service import job_service
+from services.llm_service import llm_service
 from config import settings
 
 @asynccontextmanager
@@ -11,9 +16,25 @@ async def lifespan(app: FastAPI):
     """Lifecycle manager for the FastAPI application"""
     # Startup
     print(f"Starting {settings.APP_NAME} v{settings.VERSION}")
+    if settings.TEMPLATE_WARMUP_ON_STARTUP:
+        warmup = await asyncio.to_thread(template_service.warm_templates)
+        print(f"Warmed {warmup['warmed']} templates in {warmup['elapsed_ms']:.0f} ms")
+    manifest = await asyncio.to_thread(lambda: template_service.manifest)
+    print(f"Indexed {len(manifest.entries)} template files")
+    watch_stop = asyncio.Event()
+    watch_task = None
+    if settings.TEMPLATE_WATCH_ENABLED:
+        watch_task = asyncio.create_task(template_service.watch_templates(watch_stop))
+    job_service.start()
     yield
     # Shutdown
     print("Shutting down application")
+    watch_stop.set()
+    if watch_task is not None:
+        await watch_task
+    await job_service.stop()
+    render_executor.shutdown()
+    await llm_service.aclose()
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -9,11 +9,21 @@ from .uml import (
     VisibilityType,
     RelationType,
 )
-from .chat import ChatMessage, ChatResponse, JSONGenerationRequest
+from .diagram_index import DiagramIndex
+from .chat import (
+    ChatMessage,
+    ChatResponse,
+    JSONGenerationRequest,
+    ChatSessionMessage,
+    ChatTurnItem,
+    ChatSessionResponse,
+)
 from .scaffolding import ScaffoldingRequest, ScaffoldingResponse
 from .validation import (
     ValidationRequest,
     ValidationResponse,
+    IncrementalValidationRequest,
+    IncrementalValidationResponse,
     ValidationErrorItem,
     LexerToken,
     LexerResponse,
@@ -27,13 +37,19 @@ __all__ = [
     "Method",
     "VisibilityType",
     "RelationType",
+    "DiagramIndex",
     "ChatMessage",
     "ChatResponse",
     "JSONGenerationRequest",
+    "ChatSessionMessage",
+    "ChatTurnItem",
+    "ChatSessionResponse",
     "ScaffoldingRequest",
     "ScaffoldingResponse",
     "ValidationRequest",
     "ValidationResponse",
+    "IncrementalValidationRequest",
+    "IncrementalValidationResponse",
     "ValidationErrorItem",
     "LexerToken",
     "LexerResponse",
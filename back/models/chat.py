@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 
 
 class ChatMessage(BaseModel):
@@ -41,8 +41,19 @@ class JSONGenerationRequest(BaseModel):
         default=None,
         description="Optional context for the generation"
     )
+    use_cache: bool = Field(
+        default=True,
+        description="Reuse the cached response of an identical request (false forces a fresh call)",
+        alias="useCache"
+    )
+    validate_spec: bool = Field(
+        default=False,
+        description="Validate the generated JSON as a DSL spec against docs/schema.json",
+        alias="validateSpec"
+    )
     
     class Config:
+        populate_by_name = True
         json_schema_extra = {
             "example": {
                 "prompt": "Generate a JSON schema for a user profile",
@@ -51,3 +62,45 @@ class JSONGenerationRequest(BaseModel):
                 }
             }
         }
+
+
+class ChatSessionMessage(BaseModel):
+    """Message sent within a chat session"""
+    message: str = Field(..., description="The user's message")
+    context: Optional[Dict[str, Any]] = Field(
+        default=None,
+        description="Optional context for this message only (not stored in the history)"
+    )
+    
+    class Config:
+        json_schema_extra = {
+            "example": {
+                "message": "Add an Invoice model linked to Customer",
+                "context": {
+                    "language": "python"
+                }
+            }
+        }
+
+
+class ChatTurnItem(BaseModel):
+    """One stored message of a chat session"""
+    role: str
+    content: str
+    tokens: int
+    created_at: str
+
+
+class ChatSessionResponse(BaseModel):
+    """State of a chat session"""
+    session_id: str = Field(..., alias="sessionId")
+    created_at: str = Field(..., alias="createdAt")
+    turn_count: int = Field(..., alias="turnCount")
+    compacted_turns: int = Field(..., alias="compactedTurns")
+    history_tokens: int = Field(..., alias="historyTokens")
+    summary_tokens: int = Field(..., alias="summaryTokens")
+    summary: List[str]
+    turns: List[ChatTurnItem]
+    
+    class Config:
+        populate_by_name = True
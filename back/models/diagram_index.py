@@ -0,0 +1,62 @@
+from typing import Dict, List, Optional
+
+from .uml import UMLDiagram, Class, Relation, RelationType
+
+
+class DiagramIndex:
+    """Precomputed lookups over a UML diagram
+
+    Built in a single pass over the classes and relations so that per-class
+    queries during generation are O(1) instead of a scan of every relation.
+    """
+
+    def __init__(self, diagram: UMLDiagram):
+        self.diagram = diagram
+        self.classes_by_id: Dict[str, Class] = {cls.id: cls for cls in diagram.classes}
+        self.outgoing: Dict[str, List[Relation]] = {}
+        self.incoming: Dict[str, List[Relation]] = {}
+        self.parents: Dict[str, List[str]] = {}
+        self.children: Dict[str, List[str]] = {}
+        self._by_class: Dict[str, List[Relation]] = {}
+
+        for relation in diagram.relations:
+            self.outgoing.setdefault(relation.sourceId, []).append(relation)
+            self.incoming.setdefault(relation.targetId, []).append(relation)
+
+            # Keep diagram order and list self-relations only once
+            self._by_class.setdefault(relation.sourceId, []).append(relation)
+            if relation.targetId != relation.sourceId:
+                self._by_class.setdefault(relation.targetId, []).append(relation)
+
+            # In UML the inheritance arrow goes from the child to its parent
+            if relation.type == RelationType.INHERITANCE:
+                self.parents.setdefault(relation.sourceId, []).append(relation.targetId)
+                self.children.setdefault(relation.targetId, []).append(relation.sourceId)
+
+    @classmethod
+    def from_diagram(cls, diagram: UMLDiagram) -> "DiagramIndex":
+        return cls(diagram)
+
+    def get_class(self, class_id: str) -> Optional[Class]:
+        """Return the class with the given id, if any"""
+        return self.classes_by_id.get(class_id)
+
+    def relations_for(self, class_id: str) -> List[Relation]:
+        """Return every relation whose source or target is the class"""
+        return self._by_class.get(class_id, [])
+
+    def outgoing_relations(self, class_id: str) -> List[Relation]:
+        """Return the relations starting from the class"""
+        return self.outgoing.get(class_id, [])
+
+    def incoming_relations(self, class_id: str) -> List[Relation]:
+        """Return the relations pointing to the class"""
+        return self.incoming.get(class_id, [])
+
+    def parents_of(self, class_id: str) -> List[Class]:
+        """Return the classes the class inherits from"""
+        return [self.classes_by_id[pid] for pid in self.parents.get(class_id, []) if pid in self.classes_by_id]
+
+    def children_of(self, class_id: str) -> List[Class]:
+        """Return the classes inheriting from the class"""
+        return [self.classes_by_id[cid] for cid in self.children.get(class_id, []) if cid in self.classes_by_id]
@@ -22,6 +22,20 @@ class ScaffoldingRequest(BaseModel):
         description="Use LLM for enhanced code generation",
         alias="useLlm"
     )
+    use_llm_cache: bool = Field(
+        default=True,
+        description="Reuse the cached LLM insights of an identical diagram (false forces a fresh call)",
+        alias="useLlmCache"
+    )
+    incremental: bool = Field(
+        default=False,
+        description="Sync a stable project directory and only rewrite changed files"
+    )
+    project_name: Optional[str] = Field(
+        default=None,
+        description="Name of the stable output directory used in incremental mode",
+        alias="projectName"
+    )
     
     class Config:
         populate_by_name = True
@@ -61,6 +75,10 @@ class ScaffoldingResponse(BaseModel):
     output_path: str = Field(..., alias="outputPath")
     files: List[str]
     llm_insights: Optional[str] = Field(default=None, alias="llmInsights")
+    manifest: Optional[Dict[str, List[str]]] = Field(
+        default=None,
+        description="Added/changed/removed/unchanged files in incremental mode"
+    )
     timestamp: str
     
     class Config:
@@ -0,0 +1,68 @@
+from dataclasses import dataclass
+from typing import Any, Mapping, Optional, Tuple
+
+from services.type_system import PropertyType
+
+
+@dataclass(frozen=True, slots=True)
+class PropertyIR:
+    """A model property with its names and types resolved"""
+
+    name: str                 # as written in the spec (camelCase)
+    pascal: str               # C# member; references end with "Id"
+    camel: str                # TypeScript / JSON member
+    label: str
+    label_key: str            # translation key, MODEL_PROPERTY
+    type: PropertyType
+    required: bool
+    nullable: bool
+    optional: bool            # not required, or nullable
+    unique: bool
+    max_length: Optional[int]
+    min_value: Optional[float]
+    max_value: Optional[float]
+    default: Any
+    csharp_default: Optional[str]
+    options: Tuple[str, ...]
+    is_email: bool
+
+
+@dataclass(frozen=True, slots=True)
+class RelationIR:
+    """A navigation from one model to another"""
+
+    kind: str                 # "reference" (many-to-one) or "collection"
+    target: str
+    navigation: str           # property name on the owning model
+    foreign_key: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class ModelIR:
+    """A model with its naming variants and derived flags"""
+
+    name: str                 # PascalCase
+    plural: str
+    camel: str
+    kebab: str
+    upper_snake: str
+    properties: Tuple[PropertyIR, ...]
+    relations: Tuple[RelationIR, ...]
+    has_relationships: bool   # at least one reference (foreign key)
+    has_collections: bool
+    is_archivable: bool
+    foreign_keys: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class ApplicationIR:
+    """Normalised application specification shared by the generators"""
+
+    project_name: str
+    namespace: str
+    description: str
+    config: Mapping[str, Any]
+    models: Tuple[ModelIR, ...]
+
+    def model_names(self) -> Tuple[str, ...]:
+        return tuple(model.name for model in self.models)
@@ -5,6 +5,21 @@ from typing import Any, Dict, List, Optional
 class ValidationRequest(BaseModel):
     """Request payload for DSL validation and lexing."""
     spec: Dict[str, Any]
+    document_id: Optional[str] = Field(default=None, alias="documentId")
+
+    class Config:
+        populate_by_name = True
+
+
+class IncrementalValidationRequest(BaseModel):
+    """Request payload for validating an edit of a known document."""
+    spec: Dict[str, Any]
+    document_id: str = Field(..., alias="documentId")
+    changed: Optional[List[str]] = Field(default=None, description="Changed JSON pointers")
+    patch: Optional[List[Dict[str, Any]]] = Field(default=None, description="Applied JSON Patch operations")
+
+    class Config:
+        populate_by_name = True
 
 
 class ValidationErrorItem(BaseModel):
@@ -24,6 +39,12 @@ class ValidationResponse(BaseModel):
         populate_by_name = True
 
 
+class IncrementalValidationResponse(ValidationResponse):
+    """Response payload for incremental DSL validation."""
+    incremental: bool
+    revalidated: List[str]
+
+
 class LexerToken(BaseModel):
     """Single token produced by the lexer."""
     type: str
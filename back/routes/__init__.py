@@ -1,5 +1,5 @@
 """API routes initialization"""
 
-from . import chat, scaffolding, validation
+from . import application, chat, scaffolding, validation
 
-__all__ = ["chat", "scaffolding", "validation"]
+__all__ = ["application", "chat", "scaffolding", "validation"]
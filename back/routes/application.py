@@ -1,13 +1,21 @@
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Optional
 
 from services.application_generator_service import application_generator_service
+from services.archive_service import archive_service
 
 router = APIRouter()
 
 
 @router.post("/generate")
-async def generate_application(spec: Dict[str, Any]):
+async def generate_application(
+    spec: Dict[str, Any],
+    archive: Optional[str] = Query(
+        default=None,
+        description="Stream the application as an archive (zip or tar.gz) instead of writing it to disk"
+    )
+):
     """
     Generate a complete application from JSON specification
     
@@ -17,11 +25,25 @@ async def generate_application(spec: Dict[str, Any]):
     
     Args:
         spec: Application specification dictionary
+        archive: Optional archive format; the generated files are then
+            streamed back instead of being written under OUTPUT_DIR
         
     Returns:
-        Generation results with paths and file list
+        Generation results with paths and file list, or the archive stream
     """
     try:
+        if archive:
+            archive_format = archive_service.normalize_format(archive)
+            rendered = await application_generator_service.render_application(spec)
+            name = rendered["project_name"]
+            return StreamingResponse(
+                archive_service.stream(rendered["files"], archive_format, root=name),
+                media_type=archive_service.media_type(archive_format),
+                headers={
+                    "Content-Disposition": f'attachment; filename="{archive_service.filename(name, archive_format)}"'
+                }
+            )
+        
         result = await application_generator_service.generate_application(spec)
         return result
     
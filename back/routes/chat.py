@@ -1,10 +1,19 @@
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import StreamingResponse
 from typing import AsyncIterator
+from contextlib import aclosing
 import json
 
-from models.chat import ChatMessage, ChatResponse, JSONGenerationRequest
-from services.llm_service import llm_service
+from models.chat import (
+    ChatMessage,
+    ChatResponse,
+    JSONGenerationRequest,
+    ChatSessionMessage,
+    ChatSessionResponse,
+)
+from services.llm_service import llm_service, LLMBusyError
+from services.chat_session_service import chat_session_service, ChatSession
+from services.stream_coalescer import coalesce_stream
 
 router = APIRouter()
 
@@ -14,7 +23,10 @@ async def chat_stream(message: ChatMessage):
     """
     Chat endpoint with Server-Sent Events (SSE)
     
-    Streams the LLM response in real-time using SSE format.
+    Streams the LLM response in real-time using SSE format. Small chunks
+    are coalesced by size or time window (SSE_COALESCE_*), idle connections
+    receive heartbeat comments, and the upstream LLM stream is cancelled as
+    soon as the client disconnects.
     
     Args:
         message: ChatMessage with user's message and optional context
@@ -22,17 +34,25 @@ async def chat_stream(message: ChatMessage):
     Returns:
         StreamingResponse with SSE events
     """
+    return _sse_response(llm_service.chat_stream(message.message, message.context))
+
+
+def _sse_response(chunks: AsyncIterator[str]) -> StreamingResponse:
+    """Wrap an LLM chunk stream into a coalesced SSE response"""
     
     async def generate() -> AsyncIterator[str]:
         """Generate SSE events from LLM stream"""
         try:
-            async for chunk in llm_service.chat_stream(
-                message.message, 
-                message.context
-            ):
-                # Format as SSE event
-                # SSE format: "data: {content}\n\n"
-                yield f"data: {json.dumps({'content': chunk})}\n\n"
+            events = coalesce_stream(chunks)
+            async with aclosing(events):
+                async for chunk in events:
+                    if chunk is None:
+                        # Comment line: keeps idle connections and proxies alive
+                        yield ": heartbeat\n\n"
+                        continue
+                    # Format as SSE event
+                    # SSE format: "data: {content}\n\n"
+                    yield f"data: {json.dumps({'content': chunk})}\n\n"
             
             # Send done event
             yield f"data: {json.dumps({'done': True})}\n\n"
@@ -78,6 +98,8 @@ async def chat_message(message: ChatMessage):
         
         return ChatResponse(response="".join(response_chunks))
     
+    except LLMBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -98,10 +120,14 @@ async def generate_json(request: JSONGenerationRequest):
     try:
         result = await llm_service.generate_json(
             request.prompt,
-            request.context
+            request.context,
+            use_cache=request.use_cache,
+            validate_spec=request.validate_spec
         )
         return result
     
+    except LLMBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
     except ValueError as e:
         raise HTTPException(
             status_code=422,
@@ -109,3 +135,87 @@ async def generate_json(request: JSONGenerationRequest):
         )
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.post("/sessions", response_model=ChatSessionResponse, status_code=201)
+async def create_session():
+    """
+    Open a multi-turn chat session
+    
+    The conversation is stored server-side: clients only send the new
+    message, and older turns are summarised to keep prompts bounded.
+    
+    Returns:
+        The new, empty session
+    """
+    return ChatSessionResponse(**chat_session_service.create().to_dict())
+
+
+@router.get("/sessions/{session_id}", response_model=ChatSessionResponse)
+async def get_session(session_id: str):
+    """
+    Get the stored history of a chat session
+    
+    Args:
+        session_id: Id returned by POST /sessions
+        
+    Returns:
+        The kept turns, the summary of older ones and token counts
+    """
+    return ChatSessionResponse(**_get_session(session_id).to_dict())
+
+
+@router.delete("/sessions/{session_id}", status_code=204)
+async def delete_session(session_id: str):
+    """
+    Delete a chat session
+    
+    Args:
+        session_id: Id returned by POST /sessions
+    """
+    if not chat_session_service.delete(session_id):
+        raise HTTPException(status_code=404, detail=f"Chat session not found: {session_id}")
+
+
+@router.post("/sessions/{session_id}/stream")
+async def session_stream(session_id: str, message: ChatSessionMessage):
+    """
+    Send a message within a session and stream the answer (SSE)
+    
+    The prompt carries the session history within its token budget; the
+    user message and the answer are stored once the answer is complete, so
+    a failed or interrupted stream leaves the history unchanged.
+    
+    Args:
+        session_id: Id returned by POST /sessions
+        message: ChatSessionMessage with the user's message
+        
+    Returns:
+        StreamingResponse with SSE events
+    """
+    session = _get_session(session_id)
+    history = session.prompt_history()
+    
+    return _sse_response(_record_exchange(
+        session,
+        message.message,
+        llm_service.chat_stream(message.message, message.context, history=history)
+    ))
+
+
+def _get_session(session_id: str) -> ChatSession:
+    session = chat_session_service.get(session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail=f"Chat session not found: {session_id}")
+    return session
+
+
+async def _record_exchange(session: ChatSession, message: str, chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Pass the chunks through and store the message and its answer once the stream completes"""
+    received = []
+    async with aclosing(chunks):
+        async for chunk in chunks:
+            received.append(chunk)
+            yield chunk
+    session.append("user", message)
+    session.append("assistant", "".join(received))
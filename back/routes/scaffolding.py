@@ -1,14 +1,23 @@
-from fastapi import APIRouter, HTTPException, BackgroundTasks
-from typing import Dict, Any
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Optional
 
 from models.scaffolding import ScaffoldingRequest, ScaffoldingResponse
 from services.scaffolding_service import scaffolding_service
+from services.job_service import job_service, JobQueueFullError
+from services.archive_service import archive_service
 
 router = APIRouter()
 
 
 @router.post("/generate", response_model=ScaffoldingResponse)
-async def generate_scaffolding(request: ScaffoldingRequest):
+async def generate_scaffolding(
+    request: ScaffoldingRequest,
+    archive: Optional[str] = Query(
+        default=None,
+        description="Stream the project as an archive (zip or tar.gz) instead of writing it to disk"
+    )
+):
     """
     Generate code scaffolding from UML diagram
     
@@ -17,16 +26,40 @@ async def generate_scaffolding(request: ScaffoldingRequest):
     
     Args:
         request: ScaffoldingRequest with UML data and generation options
+        archive: Optional archive format; the generated files are then
+            streamed back instead of being written under OUTPUT_DIR
         
     Returns:
-        ScaffoldingResponse with generation results and file paths
+        ScaffoldingResponse with generation results and file paths, or the
+        archive stream
     """
     try:
+        if archive:
+            archive_format = archive_service.normalize_format(archive)
+            files, _ = await scaffolding_service.render_from_uml(
+                uml_data=request.uml_data,
+                language=request.language,
+                framework=request.framework,
+                use_llm=request.use_llm,
+                use_llm_cache=request.use_llm_cache
+            )
+            name = scaffolding_service.project_dir_name(request.language, request.project_name)
+            return StreamingResponse(
+                archive_service.stream(files, archive_format, root=name),
+                media_type=archive_service.media_type(archive_format),
+                headers={
+                    "Content-Disposition": f'attachment; filename="{archive_service.filename(name, archive_format)}"'
+                }
+            )
+        
         result = await scaffolding_service.generate_from_uml(
             uml_data=request.uml_data,
             language=request.language,
             framework=request.framework,
-            use_llm=request.use_llm
+            use_llm=request.use_llm,
+            use_llm_cache=request.use_llm_cache,
+            incremental=request.incremental,
+            project_name=request.project_name
         )
         
         return ScaffoldingResponse(**result)
@@ -43,48 +76,89 @@ async def generate_scaffolding(request: ScaffoldingRequest):
         )
 
 
-@router.post("/generate-async")
-async def generate_scaffolding_async(
-    request: ScaffoldingRequest,
-    background_tasks: BackgroundTasks
-):
+@router.post("/generate-async", status_code=202)
+async def generate_scaffolding_async(request: ScaffoldingRequest):
     """
     Generate code scaffolding asynchronously
     
-    Starts the generation process in the background and returns immediately.
-    Useful for large diagrams that may take longer to process.
+    Queues the generation on the bounded job queue and returns immediately.
+    Useful for large diagrams that may take longer to process. Poll
+    GET /jobs/{job_id} for the status and result.
     
     Args:
         request: ScaffoldingRequest with UML data and generation options
-        background_tasks: FastAPI background tasks manager
         
     Returns:
         Status message with job ID
     """
-    import uuid
-    job_id = str(uuid.uuid4())
-    
-    async def generate_task():
-        """Background task for code generation"""
-        try:
-            await scaffolding_service.generate_from_uml(
+    try:
+        job = job_service.submit(
+            lambda: scaffolding_service.generate_from_uml(
                 uml_data=request.uml_data,
                 language=request.language,
                 framework=request.framework,
-                use_llm=request.use_llm
-            )
-        except Exception as e:
-            print(f"Background generation failed for job {job_id}: {e}")
-    
-    background_tasks.add_task(generate_task)
+                use_llm=request.use_llm,
+                use_llm_cache=request.use_llm_cache,
+                incremental=request.incremental,
+                project_name=request.project_name
+            ),
+            kind="scaffolding"
+        )
+    except JobQueueFullError as e:
+        raise HTTPException(status_code=429, detail=str(e), headers={"Retry-After": "5"})
     
     return {
         "status": "accepted",
-        "job_id": job_id,
-        "message": "Code generation started in background"
+        "job_id": job.id,
+        "message": "Code generation queued"
     }
 
 
+@router.get("/jobs/metrics")
+async def get_job_metrics():
+    """
+    Get background job metrics
+    
+    Returns:
+        Queue depth, job counters and queue-wait/run-time latencies
+    """
+    return job_service.metrics()
+
+
+@router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """
+    Get the status and result of a background job
+    
+    Args:
+        job_id: Id returned by /generate-async
+        
+    Returns:
+        Job status, with the generation result once it succeeded
+    """
+    job = job_service.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job.to_dict()
+
+
+@router.delete("/jobs/{job_id}")
+async def cancel_job(job_id: str):
+    """
+    Cancel a queued or running background job
+    
+    Args:
+        job_id: Id returned by /generate-async
+        
+    Returns:
+        Job status after the cancellation request
+    """
+    job = job_service.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+    return job.to_dict()
+
+
 @router.get("/languages")
 async def get_supported_languages():
     """
@@ -141,3 +215,16 @@ async def list_available_templates(language: str = "python"):
             status_code=500,
             detail=f"Failed to list templates: {str(e)}"
         )
+
+
+@router.get("/templates/metrics")
+async def get_template_metrics():
+    """
+    Get template service metrics
+    
+    Returns:
+        Indexed template files and naming conversion cache hits/misses
+    """
+    from services.template_service import template_service
+    
+    return template_service.metrics()
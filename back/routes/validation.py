@@ -1,16 +1,28 @@
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Iterable, Iterator
+import json
 
-from models.validation import ValidationRequest, ValidationResponse, LexerResponse
+from models.validation import (
+    ValidationRequest,
+    ValidationResponse,
+    IncrementalValidationRequest,
+    IncrementalValidationResponse,
+    LexerResponse,
+)
 from services.dsl_validation_service import dsl_validation_service
 
 router = APIRouter()
 
+# Number of tokens serialised into each chunk of the NDJSON stream
+LEX_STREAM_BATCH_SIZE = 256
+
 
 @router.post("/validate", response_model=ValidationResponse)
 async def validate_spec(request: ValidationRequest):
     """Validate a DSL JSON specification against the schema."""
     try:
-        result = dsl_validation_service.validate_spec(request.spec)
+        result = dsl_validation_service.validate_spec(request.spec, document_id=request.document_id)
         return ValidationResponse(**result)
     except FileNotFoundError as error:
         raise HTTPException(status_code=500, detail=str(error))
@@ -18,11 +30,59 @@ async def validate_spec(request: ValidationRequest):
         raise HTTPException(status_code=500, detail=f"Validation failed: {error}")
 
 
+@router.post("/validate-incremental", response_model=IncrementalValidationResponse)
+async def validate_incremental(request: IncrementalValidationRequest):
+    """Re-validate only the parts of a known document touched by an edit."""
+    try:
+        result = dsl_validation_service.validate_incremental(
+            request.spec,
+            request.document_id,
+            changed=request.changed,
+            patch=request.patch,
+        )
+        return IncrementalValidationResponse(**result)
+    except FileNotFoundError as error:
+        raise HTTPException(status_code=500, detail=str(error))
+    except Exception as error:
+        raise HTTPException(status_code=500, detail=f"Validation failed: {error}")
+
+
+@router.get("/cache-stats")
+async def validation_cache_stats():
+    """Return hit/miss counters of the validation result cache."""
+    return dsl_validation_service.cache_stats()
+
+
 @router.post("/lex", response_model=LexerResponse)
-async def lex_spec(request: ValidationRequest):
-    """Lex a DSL JSON specification into tokens."""
+async def lex_spec(request: ValidationRequest, stream: bool = False):
+    """Lex a DSL JSON specification into tokens.
+
+    With ``?stream=true`` the tokens are sent as NDJSON (one token per line)
+    while they are produced, so large specs are never held as a token list.
+    """
+    if stream:
+        return StreamingResponse(
+            _ndjson_lines(dsl_validation_service.iter_tokens(request.spec)),
+            media_type="application/x-ndjson",
+        )
+
     try:
         tokens = dsl_validation_service.lex_spec(request.spec)
         return LexerResponse(tokens=tokens, count=len(tokens))
     except Exception as error:
         raise HTTPException(status_code=500, detail=f"Lexing failed: {error}")
+
+
+def _ndjson_lines(tokens: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Serialise tokens as NDJSON, grouping lines to limit the number of writes."""
+    batch = []
+    try:
+        for token in tokens:
+            batch.append(json.dumps(token, default=str))
+            if len(batch) >= LEX_STREAM_BATCH_SIZE:
+                yield "\n".join(batch) + "\n"
+                batch = []
+    except Exception as error:
+        batch.append(json.dumps({"type": "error", "path": "", "value": f"Lexing failed: {error}"}))
+    if batch:
+        yield "\n".join(batch) + "\n"
@@ -0,0 +1,852 @@
+from typing import Any, Dict, List, Optional, Tuple
+from pathlib import Path
+from datetime import datetime
+import asyncio
+import json
+import logging
+import os
+import re
+import time
+
+from services.template_service import TemplateService, template_service
+from services.render_executor import render_executor
+from services.output_writer import FileContent, output_writer
+from services.spec_normalizer import spec_normalizer
+from services.render_cache import RenderCache, create_render_cache, hash_value, make_render_key
+from services.naming import camel_name, kebab_name, upper_snake_name
+from models.spec_ir import ApplicationIR, ModelIR, PropertyIR
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Template trees rendered into the generated application, and the directory
+# each one is written to
+TEMPLATE_TREES = {
+    "back": "backend",
+    "front": "frontend",
+}
+
+# Templates rendered once per model: (template, output path, context kind)
+MODEL_TEMPLATES: Tuple[Tuple[str, str, str], ...] = (
+    ("back/Models/Model.cs.jinja", "backend/Models/{name}.cs", "model"),
+    ("back/DTOs/DTO.cs.jinja", "backend/DTOs/{name}DTO.cs", "dto"),
+    ("back/Controllers/Controller.cs.jinja", "backend/Controllers/{plural}Controller.cs", "controller"),
+    (
+        "front/src/app/pages/entity/entity-list/entity-list.component.ts.jinja",
+        "frontend/src/app/pages/{kebab}-list/{kebab}-list.component.ts",
+        "entity",
+    ),
+    (
+        "front/src/app/pages/entity/entity-list/entity-list.component.html.jinja",
+        "frontend/src/app/pages/{kebab}-list/{kebab}-list.component.html",
+        "entity",
+    ),
+    (
+        "front/src/app/pages/entity/entity-details/entity-details.component.ts.jinja",
+        "frontend/src/app/pages/{kebab}-details/{kebab}-details.component.ts",
+        "entity",
+    ),
+    (
+        "front/src/app/pages/entity/entity-details/entity-details.component.html.jinja",
+        "frontend/src/app/pages/{kebab}-details/{kebab}-details.component.html",
+        "entity",
+    ),
+)
+
+# Stylesheets referenced by the entity pages; the template tree has none
+MODEL_STYLESHEETS = (
+    "frontend/src/app/pages/{kebab}-list/{kebab}-list.component.scss",
+    "frontend/src/app/pages/{kebab}-details/{kebab}-details.component.scss",
+)
+
+_PROJECT_NAME_PLACEHOLDER = re.compile(r"\{\{\s*project_name\s*\}\}")
+
+
+class TemplateTreeManifest:
+    """Classification of the template trees into templates and verbatim assets
+
+    Output paths keep their ``{{ project_name }}`` placeholders so one scan
+    serves every project. The modification times of the scanned directories
+    are kept: adding, removing or renaming a file changes them, which is how
+    a stale manifest is detected without listing the files again.
+    """
+
+    __slots__ = ("templates", "assets", "directories")
+
+    def __init__(
+        self,
+        templates: List[Tuple[str, str]],
+        assets: List[Tuple[Path, str]],
+        directories: Dict[str, int]
+    ):
+        # (template name, output path) of the templates rendered once per project
+        self.templates = templates
+        # (source file, output path) of the files copied verbatim
+        self.assets = assets
+        # scanned directory -> st_mtime_ns
+        self.directories = directories
+
+    @classmethod
+    def scan(cls, service: TemplateService) -> "TemplateTreeManifest":
+        model_templates = {template for template, _, _ in MODEL_TEMPLATES}
+        templates: List[Tuple[str, str]] = []
+        assets: List[Tuple[Path, str]] = []
+        directories: Dict[str, int] = {}
+
+        root = service.templates_dir
+        for tree, output_root in TEMPLATE_TREES.items():
+            for dirpath, _, filenames in os.walk(root / tree):
+                directories[dirpath] = os.stat(dirpath).st_mtime_ns
+                relative_dir = Path(dirpath).relative_to(root).as_posix()
+                for filename in filenames:
+                    name = f"{relative_dir}/{filename}"
+                    if name in model_templates:
+                        continue
+                    target = output_root + name[len(tree):]
+                    if service.is_template(filename):
+                        templates.append((name, os.path.splitext(target)[0]))
+                    else:
+                        assets.append((Path(dirpath) / filename, target))
+        return cls(templates, assets, directories)
+
+    def is_fresh(self) -> bool:
+        try:
+            return all(os.stat(path).st_mtime_ns == mtime for path, mtime in self.directories.items())
+        except OSError:
+            return False
+
+    @staticmethod
+    def resolve(target: str, project_name: str) -> str:
+        """Output path of a file for a project"""
+        if "{" not in target:
+            return target
+        return _PROJECT_NAME_PLACEHOLDER.sub(lambda _: project_name, target)
+
+
+class ApplicationGeneratorService:
+    """Generates a full-stack application from an application specification
+
+    Generation is a staged pipeline:
+
+    1. normalise the spec (DSL or legacy format) into an immutable
+       ApplicationIR (see services/spec_normalizer.py)
+    2. build the template contexts of every model
+    3. render the per-model templates and the project templates of the
+       ``back`` and ``front`` trees concurrently
+    4. write the whole file set in one batch, copying the verbatim assets
+       (see TemplateTreeManifest and settings.ASSET_COPY_MODE) without
+       loading them
+    """
+
+    def __init__(self, render_cache: Optional[RenderCache] = None):
+        self.template_service = template_service
+        self.render_executor = render_executor
+        self._render_cache = render_cache
+        self.output_writer = output_writer
+        self.output_dir = settings.OUTPUT_DIR
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._tree_manifest: Optional[TemplateTreeManifest] = None
+
+    @property
+    def render_cache(self) -> RenderCache:
+        """Render cache, opened on first use so that importing the service creates no file"""
+        if self._render_cache is None:
+            self._render_cache = create_render_cache()
+        return self._render_cache
+
+    async def generate_application(self, spec: Dict[str, Any], incremental: bool = False) -> Dict[str, Any]:
+        """
+        Generate an application and write it under OUTPUT_DIR
+
+        Args:
+            spec: Application specification (DSL format with ``config`` and
+                ``models``, or the legacy format of models/app_spec.py)
+            incremental: Sync a stable project directory instead of writing
+                a new timestamped one
+
+        Returns:
+            Dictionary with the output path, generated files and the
+            duration of each stage in milliseconds
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        rendered = await self.render_application(spec)
+        files = rendered["files"]
+        timings = rendered["timings"]
+
+        start = time.perf_counter()
+        manifest = None
+        if incremental:
+            output_path = self.output_dir / rendered["project_name"]
+            manifest = await asyncio.to_thread(self.output_writer.write_incremental, output_path, files)
+        else:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = self.output_dir / f"{rendered['project_name']}_{timestamp}"
+            await asyncio.to_thread(self.output_writer.write_snapshot, output_path, files)
+        timings["write_ms"] = (time.perf_counter() - start) * 1000
+        timings["total_ms"] = sum(value for key, value in timings.items() if key != "total_ms")
+
+        logger.info(
+            f"Generated application {rendered['project_name']} ({len(files)} files) "
+            f"in {timings['total_ms']:.1f} ms"
+        )
+
+        return {
+            "success": True,
+            "project_name": rendered["project_name"],
+            "output_path": str(output_path),
+            "files": sorted(files),
+            "files_generated": len(files),
+            "models": list(rendered["models"]),
+            "manifest": manifest,
+            "render_cache": rendered["render_cache"],
+            "timings": timings,
+            "timestamp": datetime.now().isoformat(),
+        }
+
+    async def render_application(
+        self,
+        spec: Dict[str, Any],
+        document_id: Optional[str] = None,
+        changed: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Render an application without writing it
+
+        Args:
+            spec: Application specification
+            document_id: Validate incrementally against the previous
+                version of this document (watch mode)
+            changed: JSON pointers changed since that previous version
+
+        Returns:
+            Dictionary with the project name, the model names, the
+            normalised application, the mapping of relative file path to
+            content, the number of cached and rendered templates and the
+            stage timings
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        timings: Dict[str, float] = {}
+
+        start = time.perf_counter()
+        app = self.normalize_spec(spec, document_id, changed)
+        timings["normalize_ms"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        contexts = [self.build_model_contexts(model, app) for model in app.models]
+        global_context = {
+            "project_name": app.project_name,
+            "namespace": app.namespace,
+            "description": app.description,
+            "models": [context["model"]["model"] for context in contexts],
+        }
+        timings["context_ms"] = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        files, cache_stats = await self._render_files(app, contexts, global_context)
+        timings["render_ms"] = (time.perf_counter() - start) * 1000
+
+        return {
+            "project_name": app.project_name,
+            "models": app.model_names(),
+            "application": app,
+            "files": files,
+            "render_cache": cache_stats,
+            "timings": timings,
+        }
+
+    async def _render_files(
+        self,
+        app: ApplicationIR,
+        contexts: List[Dict[str, Dict[str, Any]]],
+        global_context: Dict[str, Any]
+    ) -> Tuple[Dict[str, FileContent], Dict[str, int]]:
+        """
+        Render every template and collect every asset of the template trees
+
+        Rendered files are looked up in the render cache first, keyed by the
+        template (with everything it includes), the context it is rendered
+        with and the application configuration: when one model changes,
+        only its files and the project files that read the model list are
+        rendered again.
+
+        Returns:
+            The files, and the number of cached and rendered templates
+        """
+        manifest = self.tree_manifest()
+        project_name = app.project_name
+
+        jobs: List[Tuple[str, Dict[str, Any]]] = []
+        targets: List[str] = []
+        for template_name, target in manifest.templates:
+            jobs.append((template_name, global_context))
+            targets.append(manifest.resolve(target, project_name))
+
+        files: Dict[str, FileContent] = {}
+        for context in contexts:
+            names = context["names"]
+            for template_name, target, kind in MODEL_TEMPLATES:
+                jobs.append((template_name, context[kind]))
+                targets.append(target.format(**names))
+            for stylesheet in MODEL_STYLESHEETS:
+                files[stylesheet.format(**names)] = ""
+
+        keys = self._render_keys(app, contexts, global_context, manifest.templates)
+        cached = await asyncio.to_thread(self.render_cache.get_many, keys)
+        pending = [i for i, key in enumerate(keys) if key not in cached]
+
+        assets = [(source, manifest.resolve(target, project_name)) for source, target in manifest.assets]
+        if settings.ASSET_COPY_MODE == "read":
+            results, asset_contents = await asyncio.gather(
+                self.render_executor.render_many([jobs[i] for i in pending]),
+                asyncio.to_thread(self._read_assets, assets),
+            )
+        else:
+            # Assets stay on disk: the writer copies them kernel-side and the
+            # archive reads them one at a time
+            results = await self.render_executor.render_many([jobs[i] for i in pending])
+            asset_contents = {target: source for source, target in assets}
+
+        rendered: Dict[str, str] = {}
+        for i, result in zip(pending, results):
+            if isinstance(result, BaseException):
+                raise RuntimeError(f"Failed to render {jobs[i][0]} into {targets[i]}: {result}") from result
+            rendered[keys[i]] = result
+        if rendered:
+            await asyncio.to_thread(self.render_cache.set_many, rendered)
+
+        for target, key in zip(targets, keys):
+            files[target] = cached[key] if key in cached else rendered[key]
+        files.update(asset_contents)
+        return files, {"cached": len(keys) - len(pending), "rendered": len(pending)}
+
+    def _render_keys(
+        self,
+        app: ApplicationIR,
+        contexts: List[Dict[str, Dict[str, Any]]],
+        global_context: Dict[str, Any],
+        project_templates: List[Tuple[str, str]]
+    ) -> List[str]:
+        """
+        Cache keys of the render jobs, in the order built by _render_files
+
+        Project templates are keyed on the global variables they actually
+        read (most only read ``project_name``); each per-model context is
+        hashed once and shared by the templates rendered with it.
+        """
+        manifest = self.template_service.manifest
+        config_digest = hash_value({
+            "project_name": app.project_name,
+            "namespace": app.namespace,
+            "description": app.description,
+            "config": dict(app.config),
+        })
+
+        model_digests = [
+            {kind: hash_value(context[kind]) for kind in ("model", "dto", "controller", "entity")}
+            for context in contexts
+        ]
+        global_digests = {
+            key: hash_value(value) for key, value in global_context.items() if key != "models"
+        }
+        global_digests["models"] = hash_value([digests["model"] for digests in model_digests])
+
+        keys = []
+        for template_name, _ in project_templates:
+            template_digest = manifest.digest(template_name)
+            variables = sorted(self.template_service.template_variables(template_name) & global_digests.keys())
+            context_digest = hash_value({variable: global_digests[variable] for variable in variables})
+            keys.append(make_render_key(template_digest, context_digest, config_digest))
+
+        template_digests = {template: manifest.digest(template) for template, _, _ in MODEL_TEMPLATES}
+        for digests in model_digests:
+            for template_name, _, kind in MODEL_TEMPLATES:
+                keys.append(make_render_key(template_digests[template_name], digests[kind], config_digest))
+        return keys
+
+    def tree_manifest(self) -> "TemplateTreeManifest":
+        """
+        Return the classification of the template trees, rescanning them only
+        when a directory changed since the last scan
+        """
+        manifest = self._tree_manifest
+        if manifest is None or not manifest.is_fresh():
+            manifest = TemplateTreeManifest.scan(self.template_service)
+            self._tree_manifest = manifest
+            logger.info(
+                f"Classified template trees: {len(manifest.templates)} templates, "
+                f"{len(manifest.assets)} verbatim assets"
+            )
+        return manifest
+
+    @staticmethod
+    def _read_assets(assets: List[Tuple[Path, str]]) -> Dict[str, bytes]:
+        return {target: source.read_bytes() for source, target in assets}
+
+    def normalize_spec(
+        self,
+        spec: Dict[str, Any],
+        document_id: Optional[str] = None,
+        changed: Optional[List[str]] = None
+    ) -> ApplicationIR:
+        """
+        Validate a specification and build its intermediate representation
+
+        Args:
+            spec: Application specification
+            document_id: Validate incrementally against the previous
+                version of this document
+            changed: JSON pointers changed since that previous version
+
+        Returns:
+            The normalised application (see services/spec_normalizer.py)
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        return spec_normalizer.normalize(spec, document_id, changed)
+
+    def build_model_contexts(self, model: ModelIR, app: ApplicationIR) -> Dict[str, Dict[str, Any]]:
+        """
+        Build the template contexts of a normalised model
+
+        Args:
+            model: Normalised model
+            app: Normalised application
+
+        Returns:
+            Contexts keyed by kind (model, dto, controller, entity), plus the
+            names used in output paths
+        """
+        namespace = app.namespace
+        names = {"name": model.name, "plural": model.plural, "kebab": model.kebab}
+        return {
+            "names": names,
+            "model": {"namespace": f"{namespace}.Models", "model": self._model_context(model)},
+            "dto": {"namespace": namespace, "dto": self._dto_context(model)},
+            "controller": {"namespace": namespace, "controller": self._controller_context(model)},
+            "entity": {"entity": self._entity_context(model)},
+        }
+
+    @staticmethod
+    def _csharp_property(prop: PropertyIR, **extra: Any) -> Dict[str, Any]:
+        context = {
+            "name": prop.pascal,
+            "type": prop.type.csharp_type,
+            "is_required": not prop.optional,
+            "is_nullable": prop.optional,
+            "default_value": prop.csharp_default,
+        }
+        context.update(extra)
+        return context
+
+    def _model_context(self, model: ModelIR) -> Dict[str, Any]:
+        name = model.name
+        properties = [
+            self._csharp_property(prop, column_type=prop.type.column_type)
+            for prop in model.properties
+        ]
+        properties.append({"name": "ArchivedAt", "type": "DateTimeOffset", "is_nullable": True})
+
+        for relation in model.relations:
+            if relation.kind == "reference":
+                properties.append({"name": relation.foreign_key, "type": "Guid", "is_required": True})
+                properties.append({
+                    "name": relation.navigation,
+                    "type": relation.target,
+                    "is_nullable": True,
+                    "foreign_key": relation.foreign_key,
+                })
+            else:
+                properties.append({
+                    "name": relation.navigation,
+                    "type": f"List<{relation.target}>",
+                    "default_value": "new()",
+                })
+
+        # Models live in <namespace>.Models, which does not import the DTOs
+        input_type = f"DTOs.{name}Input"
+        assignments = [f"{prop.pascal} = input.{prop.pascal};" for prop in model.properties]
+        assignments.append("ArchivedAt = input.ArchivedAt;")
+
+        return {
+            "name": name,
+            "is_archivable": model.is_archivable,
+            "has_relationships": model.has_relationships,
+            "has_collections": model.has_collections,
+            "has_address": False,
+            "has_type": False,
+            "has_status": False,
+            "constructors": [
+                {"parameters": [], "body": []},
+                {"parameters": [{"type": input_type, "name": "input"}], "body": ["Update(input);"]},
+            ],
+            "properties": properties,
+            "methods": [
+                {
+                    "return_type": "void",
+                    "name": "Update",
+                    "parameters": [{"type": input_type, "name": "input"}],
+                    "body": assignments,
+                },
+            ],
+            "related_classes": [],
+        }
+
+    def _dto_context(self, model: ModelIR) -> Dict[str, Any]:
+        name = model.name
+        props = model.properties
+        input_properties = [
+            {"name": "Id", "type": "Guid", "is_nullable": True},
+            {"name": "ArchivedAt", "type": "DateTimeOffset", "is_nullable": True},
+        ]
+        for prop in props:
+            input_properties.append(self._csharp_property(
+                prop,
+                default_value=None if not prop.optional else prop.csharp_default,
+                email_address=prop.is_email,
+                max_length=prop.max_length,
+            ))
+
+        output_properties = [
+            {"name": "Id", "type": "Guid", "is_required": True},
+            {"name": "CreatedAt", "type": "DateTimeOffset", "is_required": True},
+            {"name": "ArchivedAt", "type": "DateTimeOffset", "is_nullable": True},
+        ]
+        output_properties.extend(
+            self._csharp_property(prop, default_value=None) for prop in props
+        )
+        body = [f"{prop['name']} = entity.{prop['name']};" for prop in output_properties]
+
+        display = next((prop for prop in props if prop.type.dsl_type == "text"), None)
+        label = f"entity.{display.pascal}" if display else "entity.Id.ToString()"
+        if display is not None and display.optional:
+            label += " ?? string.Empty"
+
+        def output_class(class_name: str) -> Dict[str, Any]:
+            return {
+                "name": class_name,
+                "constructors": [{
+                    "sets_required_members": True,
+                    "parameters": [{"type": name, "name": "entity"}],
+                    "body": body,
+                }],
+                "properties": output_properties,
+            }
+
+        return {
+            "has_json_property": False,
+            "uses_models": True,
+            "input_class": {"name": f"{name}Input", "properties": input_properties},
+            "output_class": output_class(f"{name}Output"),
+            "list_output_class": output_class(f"{name}ListOutput"),
+            "autocomplete_output_class": {
+                "name": f"{name}AutocompleteOutput",
+                "constructors": [{
+                    "sets_required_members": True,
+                    "parameters": [{"type": name, "name": "entity"}],
+                    "body": ["Id = entity.Id;", f"Label = {label};"],
+                }],
+                "properties": [
+                    {"name": "Id", "type": "Guid", "is_required": True},
+                    {"name": "Label", "type": "string", "is_required": True},
+                ],
+            },
+            "additional_classes": [],
+        }
+
+    def _controller_context(self, model: ModelIR) -> Dict[str, Any]:
+        name, plural = model.name, model.plural
+        entity_set = f"dbContext.Set<{name}>()"
+        searchable = [prop for prop in model.properties if prop.type.csharp_type == "string"]
+        search_filter = " || ".join(
+            f'EF.Functions.ILike(e.{prop.pascal}{"!" if prop.optional else ""}, $"%{{search}}%")'
+            for prop in searchable
+        )
+        not_found = f'return NotFound("{model.upper_snake}_NOT_FOUND");'
+        find = f"var entity = await {entity_set}.FirstOrDefaultAsync(e => e.Id == id);"
+
+        datagrid_body = [f"var query = {entity_set}.AsNoTracking();"]
+        if search_filter:
+            datagrid_body += [
+                "if (options.Search?.RawValue != null)",
+                "{",
+                "    var search = options.Search.RawValue.ToLower();",
+                f"    query = query.Where(e => {search_filter});",
+                "}",
+            ]
+        datagrid_body += [
+            "query = options.ApplyAndGetCount(query, out var count);",
+            "var entities = await query.ToListAsync();",
+            f"return Ok(new ListResponse<{name}ListOutput>(entities.Select(e => new {name}ListOutput(e)), count));",
+        ]
+
+        id_parameter = {"from_route": True, "type": "Guid", "name": "id"}
+        input_parameter = {"from_body": True, "type": f"{name}Input", "name": "input"}
+
+        endpoints = [
+            {
+                "http_method": "Post",
+                "name": f"{name} list",
+                "description": f"Filtered and paginated list of {plural}",
+                "route": "datagrid",
+                "return_type": f"ListResponse<{name}ListOutput>",
+                "method_name": f"Get{plural}List",
+                "method_parameters": [{"type": f"ODataQueryOptions<{name}>", "name": "options"}],
+                "body": datagrid_body,
+            },
+            {
+                "http_method": "Get",
+                "name": f"{name} autocomplete",
+                "description": f"{plural} matching a search, for autocomplete fields",
+                "route": "autocomplete",
+                "return_type": f"List<{name}AutocompleteOutput>",
+                "method_name": f"Autocomplete{plural}",
+                "method_parameters": [
+                    {"from_query": True, "type": "string", "is_nullable": True, "name": "search"},
+                ],
+                "body": [
+                    f"var query = {entity_set}.AsNoTracking().Where(e => e.ArchivedAt == null);",
+                    *(
+                        [f"if (!string.IsNullOrWhiteSpace(search))",
+                         f"    query = query.Where(e => {search_filter});"]
+                        if search_filter else []
+                    ),
+                    "var entities = await query.Take(20).ToListAsync();",
+                    f"return Ok(entities.Select(e => new {name}AutocompleteOutput(e)).ToList());",
+                ],
+            },
+            {
+                "http_method": "Get",
+                "name": f"{name} details",
+                "description": f"Details of a {name}",
+                "route": "{id:guid}",
+                "return_type": f"{name}Output",
+                "method_name": f"Get{name}",
+                "method_parameters": [id_parameter],
+                "body": [find, "if (entity == null)", f"    {not_found}", "", f"return Ok(new {name}Output(entity));"],
+            },
+            {
+                "http_method": "Post",
+                "name": f"Create {name}",
+                "description": f"Create a {name}",
+                "return_type": "Guid",
+                "method_name": f"Create{name}",
+                "method_parameters": [input_parameter],
+                "validate_model_state": True,
+                "body": [
+                    f"var entity = new {name}(input);",
+                    f"{entity_set}.Add(entity);",
+                    "await dbContext.SaveChangesAsync();",
+                    "return Ok(entity.Id);",
+                ],
+            },
+            {
+                "http_method": "Put",
+                "name": f"Update {name}",
+                "description": f"Update a {name}",
+                "route": "{id:guid}",
+                "return_type": f"{name}Output",
+                "method_name": f"Update{name}",
+                "method_parameters": [id_parameter, input_parameter],
+                "validate_model_state": True,
+                "body": [
+                    find, "if (entity == null)", f"    {not_found}", "",
+                    "entity.Update(input);",
+                    "await dbContext.SaveChangesAsync();",
+                    f"return Ok(new {name}Output(entity));",
+                ],
+            },
+            {
+                "http_method": "Delete",
+                "name": f"Archive {name}",
+                "description": f"Archive a {name}",
+                "route": "{id:guid}",
+                "return_type": "Guid",
+                "method_name": f"Archive{name}",
+                "method_parameters": [id_parameter],
+                "body": [
+                    find, "if (entity == null)", f"    {not_found}", "",
+                    "entity.ArchivedAt = DateTime.UtcNow;",
+                    "await dbContext.SaveChangesAsync();",
+                    "return NoContent();",
+                ],
+            },
+            {
+                "http_method": "Get",
+                "name": f"Restore {name}",
+                "description": f"Restore an archived {name}",
+                "route": "restaure/{id:guid}",
+                "return_type": "Guid",
+                "method_name": f"Restore{name}",
+                "method_parameters": [id_parameter],
+                "body": [
+                    find, "if (entity == null)", f"    {not_found}", "",
+                    "entity.ArchivedAt = null;",
+                    "await dbContext.SaveChangesAsync();",
+                    "return NoContent();",
+                ],
+            },
+        ]
+
+        return {
+            "name": f"{plural}Controller",
+            "description": f"Management of {plural}",
+            "uses_odata": True,
+            "uses_identity": False,
+            "additional_usings": ["api.Models", "api.Utils"],
+            "authorize": True,
+            "dependencies": [{"type": "ApplicationDbContext", "name": "dbContext"}],
+            "endpoints": endpoints,
+            "private_methods": [],
+        }
+
+    def _entity_context(self, model: ModelIR) -> Dict[str, Any]:
+        name, plural, props = model.name, model.plural, model.properties
+        api_prefix = camel_name(plural)
+        name_upper = model.upper_snake
+
+        columns = []
+        for prop in props:
+            prop_type = prop.type
+            if prop_type.dsl_type in ("textarea", "address"):
+                continue
+            columns.append({
+                "translation_key": prop.label_key,
+                "sort": "asc" if not columns else None,
+                "sort_index": 0,
+                "field": prop.camel,
+                "filter": bool(prop_type.filter_options),
+                "filter_type": "text",
+                "filter_options": list(prop_type.filter_options),
+                "max_conditions": 1,
+                "type": prop_type.grid_column,
+                "sortable": True,
+                "cell_renderer": "boolean" if prop_type.dsl_type == "boolean" else None,
+            })
+
+        fields = []
+        static_options = []
+        imported = set()
+        for prop in props:
+            fields.append(self._field_context(prop, imported, static_options))
+
+        display = next((prop for prop in props if prop.type.dsl_type == "text"), None)
+        return {
+            "name_pascal": name,
+            "name_camel": model.camel,
+            "name_kebab": model.kebab,
+            "name_upper": name_upper,
+            "input_model": f"{name}Input",
+            "output_model": f"{name}Output",
+            "list_response_model": f"{name}ListOutputListResponse",
+            "service_name": f"{plural}Service",
+            "route_name": kebab_name(plural),
+            "datagrid_name": f"{model.kebab}-list",
+            "search_placeholder_key": f"SEARCH_{upper_snake_name(plural)}",
+            "new_button_key": f"NEW_{name_upper}",
+            "api_method_datagrid": f"{api_prefix}DatagridPost",
+            "api_method_get": f"{api_prefix}IdGet",
+            "api_method_create": f"{api_prefix}Post",
+            "api_method_update": f"{api_prefix}IdPut",
+            "api_method_delete": f"{api_prefix}IdDelete",
+            "api_method_restore": f"{api_prefix}RestaureIdGet",
+            "has_filters": False,
+            "filters": [],
+            "has_color_cell": False,
+            "columns": columns,
+            "fields": fields,
+            "grid_cols": 2,
+            "has_options": False,
+            "options": [],
+            "static_options": static_options,
+            "display_field": display.camel if display else "id",
+            "has_dynamic_logic": False,
+            "has_mapping_functions": False,
+            "has_related_sections": False,
+        }
+
+    @staticmethod
+    def _field_context(
+        prop: PropertyIR,
+        imported: set,
+        static_options: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Form field of a property on the details page"""
+        prop_type = prop.type
+        dsl_type = prop_type.dsl_type
+        camel = prop.camel
+        control = f"{camel}Control"
+        component, folder = prop_type.component, prop_type.component_folder
+
+        validators = []
+        if not prop.optional:
+            validators.append("Validators.required")
+        if prop.max_length:
+            validators.append(f"Validators.maxLength({prop.max_length})")
+        if prop.min_value is not None:
+            validators.append(f"Validators.min({prop.min_value})")
+        if prop.max_value is not None:
+            validators.append(f"Validators.max({prop.max_value})")
+        if prop.is_email:
+            validators.append("Validators.email")
+
+        type_params = f"{prop_type.ts_type} | null"
+        default_value = "null"
+        if prop.default is not None:
+            default_value = json.dumps(prop.default)
+        patch_value = f"entity.{camel}"
+        input_value = f"this.{control}.value"
+        options = None
+
+        if prop_type.has_choices:
+            options = f"{camel}Options"
+            static_options.append({
+                "name": options,
+                "type": "Option<string>",
+                "choices": json.dumps(
+                    [{"id": value, "name": value, "value": value} for value in prop.options]
+                ),
+            })
+            if dsl_type == "select":
+                type_params = "Option<string> | null"
+                default_value = "null"
+                patch_value = f"this.{options}().find((option) => option.value === entity.{camel}) ?? null"
+                input_value = f"this.{control}.value?.value ?? null"
+            else:
+                type_params = "Option<string>[]"
+                default_value = "[]"
+                patch_value = f"this.{options}().filter((option) => entity.{camel}?.includes(option.value))"
+                input_value = f"this.{control}.value?.map((option) => option.value) ?? []"
+        elif prop_type.is_date:
+            patch_value = f"entity.{camel} ? new Date(entity.{camel}) : null"
+            input_value = f"this.{control}.value?.toISOString() ?? null"
+
+        field = {
+            "label": prop.label,
+            "label_key": prop.label_key,
+            "control_name": control,
+            "form_name": camel,
+            "input_field": camel,
+            "type_params": type_params,
+            "default_value": default_value,
+            "validators": f"[{', '.join(validators)}]",
+            "component_tag": prop_type.component_tag,
+            "options": options,
+            "patch_value": patch_value,
+            "input_value": input_value,
+            "col_span": 2 if dsl_type in ("textarea", "address") else None,
+            "type": "email" if prop.is_email else None,
+        }
+        # Each component is imported once per page
+        if component not in imported:
+            imported.add(component)
+            field.update(component=component, component_path=folder, component_file=f"{folder}.component")
+        return field
+
+
+# Singleton instance
+application_generator_service = ApplicationGeneratorService()
@@ -0,0 +1,175 @@
+from typing import Dict, Iterable, Iterator, List, Mapping, Tuple, Union
+from datetime import datetime
+from pathlib import Path
+import io
+import logging
+import tarfile
+import time
+import zipfile
+
+logger = logging.getLogger(__name__)
+
+# A Path is read when its entry is packed, so only one file is in memory at a time
+FileContent = Union[str, bytes, Path]
+ArchiveEntries = Union[Mapping[str, FileContent], Iterable[Tuple[str, FileContent]]]
+
+# Archive format -> (media type, file extension)
+ARCHIVE_FORMATS: Dict[str, Tuple[str, str]] = {
+    "zip": ("application/zip", "zip"),
+    "tar.gz": ("application/gzip", "tar.gz"),
+}
+FORMAT_ALIASES = {"tgz": "tar.gz", "targz": "tar.gz"}
+
+
+class _ChunkBuffer:
+    """Write-only sink collecting archive bytes until they are drained
+
+    Deliberately has no ``tell``/``seek`` so that zipfile and tarfile use
+    their streaming (non-seekable) code paths.
+    """
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        if data:
+            self._chunks.append(bytes(data))
+            self.size += len(data)
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        self.size = 0
+        return data
+
+
+class ArchiveService:
+    """Service for streaming generated files as zip or tar.gz archives"""
+
+    def __init__(self, chunk_size: int = 64 * 1024):
+        """
+        Initialize the archive service
+
+        Args:
+            chunk_size: Approximate size of the chunks yielded to the client
+        """
+        self.chunk_size = chunk_size
+
+    def normalize_format(self, archive_format: str) -> str:
+        """
+        Validate an archive format name
+
+        Args:
+            archive_format: Requested format ("zip", "tar.gz" or "tgz")
+
+        Returns:
+            Canonical format name
+
+        Raises:
+            ValueError: If the format is not supported
+        """
+        name = FORMAT_ALIASES.get(archive_format.lower(), archive_format.lower())
+        if name not in ARCHIVE_FORMATS:
+            raise ValueError(
+                f"Unsupported archive format: {archive_format} "
+                f"(expected one of {', '.join(ARCHIVE_FORMATS)})"
+            )
+        return name
+
+    def media_type(self, archive_format: str) -> str:
+        return ARCHIVE_FORMATS[self.normalize_format(archive_format)][0]
+
+    def filename(self, name: str, archive_format: str) -> str:
+        return f"{name}.{ARCHIVE_FORMATS[self.normalize_format(archive_format)][1]}"
+
+    def stream(
+        self,
+        files: ArchiveEntries,
+        archive_format: str = "zip",
+        root: str = ""
+    ) -> Iterator[bytes]:
+        """
+        Build an archive incrementally from in-memory file contents
+
+        Entries are compressed one at a time and the archive bytes are
+        yielded as soon as roughly ``chunk_size`` bytes are available, so
+        the first bytes reach the client before the last file is packed and
+        the whole archive is never held in memory.
+
+        Args:
+            files: Mapping or iterable of (relative path, content)
+            archive_format: "zip" or "tar.gz"
+            root: Optional directory prefixed to every entry
+
+        Returns:
+            Iterator over the archive bytes
+        """
+        archive_format = self.normalize_format(archive_format)
+        entries = files.items() if isinstance(files, Mapping) else files
+        if root:
+            prefix = root.strip("/") + "/"
+            entries = ((prefix + path, content) for path, content in entries)
+
+        if archive_format == "zip":
+            return self._iter_zip(entries)
+        return self._iter_tar_gz(entries)
+
+    def _iter_zip(self, entries: Iterable[Tuple[str, FileContent]]) -> Iterator[bytes]:
+        buffer = _ChunkBuffer()
+        date_time = datetime.now().timetuple()[:6]
+        count = 0
+
+        with zipfile.ZipFile(buffer, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+            for path, content in entries:
+                data = self._to_bytes(content)
+                info = zipfile.ZipInfo(path, date_time=date_time)
+                info.compress_type = zipfile.ZIP_DEFLATED
+                info.external_attr = 0o644 << 16
+
+                with archive.open(info, "w") as entry:
+                    for offset in range(0, len(data), self.chunk_size):
+                        entry.write(data[offset:offset + self.chunk_size])
+                        if buffer.size >= self.chunk_size:
+                            yield buffer.drain()
+                count += 1
+                if buffer.size >= self.chunk_size:
+                    yield buffer.drain()
+
+        # Remaining entries and the central directory
+        yield buffer.drain()
+        logger.info(f"Streamed zip archive with {count} files")
+
+    def _iter_tar_gz(self, entries: Iterable[Tuple[str, FileContent]]) -> Iterator[bytes]:
+        buffer = _ChunkBuffer()
+        mtime = time.time()
+        count = 0
+
+        with tarfile.open(fileobj=buffer, mode="w|gz") as archive:
+            for path, content in entries:
+                data = self._to_bytes(content)
+                info = tarfile.TarInfo(path)
+                info.size = len(data)
+                info.mtime = mtime
+                info.mode = 0o644
+                archive.addfile(info, io.BytesIO(data))
+                count += 1
+                if buffer.size >= self.chunk_size:
+                    yield buffer.drain()
+
+        yield buffer.drain()
+        logger.info(f"Streamed tar.gz archive with {count} files")
+
+    @staticmethod
+    def _to_bytes(content: FileContent) -> bytes:
+        if isinstance(content, Path):
+            return content.read_bytes()
+        return content if isinstance(content, bytes) else content.encode("utf-8")
+
+
+# Singleton instance
+archive_service = ArchiveService()
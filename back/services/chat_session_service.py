@@ -0,0 +1,174 @@
+from typing import Any, Deque, Dict, Optional
+from collections import OrderedDict, deque
+from datetime import datetime
+import logging
+import time
+import uuid
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# Characters kept from a turn when it is folded into the summary
+SUMMARY_EXCERPT_CHARS = 200
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate (~4 characters per token for English and code)"""
+    return (len(text) + 3) // 4
+
+
+class ChatTurn:
+    """One message of a conversation"""
+
+    __slots__ = ("role", "content", "tokens", "created_at")
+
+    def __init__(self, role: str, content: str):
+        self.role = role
+        self.content = content
+        self.tokens = estimate_tokens(content)
+        self.created_at = datetime.now()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "role": self.role,
+            "content": self.content,
+            "tokens": self.tokens,
+            "created_at": self.created_at.isoformat(),
+        }
+
+
+class ChatSession:
+    """A conversation whose prompt history stays within a token budget
+
+    Recent turns are kept verbatim while they fit in ``history_budget``;
+    older ones are folded into a summary of truncated excerpts, itself
+    capped at ``summary_budget`` tokens (oldest excerpts dropped first).
+    """
+
+    def __init__(self, session_id: str, history_budget: int, summary_budget: int):
+        self.id = session_id
+        self.history_budget = history_budget
+        self.summary_budget = summary_budget
+        self.turns: Deque[ChatTurn] = deque()
+        self.summary: Deque[str] = deque()
+        self.history_tokens = 0
+        self.summary_tokens = 0
+        self.turn_count = 0
+        self.compacted_turns = 0
+        self.created_at = datetime.now()
+        self.last_used = time.monotonic()
+
+    def append(self, role: str, content: str) -> ChatTurn:
+        """Add a turn and compact the history back under the budget"""
+        turn = ChatTurn(role, content)
+        self.turns.append(turn)
+        self.history_tokens += turn.tokens
+        self.turn_count += 1
+        self._compact()
+        return turn
+
+    def _compact(self) -> None:
+        # The newest turn is always kept, even when it alone exceeds the budget
+        while self.history_tokens > self.history_budget and len(self.turns) > 1:
+            turn = self.turns.popleft()
+            self.history_tokens -= turn.tokens
+            self.compacted_turns += 1
+
+            excerpt = " ".join(turn.content.split())
+            if len(excerpt) > SUMMARY_EXCERPT_CHARS:
+                excerpt = excerpt[:SUMMARY_EXCERPT_CHARS].rstrip() + "..."
+            line = f"- {turn.role}: {excerpt}"
+            self.summary.append(line)
+            self.summary_tokens += estimate_tokens(line)
+
+        while self.summary_tokens > self.summary_budget and self.summary:
+            self.summary_tokens -= estimate_tokens(self.summary.popleft())
+
+    def prompt_history(self) -> str:
+        """Render the summary and the kept turns for the prompt"""
+        parts = []
+        if self.summary:
+            parts.append("Summary of earlier conversation:\n" + "\n".join(self.summary))
+        if self.turns:
+            parts.append("Conversation:\n" + "\n".join(f"{turn.role}: {turn.content}" for turn in self.turns))
+        return "\n\n".join(parts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "session_id": self.id,
+            "created_at": self.created_at.isoformat(),
+            "turn_count": self.turn_count,
+            "compacted_turns": self.compacted_turns,
+            "history_tokens": self.history_tokens,
+            "summary_tokens": self.summary_tokens,
+            "summary": list(self.summary),
+            "turns": [turn.to_dict() for turn in self.turns],
+        }
+
+
+class ChatSessionService:
+    """In-memory store of chat sessions, bounded in count and idle time"""
+
+    def __init__(
+        self,
+        max_sessions: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        history_budget: Optional[int] = None,
+        summary_budget: Optional[int] = None
+    ):
+        """
+        Initialize the session store
+
+        Args:
+            max_sessions: Sessions kept before the least recently used is dropped
+                (defaults to settings.CHAT_SESSION_MAX)
+            ttl_seconds: Idle time after which a session expires
+                (defaults to settings.CHAT_SESSION_TTL_SECONDS, 0 = never)
+            history_budget: Token budget of the verbatim history
+                (defaults to settings.CHAT_HISTORY_TOKEN_BUDGET)
+            summary_budget: Token budget of the summary of older turns
+                (defaults to settings.CHAT_SUMMARY_TOKEN_BUDGET)
+        """
+        self.max_sessions = settings.CHAT_SESSION_MAX if max_sessions is None else max_sessions
+        self.ttl_seconds = settings.CHAT_SESSION_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.history_budget = settings.CHAT_HISTORY_TOKEN_BUDGET if history_budget is None else history_budget
+        self.summary_budget = settings.CHAT_SUMMARY_TOKEN_BUDGET if summary_budget is None else summary_budget
+        self.sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+
+    def create(self) -> ChatSession:
+        """Open a new session"""
+        self._expire()
+        session = ChatSession(str(uuid.uuid4()), self.history_budget, self.summary_budget)
+        self.sessions[session.id] = session
+        while len(self.sessions) > self.max_sessions:
+            dropped, _ = self.sessions.popitem(last=False)
+            logger.info(f"Dropped least recently used chat session {dropped}")
+        return session
+
+    def get(self, session_id: str) -> Optional[ChatSession]:
+        """Return a live session and mark it as used"""
+        self._expire()
+        session = self.sessions.get(session_id)
+        if session is not None:
+            session.last_used = time.monotonic()
+            self.sessions.move_to_end(session_id)
+        return session
+
+    def delete(self, session_id: str) -> bool:
+        return self.sessions.pop(session_id, None) is not None
+
+    def _expire(self) -> None:
+        if not self.ttl_seconds:
+            return
+        cutoff = time.monotonic() - self.ttl_seconds
+        # Sessions are ordered by last use, so expired ones are at the front
+        while self.sessions:
+            session_id, session = next(iter(self.sessions.items()))
+            if session.last_used >= cutoff:
+                break
+            del self.sessions[session_id]
+
+
+# Singleton instance
+chat_session_service = ChatSessionService()
@@ -0,0 +1,266 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Tuple
+import numbers
+import re
+
+# (absolute path segments, message, keyword) of a validation error
+CompiledError = Tuple[Tuple[Any, ...], str, str]
+CompiledValidator = Callable[[Any], List[CompiledError]]
+
+# Python expression checking a JSON Schema (draft 7) type on ``instance``
+_TYPE_CHECKS = {
+    "object": "isinstance(instance, dict)",
+    "array": "isinstance(instance, list)",
+    "string": "isinstance(instance, str)",
+    "boolean": "isinstance(instance, bool)",
+    "null": "instance is None",
+    "number": "(isinstance(instance, _Number) and not isinstance(instance, bool))",
+    "integer": (
+        "((isinstance(instance, int) and not isinstance(instance, bool))"
+        " or (isinstance(instance, float) and instance.is_integer()))"
+    ),
+}
+
+# Keywords without any effect on validation
+_ANNOTATIONS = frozenset({"$schema", "$comment", "title", "description", "default", "examples", "definitions"})
+
+
+def _json_equal(one: Any, two: Any) -> bool:
+    """JSON equality as used by ``enum``: booleans never equal numbers, at any depth"""
+    if isinstance(one, bool) or isinstance(two, bool):
+        return type(one) is type(two) and one == two
+    if isinstance(one, dict):
+        return (
+            isinstance(two, dict)
+            and one.keys() == two.keys()
+            and all(_json_equal(value, two[key]) for key, value in one.items())
+        )
+    if isinstance(one, list):
+        return (
+            isinstance(two, list)
+            and len(one) == len(two)
+            and all(_json_equal(a, b) for a, b in zip(one, two))
+        )
+    if isinstance(two, (dict, list)):
+        return False
+    return one == two
+
+
+class SchemaCompileError(ValueError):
+    """Raised when a schema uses keywords the compiler does not support."""
+
+
+class SchemaCompiler:
+    """Compile a JSON Schema (draft 7 subset) into specialised Python code.
+
+    Every schema node becomes one Python function with its keywords unrolled
+    in schema order, so the generated validator reports the same errors, in
+    the same order and with the same messages, as ``jsonschema.Draft7Validator``
+    without interpreting the schema on each call. Schemas using keywords
+    outside the supported subset raise ``SchemaCompileError``.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        self.schema = schema
+        self._functions: List[str] = []
+        self._constants: Dict[str, Any] = {}
+
+    def compile(self) -> CompiledValidator:
+        """Return a function mapping an instance to its validation errors."""
+        source = self.generate_source()
+        namespace: Dict[str, Any] = {"_Number": numbers.Number, "_equal": _json_equal, **self._constants}
+        exec(compile(source, "<compiled-schema>", "exec"), namespace)
+        validate = namespace["validate"]
+        validate.source = source
+        return validate
+
+    def generate_source(self) -> str:
+        """Return the Python source of the validator module."""
+        self._functions = []
+        self._constants = {}
+        root = self._compile_node(self.schema)
+        self._functions.append(
+            "def validate(instance):\n"
+            "    errors = []\n"
+            f"    {root}(instance, [], errors)\n"
+            "    return errors\n"
+        )
+        return "\n\n".join(self._functions)
+
+    def _constant(self, value: Any) -> str:
+        name = f"_C{len(self._constants)}"
+        self._constants[name] = value
+        return name
+
+    def _compile_node(self, schema: Any) -> str:
+        """Emit the function validating one schema node and return its name."""
+        name = f"_node{len(self._functions)}"
+        self._functions.append("")  # reserve the slot so child names stay unique
+
+        if schema is True or schema == {}:
+            self._functions[int(name[5:])] = f"def {name}(instance, path, errors):\n    return\n"
+            return name
+        if not isinstance(schema, dict):
+            raise SchemaCompileError(f"Unsupported schema node: {schema!r}")
+
+        body: List[str] = []
+        for keyword, value in schema.items():
+            if keyword in _ANNOTATIONS:
+                continue
+            emit = getattr(self, f"_emit_{keyword}", None)
+            if emit is None:
+                raise SchemaCompileError(f"Unsupported keyword: {keyword}")
+            body.extend(emit(value, schema))
+
+        lines = [f"def {name}(instance, path, errors):"]
+        lines.extend(f"    {line}" for line in body or ["return"])
+        self._functions[int(name[5:])] = "\n".join(lines) + "\n"
+        return name
+
+    @staticmethod
+    def _error(message: str, keyword: str) -> str:
+        return f"errors.append((tuple(path), {message}, {keyword!r}))"
+
+    def _emit_type(self, value: Any, schema: Dict[str, Any]) -> List[str]:
+        types = [value] if isinstance(value, str) else list(value)
+        unknown = [t for t in types if t not in _TYPE_CHECKS]
+        if unknown:
+            raise SchemaCompileError(f"Unsupported type: {unknown}")
+        check = " or ".join(_TYPE_CHECKS[t] for t in types)
+        reprs = self._escape(", ".join(repr(t) for t in types))
+        return [
+            f"if not ({check}):",
+            "    " + self._error(f'f"{{instance!r}} is not of type {reprs}"', "type"),
+        ]
+
+    def _emit_required(self, value: List[str], schema: Dict[str, Any]) -> List[str]:
+        return [
+            "if isinstance(instance, dict):",
+            f"    for name in {tuple(value)!r}:",
+            "        if name not in instance:",
+            "            " + self._error('f"{name!r} is a required property"', "required"),
+        ]
+
+    def _emit_properties(self, value: Dict[str, Any], schema: Dict[str, Any]) -> List[str]:
+        lines = ["if isinstance(instance, dict):"]
+        for key, subschema in value.items():
+            child = self._compile_node(subschema)
+            lines.extend([
+                f"    if {key!r} in instance:",
+                f"        path.append({key!r})",
+                f"        {child}(instance[{key!r}], path, errors)",
+                "        path.pop()",
+            ])
+        return lines if value else []
+
+    def _emit_additionalProperties(self, value: Any, schema: Dict[str, Any]) -> List[str]:
+        if "patternProperties" in schema:
+            raise SchemaCompileError("Unsupported keyword: patternProperties")
+        if value is True or value == {}:
+            return []
+        known = self._constant(frozenset(schema.get("properties", {})))
+        lines = [
+            "if isinstance(instance, dict):",
+            f"    extras = [key for key in instance if key not in {known}]",
+        ]
+        if value is False:
+            return lines + [
+                "    if extras:",
+                "        extras = sorted(set(extras), key=str)",
+                "        verb = 'was' if len(extras) == 1 else 'were'",
+                "        joined = ', '.join(repr(extra) for extra in extras)",
+                "        " + self._error(
+                    'f"Additional properties are not allowed ({joined} {verb} unexpected)"',
+                    "additionalProperties",
+                ),
+            ]
+        child = self._compile_node(value)
+        return lines + [
+            "    for key in extras:",
+            "        path.append(key)",
+            f"        {child}(instance[key], path, errors)",
+            "        path.pop()",
+        ]
+
+    def _emit_items(self, value: Any, schema: Dict[str, Any]) -> List[str]:
+        if not isinstance(value, dict) and value is not True:
+            raise SchemaCompileError("Unsupported keyword: items (tuple or false form)")
+        child = self._compile_node(value)
+        return [
+            "if isinstance(instance, list):",
+            "    for index, item in enumerate(instance):",
+            "        path.append(index)",
+            f"        {child}(item, path, errors)",
+            "        path.pop()",
+        ]
+
+    def _emit_enum(self, value: List[Any], schema: Dict[str, Any]) -> List[str]:
+        if all(isinstance(each, str) for each in value):
+            options = self._constant(frozenset(value))
+            check = f"not (isinstance(instance, str) and instance in {options})"
+        else:
+            # Mixed enums keep jsonschema's bool/int distinction
+            options = self._constant(tuple(value))
+            check = f"all(not _equal(each, instance) for each in {options})"
+        return [
+            f"if {check}:",
+            "    " + self._error(f'f"{{instance!r}} is not one of {self._escape(repr(value))}"', "enum"),
+        ]
+
+    def _emit_pattern(self, value: str, schema: Dict[str, Any]) -> List[str]:
+        regex = self._constant(re.compile(value))
+        return [
+            f"if isinstance(instance, str) and not {regex}.search(instance):",
+            "    " + self._error(f'f"{{instance!r}} does not match {self._escape(repr(value))}"', "pattern"),
+        ]
+
+    def _emit_minLength(self, value: int, schema: Dict[str, Any]) -> List[str]:
+        message = "should be non-empty" if value == 1 else "is too short"
+        return [
+            f"if isinstance(instance, str) and len(instance) < {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} {message}"', "minLength"),
+        ]
+
+    def _emit_maxLength(self, value: int, schema: Dict[str, Any]) -> List[str]:
+        message = "is expected to be empty" if value == 0 else "is too long"
+        return [
+            f"if isinstance(instance, str) and len(instance) > {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} {message}"', "maxLength"),
+        ]
+
+    def _emit_minItems(self, value: int, schema: Dict[str, Any]) -> List[str]:
+        message = "should be non-empty" if value == 1 else "is too short"
+        return [
+            f"if isinstance(instance, list) and len(instance) < {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} {message}"', "minItems"),
+        ]
+
+    def _emit_maxItems(self, value: int, schema: Dict[str, Any]) -> List[str]:
+        message = "is expected to be empty" if value == 0 else "is too long"
+        return [
+            f"if isinstance(instance, list) and len(instance) > {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} {message}"', "maxItems"),
+        ]
+
+    def _emit_minimum(self, value: Any, schema: Dict[str, Any]) -> List[str]:
+        return [
+            f"if {_TYPE_CHECKS['number']} and instance < {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} is less than the minimum of {value!r}"', "minimum"),
+        ]
+
+    def _emit_maximum(self, value: Any, schema: Dict[str, Any]) -> List[str]:
+        return [
+            f"if {_TYPE_CHECKS['number']} and instance > {value!r}:",
+            "    " + self._error(f'f"{{instance!r}} is greater than the maximum of {value!r}"', "maximum"),
+        ]
+
+    @staticmethod
+    def _escape(text: str) -> str:
+        """Escape text for inclusion in a generated f-string literal."""
+        return text.replace("\\", "\\\\").replace('"', '\\"').replace("{", "{{").replace("}", "}}")
+
+
+def compile_schema(schema: Dict[str, Any]) -> CompiledValidator:
+    """Compile a schema into a validator function; see ``SchemaCompiler``."""
+    return SchemaCompiler(schema).compile()
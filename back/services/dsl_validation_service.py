@@ -1,23 +1,64 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from collections import OrderedDict
 from pathlib import Path
+import hashlib
 import json
 import logging
 
 from jsonschema import Draft7Validator
 
+from config import settings
+from services.compiled_validator import CompiledValidator, SchemaCompileError, compile_schema
+
 logger = logging.getLogger(__name__)
 
+# (absolute path segments, schema, instance) of a node to validate
+_SchemaTarget = Tuple[List[Any], Any, Any]
+
 
 class DSLValidationService:
     """Service to validate and lex DSL JSON specs using the shared schema."""
 
-    def __init__(self, schema_path: Optional[Path] = None):
+    # Keywords whose result depends on several children at once: a changed
+    # path crossing a schema node that uses one forces a full validation.
+    _UNSPLITTABLE_KEYWORDS = frozenset({
+        "$ref", "allOf", "anyOf", "oneOf", "not", "if", "then", "else",
+        "contains", "uniqueItems", "dependencies", "propertyNames",
+    })
+
+    def __init__(
+        self,
+        schema_path: Optional[Path] = None,
+        cache_size: Optional[int] = None,
+        cache_max_bytes: Optional[int] = None,
+        engine: Optional[str] = None,
+    ):
         self.schema_path = schema_path or self._default_schema_path()
         self._schema: Optional[Dict[str, Any]] = None
         self._validator: Optional[Draft7Validator] = None
 
+        # "jsonschema" interprets the schema, "compiled" runs generated code
+        self.engine = (engine or settings.VALIDATION_ENGINE).lower()
+        if self.engine not in ("jsonschema", "compiled"):
+            raise ValueError(f"Unsupported validation engine: {self.engine}")
+        self._compiled: Optional[CompiledValidator] = None
+        self._compile_failed = False
+        self._schema_fingerprint: Optional[Tuple[int, int]] = None
+        self.schema_version: Optional[str] = None
+
+        # LRU of validation results keyed by spec hash + schema version
+        self.cache_size = settings.VALIDATION_CACHE_SIZE if cache_size is None else cache_size
+        self.cache_max_bytes = settings.VALIDATION_CACHE_MAX_BYTES if cache_max_bytes is None else cache_max_bytes
+        self._result_cache: "OrderedDict[str, Tuple[Dict[str, Any], int]]" = OrderedDict()
+        self._cache_bytes = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # Last known errors of each document, base of incremental validations
+        self._documents: "OrderedDict[str, List[Dict[str, Any]]]" = OrderedDict()
+
     @staticmethod
     def _default_schema_path() -> Path:
         return Path(__file__).resolve().parents[2] / "docs" / "schema.json"
@@ -26,7 +67,9 @@ class DSLValidationService:
         if self._schema is None:
             if not self.schema_path.exists():
                 raise FileNotFoundError(f"Schema not found at {self.schema_path}")
-            self._schema = json.loads(self.schema_path.read_text())
+            raw = self.schema_path.read_bytes()
+            self._schema = json.loads(raw)
+            self.schema_version = hashlib.sha256(raw).hexdigest()[:16]
         return self._schema
 
     def _get_validator(self) -> Draft7Validator:
@@ -34,19 +77,142 @@ class DSLValidationService:
             self._validator = Draft7Validator(self._load_schema())
         return self._validator
 
-    def validate_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
-        """Validate a spec against JSON schema and return structured errors."""
+    def _get_compiled_validator(self) -> Optional[CompiledValidator]:
+        """Compile the schema once; None if it uses unsupported keywords."""
+        if self._compiled is None and not self._compile_failed:
+            try:
+                self._compiled = compile_schema(self._load_schema())
+            except SchemaCompileError as error:
+                logger.warning("Falling back to jsonschema, cannot compile schema: %s", error)
+                self._compile_failed = True
+        return self._compiled
+
+    def _refresh_schema(self) -> None:
+        """Reload the schema and drop cached results if the file changed on disk."""
+        try:
+            stat = self.schema_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Schema not found at {self.schema_path}")
+
+        fingerprint = (stat.st_mtime_ns, stat.st_size)
+        if fingerprint == self._schema_fingerprint:
+            return
+
+        if self._schema_fingerprint is not None:
+            logger.info("Schema %s changed, reloading validator", self.schema_path)
+        self._schema = None
+        self._validator = None
+        self._compiled = None
+        self._compile_failed = False
+        self._schema_fingerprint = fingerprint
+        self.clear_cache()
+        self._documents.clear()
+        self._load_schema()
+
+    def validate_spec(
+        self,
+        spec: Dict[str, Any],
+        use_cache: bool = True,
+        document_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Validate a spec against JSON schema and return structured errors.
+
+        Results are cached by a canonical hash of the spec and the schema
+        version, so re-validating an unchanged spec skips the schema pass.
+        When a document id is given, the errors are remembered as the base
+        for later incremental validations of that document.
+        """
+        self._refresh_schema()
+
+        key = self._cache_key(spec) if use_cache and self.cache_size > 0 else None
+        result = None
+        if key is not None:
+            cached = self._result_cache.get(key)
+            if cached is not None:
+                self._result_cache.move_to_end(key)
+                self.cache_hits += 1
+                result = cached[0]
+            else:
+                self.cache_misses += 1
+
+        if result is None:
+            result = self._run_validation(spec)
+            if key is not None:
+                self._cache_put(key, result)
+
+        if document_id is not None:
+            self._remember_document(document_id, result["errors"])
+        return self._copy_result(result)
+
+    def validate_incremental(
+        self,
+        spec: Dict[str, Any],
+        document_id: str,
+        changed: Optional[List[str]] = None,
+        patch: Optional[List[Dict[str, Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Re-validate only the parts of a document touched by an edit.
+
+        ``spec`` is the document after the edit; the edit is described either
+        by changed JSON pointers or by the JSON Patch that was applied. Each
+        changed sub-tree is validated against its sub-schema, its ancestors
+        are re-checked with their own (non-descending) keywords only, and the
+        result is merged with the remembered errors of the untouched parts.
+        Falls back to a full validation when the document is unknown or the
+        schema along a changed path cannot be split (``$ref``, combinators).
+        """
+        self._refresh_schema()
+
+        pointers = list(changed or []) + self._patch_pointers(spec, patch or [])
+        previous = self._documents.get(document_id)
+        plan = self._plan_incremental(spec, pointers) if previous is not None else None
+        if plan is None:
+            result = self.validate_spec(spec, document_id=document_id)
+            return {**result, "incremental": False, "revalidated": [""]}
+
+        self._documents.move_to_end(document_id)
+        subtrees, ancestors = plan
         validator = self._get_validator()
-        errors = sorted(validator.iter_errors(spec), key=lambda err: list(err.path))
-
-        formatted_errors = [
-            {
-                "path": self._format_path(err.path),
-                "message": err.message,
-                "validator": err.validator,
-            }
-            for err in errors
-        ]
+        new_errors: List[Dict[str, Any]] = []
+
+        for segments, subschema, instance in filter(None, subtrees.values()):
+            for err in validator.evolve(schema=subschema).iter_errors(instance):
+                new_errors.append(self._format_error(segments + list(err.path), err))
+
+        for segments, subschema, instance in ancestors.values():
+            shallow = self._shallow_schema(subschema)
+            for err in validator.evolve(schema=shallow).iter_errors(instance):
+                new_errors.append(self._format_error(segments + list(err.path), err))
+
+        def is_revalidated(path: str) -> bool:
+            if path in ancestors:
+                return True
+            return any(path == pointer or path.startswith(pointer + "/") for pointer in subtrees)
+
+        kept = [error for error in previous if not is_revalidated(error["path"])]
+        errors = sorted(kept + new_errors, key=lambda error: self._path_sort_key(error["path"]))
+        self._remember_document(document_id, errors)
+
+        return {
+            "valid": len(errors) == 0,
+            "errors": [dict(error) for error in errors],
+            "error_count": len(errors),
+            "incremental": True,
+            "revalidated": sorted(subtrees),
+        }
+
+    def _run_validation(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        compiled = self._get_compiled_validator() if self.engine == "compiled" else None
+        if compiled is not None:
+            errors = sorted(compiled(spec), key=lambda err: list(err[0]))
+            formatted_errors = [
+                {"path": self._format_path(path), "message": message, "validator": keyword}
+                for path, message, keyword in errors
+            ]
+        else:
+            validator = self._get_validator()
+            errors = sorted(validator.iter_errors(spec), key=lambda err: list(err.path))
+            formatted_errors = [self._format_error(err.path, err) for err in errors]
 
         return {
             "valid": len(formatted_errors) == 0,
@@ -54,35 +220,257 @@ class DSLValidationService:
             "error_count": len(formatted_errors),
         }
 
-    def lex_spec(self, spec: Any) -> List[Dict[str, Any]]:
-        """Lex a JSON spec into a list of tokens with JSON pointer paths."""
-        tokens: List[Dict[str, Any]] = []
+    def _format_error(self, path: Any, err: Any) -> Dict[str, Any]:
+        return {
+            "path": self._format_path(path),
+            "message": err.message,
+            "validator": err.validator,
+        }
 
-        def walk(value: Any, path: List[Any]) -> None:
-            pointer = self._format_path(path)
-            if isinstance(value, dict):
-                tokens.append({"type": "object_start", "path": pointer})
-                for key, item in value.items():
-                    tokens.append({"type": "property", "path": f"{pointer}/{key}" if pointer else f"/{key}", "value": key})
-                    walk(item, path + [key])
-                tokens.append({"type": "object_end", "path": pointer})
-                return
+    def _remember_document(self, document_id: str, errors: List[Dict[str, Any]]) -> None:
+        self._documents[document_id] = [dict(error) for error in errors]
+        self._documents.move_to_end(document_id)
+        while len(self._documents) > max(self.cache_size, 1):
+            self._documents.popitem(last=False)
 
-            if isinstance(value, list):
-                tokens.append({"type": "array_start", "path": pointer})
-                for index, item in enumerate(value):
-                    tokens.append({"type": "index", "path": f"{pointer}/{index}" if pointer else f"/{index}", "value": index})
-                    walk(item, path + [index])
-                tokens.append({"type": "array_end", "path": pointer})
-                return
+    def _plan_incremental(
+        self, spec: Any, pointers: List[str]
+    ) -> Optional[Tuple[Dict[str, Optional[_SchemaTarget]], Dict[str, _SchemaTarget]]]:
+        """Map changed pointers to sub-trees to re-validate and ancestors to re-check.
+
+        Removed sub-trees map to None: their old errors are only dropped.
+        """
+        if not pointers:
+            return {}, {}
+
+        # Drop pointers nested in another changed pointer
+        unique = sorted({self._parse_pointer(pointer) for pointer in pointers}, key=len)
+        roots: List[Tuple[str, ...]] = []
+        for segments in unique:
+            if not any(segments[:len(root)] == root for root in roots):
+                roots.append(segments)
+
+        subtrees: Dict[str, Optional[_SchemaTarget]] = {}
+        ancestors: Dict[str, _SchemaTarget] = {}
+        root_schema = self._load_schema()
 
-            token_type = self._scalar_type(value)
-            tokens.append({"type": token_type, "path": pointer, "value": value})
+        for segments in roots:
+            if not segments:
+                return None
 
-        walk(spec, [])
+            # For a removed node, the first missing segment marks the region
+            # whose old errors are dropped; its ancestors are re-checked
+            instance, depth = self._resolve_instance(spec, segments)
+            removed = depth < len(segments)
+            segments = segments[:depth + 1]
+
+            schema: Any = root_schema
+            instances = [spec]
+            for index, segment in enumerate(segments):
+                if not isinstance(schema, dict) or self._UNSPLITTABLE_KEYWORDS & schema.keys():
+                    return None
+                ancestors[self._format_path(segments[:index])] = (list(segments[:index]), schema, instances[-1])
+                schema = self._child_schema(schema, segment)
+                if schema is None:
+                    # Not described by the schema: the parent reports it
+                    break
+                if index + 1 < len(segments):
+                    instances.append(self._child_instance(instances[-1], segment))
+            else:
+                target = None if removed else (list(segments), schema, instance)
+                subtrees[self._format_path(segments)] = target
+
+        # Truncating removed paths can nest targets: a sub-tree validation
+        # already covers everything below it, including ancestor checks
+        def covered(path: str, exclude: Optional[str] = None) -> bool:
+            return any(
+                other != exclude and (path == other or path.startswith(other + "/"))
+                for other in subtrees
+            )
+
+        subtrees = {path: target for path, target in subtrees.items() if not covered(path, exclude=path)}
+        ancestors = {path: target for path, target in ancestors.items() if not covered(path)}
+        return subtrees, ancestors
+
+    def _patch_pointers(self, spec: Any, patch: List[Dict[str, Any]]) -> List[str]:
+        """Extract changed pointers from JSON Patch operations.
+
+        Adding, removing or moving an array item shifts its siblings, so the
+        whole array is re-validated in that case.
+        """
+        pointers: List[str] = []
+        for operation in patch:
+            for field in ("path", "from"):
+                pointer = operation.get(field)
+                if pointer is None or (field == "from" and operation.get("op") == "copy"):
+                    continue
+                segments = self._parse_pointer(pointer)
+                if segments and operation.get("op") in ("add", "remove", "move"):
+                    parent, depth = self._resolve_instance(spec, segments[:-1])
+                    if depth == len(segments) - 1 and isinstance(parent, list):
+                        segments = segments[:-1]
+                pointers.append(self._format_path(segments))
+        return pointers
+
+    @staticmethod
+    def _child_schema(schema: Dict[str, Any], segment: str) -> Any:
+        if "properties" in schema and segment in schema["properties"]:
+            return schema["properties"][segment]
+        items = schema.get("items")
+        if isinstance(items, dict):
+            return items
+        if isinstance(items, list) and segment.isdigit():
+            index = int(segment)
+            return items[index] if index < len(items) else schema.get("additionalItems")
+        additional = schema.get("additionalProperties")
+        return additional if isinstance(additional, dict) else None
+
+    @staticmethod
+    def _child_instance(instance: Any, segment: str) -> Any:
+        if isinstance(instance, list):
+            return instance[int(segment)]
+        return instance[segment]
+
+    @classmethod
+    def _resolve_instance(cls, spec: Any, segments: Tuple[str, ...]) -> Tuple[Any, int]:
+        """Follow segments into the spec; return the deepest node found and its depth."""
+        node = spec
+        for depth, segment in enumerate(segments):
+            if isinstance(node, dict) and segment in node:
+                node = node[segment]
+            elif isinstance(node, list) and segment.isdigit() and int(segment) < len(node):
+                node = node[int(segment)]
+            else:
+                return node, depth
+        return node, len(segments)
+
+    @classmethod
+    def _shallow_schema(cls, schema: Dict[str, Any]) -> Dict[str, Any]:
+        """Keep the keywords checked on the node itself, not on its children."""
+        shallow = dict(schema)
+        for keyword in ("properties", "patternProperties"):
+            if keyword in shallow:
+                shallow[keyword] = {key: True for key in shallow[keyword]}
+        for keyword in ("additionalProperties", "additionalItems"):
+            if isinstance(shallow.get(keyword), dict):
+                shallow[keyword] = True
+        if isinstance(shallow.get("items"), list):
+            shallow["items"] = [True] * len(shallow["items"])
+        elif "items" in shallow:
+            shallow["items"] = True
+        return shallow
+
+    @staticmethod
+    def _parse_pointer(pointer: str) -> Tuple[str, ...]:
+        if not pointer or pointer == "/":
+            return ()
+        return tuple(
+            part.replace("~1", "/").replace("~0", "~")
+            for part in pointer.lstrip("#").lstrip("/").split("/")
+        )
+
+    @staticmethod
+    def _path_sort_key(path: str) -> List[Tuple[int, Any]]:
+        """Order formatted paths like the full validation orders error paths."""
+        if not path:
+            return []
+        return [
+            (0, int(part)) if part.isdigit() else (1, part)
+            for part in path[1:].split("/")
+        ]
+
+    def _cache_key(self, spec: Any) -> Optional[str]:
+        try:
+            canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        digest = hashlib.sha256(canonical.encode("utf-8"))
+        digest.update(f"\0{self.schema_version}".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> None:
+        size = self._result_size(result)
+        if size > self.cache_max_bytes:
+            return
+
+        self._result_cache[key] = (result, size)
+        self._cache_bytes += size
+        while self._result_cache and (
+            len(self._result_cache) > self.cache_size or self._cache_bytes > self.cache_max_bytes
+        ):
+            _, (_, evicted_size) = self._result_cache.popitem(last=False)
+            self._cache_bytes -= evicted_size
+
+    @staticmethod
+    def _result_size(result: Dict[str, Any]) -> int:
+        """Rough in-memory size of a cached result, in bytes."""
+        return 256 + sum(
+            200 + len(error["path"]) + len(error["message"]) for error in result["errors"]
+        )
+
+    @staticmethod
+    def _copy_result(result: Dict[str, Any]) -> Dict[str, Any]:
+        return {**result, "errors": [dict(error) for error in result["errors"]]}
+
+    def clear_cache(self) -> None:
+        """Drop every cached validation result."""
+        self._result_cache.clear()
+        self._cache_bytes = 0
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Return validation cache counters."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "entries": len(self._result_cache),
+            "max_entries": self.cache_size,
+            "bytes": self._cache_bytes,
+            "max_bytes": self.cache_max_bytes,
+            "schema_version": self.schema_version,
+        }
+
+    def lex_spec(self, spec: Any) -> List[Dict[str, Any]]:
+        """Lex a JSON spec into a list of tokens with JSON pointer paths."""
+        tokens = list(self.iter_tokens(spec))
         logger.debug("Lexed %s tokens", len(tokens))
         return tokens
 
+    def iter_tokens(self, spec: Any) -> Iterator[Dict[str, Any]]:
+        """Lazily lex a JSON spec into tokens with JSON pointer paths.
+
+        The walk is iterative, so arbitrarily deep specs do not hit the
+        interpreter recursion limit, and each child pointer is built once
+        from its parent's pointer instead of re-joining the whole path.
+        """
+        # One frame per open container: (pointer, child iterator, child token type, end token type)
+        frames: List[Tuple[str, Iterator[Tuple[Any, Any]], str, str]] = []
+        value, pointer = spec, ""
+
+        while True:
+            if isinstance(value, dict):
+                yield {"type": "object_start", "path": pointer}
+                frames.append((pointer, iter(value.items()), "property", "object_end"))
+            elif isinstance(value, list):
+                yield {"type": "array_start", "path": pointer}
+                frames.append((pointer, iter(enumerate(value)), "index", "array_end"))
+            else:
+                yield {"type": self._scalar_type(value), "path": pointer, "value": value}
+
+            # Move to the next child of the innermost open container
+            while frames:
+                parent, children, child_type, end_type = frames[-1]
+                child = next(children, None)
+                if child is None:
+                    frames.pop()
+                    yield {"type": end_type, "path": parent}
+                    continue
+                key, value = child
+                pointer = f"{parent}/{key}"
+                yield {"type": child_type, "path": pointer, "value": key}
+                break
+            else:
+                return
+
     @staticmethod
     def _scalar_type(value: Any) -> str:
         if value is None:
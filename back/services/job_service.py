@@ -0,0 +1,243 @@
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+from collections import OrderedDict, deque
+from datetime import datetime
+import asyncio
+import logging
+import time
+import uuid
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+JobFactory = Callable[[], Awaitable[Any]]
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobQueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at capacity"""
+
+
+class Job:
+    """A unit of background work and its lifecycle"""
+
+    def __init__(self, job_id: str, kind: str, factory: JobFactory):
+        self.id = job_id
+        self.kind = kind
+        self.factory = factory
+        self.status = QUEUED
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.created_at = datetime.now()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.task: Optional[asyncio.Task] = None
+        self._enqueued = time.perf_counter()
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "result": self.result,
+            "error": self.error,
+            "created_at": self.created_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+
+class JobService:
+    """Bounded queue and worker pool for long-running generation jobs"""
+
+    def __init__(
+        self,
+        max_queue_size: Optional[int] = None,
+        workers: Optional[int] = None,
+        history_size: Optional[int] = None
+    ):
+        """
+        Initialize the job service
+
+        Args:
+            max_queue_size: Jobs waiting beyond the running ones before
+                submissions are rejected (defaults to settings.JOB_QUEUE_SIZE)
+            workers: Number of jobs run concurrently (defaults to settings.JOB_WORKERS)
+            history_size: Finished jobs kept for status queries
+                (defaults to settings.JOB_HISTORY_SIZE)
+        """
+        self.max_queue_size = settings.JOB_QUEUE_SIZE if max_queue_size is None else max_queue_size
+        self.worker_count = settings.JOB_WORKERS if workers is None else workers
+        self.history_size = settings.JOB_HISTORY_SIZE if history_size is None else history_size
+
+        self.jobs: "OrderedDict[str, Job]" = OrderedDict()
+        # Unbounded: capacity is checked against the live count of queued
+        # jobs, so cancelled jobs still in the queue do not take a place
+        self._queue: Optional[asyncio.Queue] = None
+        self._queued = 0
+        self._workers: List[asyncio.Task] = []
+        self._stopping = False
+
+        self._counters = {state: 0 for state in (SUCCEEDED, FAILED, CANCELLED)}
+        self._rejected = 0
+        self._wait_times: Deque[float] = deque(maxlen=1000)
+        self._run_times: Deque[float] = deque(maxlen=1000)
+
+    def start(self) -> None:
+        """Start the worker tasks on the running event loop"""
+        if self._workers:
+            return
+        self._stopping = False
+        self._queue = asyncio.Queue()
+        self._workers = [
+            asyncio.create_task(self._worker(index), name=f"job-worker-{index}")
+            for index in range(self.worker_count)
+        ]
+        logger.info(f"Started {self.worker_count} job workers (queue size {self.max_queue_size})")
+
+    async def stop(self) -> None:
+        """Cancel the workers and every unfinished job"""
+        self._stopping = True
+        for job in self.jobs.values():
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+
+    def submit(self, factory: JobFactory, kind: str = "job") -> Job:
+        """
+        Queue a job
+
+        Args:
+            factory: Callable returning the coroutine to run
+            kind: Label of the job type, reported in the status
+
+        Returns:
+            The queued job
+
+        Raises:
+            JobQueueFullError: If the queue is at capacity
+        """
+        self.start()
+        if 0 < self.max_queue_size <= self._queued:
+            self._rejected += 1
+            raise JobQueueFullError(
+                f"Job queue is full ({self.max_queue_size} jobs waiting), retry later"
+            )
+        job = Job(str(uuid.uuid4()), kind, factory)
+        self._queue.put_nowait(job)
+        self._queued += 1
+        self.jobs[job.id] = job
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Return a job by id, if it is still known"""
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Optional[Job]:
+        """
+        Cancel a queued or running job
+
+        Args:
+            job_id: Id of the job
+
+        Returns:
+            The job, or None if it is unknown
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.status in FINISHED_STATES:
+            return job
+        if job.status == QUEUED:
+            # The worker skips it when dequeued
+            self._finish(job, CANCELLED)
+        elif job.task is not None:
+            job.task.cancel()
+        return job
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return queue depth, job counters and latency statistics"""
+        return {
+            "workers": self.worker_count,
+            "max_queue_size": self.max_queue_size,
+            "queue_depth": self._queued,
+            "running": sum(1 for job in self.jobs.values() if job.status == RUNNING),
+            "succeeded": self._counters[SUCCEEDED],
+            "failed": self._counters[FAILED],
+            "cancelled": self._counters[CANCELLED],
+            "rejected": self._rejected,
+            "queue_wait_ms": self._latency_stats(self._wait_times),
+            "run_time_ms": self._latency_stats(self._run_times),
+        }
+
+    async def _worker(self, index: int) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status == QUEUED:
+                    await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        self._queued -= 1
+        job.status = RUNNING
+        job.started_at = datetime.now()
+        started = time.perf_counter()
+        self._wait_times.append((started - job._enqueued) * 1000)
+
+        job.task = asyncio.create_task(job.factory())
+        try:
+            job.result = await job.task
+            self._finish(job, SUCCEEDED)
+        except asyncio.CancelledError:
+            self._finish(job, CANCELLED)
+            if self._stopping:
+                raise
+        except Exception as e:
+            logger.error(f"Job {job.id} ({job.kind}) failed: {e}")
+            job.error = str(e)
+            self._finish(job, FAILED)
+        finally:
+            job.task = None
+            self._run_times.append((time.perf_counter() - started) * 1000)
+
+    def _finish(self, job: Job, status: str) -> None:
+        if job.status == QUEUED:
+            self._queued -= 1
+        job.status = status
+        job.finished_at = datetime.now()
+        job.factory = None
+        self._counters[status] += 1
+        self._trim_history()
+
+    def _trim_history(self) -> None:
+        finished = [job_id for job_id, job in self.jobs.items() if job.status in FINISHED_STATES]
+        for job_id in finished[:max(len(finished) - self.history_size, 0)]:
+            del self.jobs[job_id]
+
+    @staticmethod
+    def _latency_stats(samples: Deque[float]) -> Dict[str, Optional[float]]:
+        if not samples:
+            return {"avg": None, "p50": None, "p95": None, "max": None}
+        ordered = sorted(samples)
+        return {
+            "avg": sum(ordered) / len(ordered),
+            "p50": ordered[len(ordered) // 2],
+            "p95": ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)],
+            "max": ordered[-1],
+        }
+
+
+# Singleton instance
+job_service = JobService()
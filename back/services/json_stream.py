@@ -0,0 +1,111 @@
+from typing import Any, List, Optional
+import json
+
+_OPENERS = {"{": "}", "[": "]"}
+_CLOSERS = frozenset("}]")
+
+
+class JSONStreamExtractor:
+    """Find the first complete JSON object or array in streamed text
+
+    Text is fed chunk by chunk as it arrives. Each character is scanned once
+    while tracking nesting and string state, so finding a value is linear in
+    the text consumed, and ``feed`` reports completion as soon as the closing
+    bracket of the first top-level value is seen: the caller can stop reading
+    the stream there. Prose around the value is skipped; a bracketed span
+    that turns out not to be JSON (e.g. ``{placeholder}`` in a sentence, or
+    a malformed answer) is discarded as a whole and scanning resumes after
+    it, so a fragment nested in a malformed value is never returned in its
+    place.
+    """
+
+    def __init__(self):
+        self.value: Any = None
+        self.done = False
+        # Text from the start of the current candidate (or of the unscanned
+        # remainder); everything before it can never be part of the value
+        self._buffer: List[str] = []
+        self._offset = 0
+        self._fed = 0
+        self._start: Optional[int] = None
+        self._stack: List[str] = []
+        self._in_string = False
+        self._escape = False
+
+    def feed(self, chunk: str) -> bool:
+        """
+        Consume the next piece of text
+
+        Args:
+            chunk: Text received from the stream
+
+        Returns:
+            True once a complete value has been parsed into ``value``
+        """
+        if self.done or not chunk:
+            return self.done
+
+        base = self._fed
+        self._fed += len(chunk)
+        if self._start is None:
+            self._buffer = []
+        self._buffer.append(chunk)
+
+        pending = (chunk, base)
+        while pending is not None:
+            pending = self._scan(*pending)
+        return self.done
+
+    def _scan(self, text: str, base: int) -> Optional[tuple]:
+        """Scan ``text`` starting at global index ``base``; return the text left after a discarded candidate"""
+        for index, char in enumerate(text):
+            if self._start is None:
+                if char in _OPENERS:
+                    self._start = base + index
+                    self._stack = [_OPENERS[char]]
+                    # Keep only the text from the opening bracket on
+                    self._buffer = [text[index:]]
+                    self._offset = self._start
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in _OPENERS:
+                self._stack.append(_OPENERS[char])
+            elif char in _CLOSERS:
+                if char != self._stack[-1]:
+                    return self._discard(base + index + 1)
+                self._stack.pop()
+                if not self._stack:
+                    candidate = "".join(self._buffer)[:base + index + 1 - self._offset]
+                    try:
+                        self.value = json.loads(candidate)
+                    except (json.JSONDecodeError, RecursionError):
+                        return self._discard(base + index + 1)
+                    self.done = True
+                    return None
+
+        if self._start is None:
+            self._offset = base + len(text)
+            self._buffer = []
+        return None
+
+    def _discard(self, resume: int) -> tuple:
+        """Drop the current candidate and resume scanning at global index ``resume``"""
+        rest = "".join(self._buffer)[resume - self._offset:]
+        self._start = None
+        self._stack = []
+        self._in_string = False
+        self._escape = False
+        self._buffer = []
+        self._offset = resume
+        return rest, resume
@@ -0,0 +1,196 @@
+from abc import ABC, abstractmethod
+from langchain_openai import ChatOpenAI
+from langchain.prompts import ChatPromptTemplate
+from langchain.schema.output_parser import StrOutputParser
+from langchain.schema.runnable import RunnablePassthrough
+from typing import Any, AsyncIterator, Dict, Optional
+import asyncio
+import hashlib
+import httpx
+import json
+import openai
+import random
+
+from config import settings
+
+
+class LLMBackend(ABC):
+    """Interface of the model backends used by LLMService
+
+    A call renders ``text`` into ``prompt`` (a template with a single
+    ``{input}`` variable) and sends it to the model.
+    """
+
+    name = "base"
+    enabled = False
+    model = ""
+    temperature = 0.0
+
+    def prepare(self, prompt: ChatPromptTemplate) -> None:
+        """Build whatever the backend needs per prompt ahead of the first call"""
+
+    @abstractmethod
+    async def complete(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> str:
+        """Return the whole answer ("json" asks for a JSON document)"""
+
+    @abstractmethod
+    def stream(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> AsyncIterator[str]:
+        """Yield the answer in chunks as they are produced"""
+
+    async def aclose(self) -> None:
+        pass
+
+
+class OpenAIBackend(LLMBackend):
+    """OpenAI chat models through LangChain, over one pooled HTTP client"""
+
+    name = "openai"
+
+    def __init__(self):
+        self.enabled = bool(settings.OPENAI_API_KEY)
+        self.model = settings.OPENAI_MODEL
+        self.temperature = settings.OPENAI_TEMPERATURE
+        self.http_client: Optional[httpx.AsyncClient] = None
+        self.llm: Optional[ChatOpenAI] = None
+
+        # prompt id -> (streaming chain, text chain), built once per prompt
+        self._chains: Dict[int, Any] = {}
+
+        if self.enabled:
+            # One pooled keep-alive client shared by every request
+            self.http_client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=settings.LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.LLM_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.LLM_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(settings.LLM_REQUEST_TIMEOUT, connect=10.0)
+            )
+            self.llm = ChatOpenAI(
+                model=settings.OPENAI_MODEL,
+                temperature=settings.OPENAI_TEMPERATURE,
+                max_tokens=settings.OPENAI_MAX_TOKENS,
+                streaming=True,
+                api_key=settings.OPENAI_API_KEY,
+                async_client=openai.AsyncOpenAI(
+                    api_key=settings.OPENAI_API_KEY,
+                    http_client=self.http_client
+                ).chat.completions
+            )
+
+    def prepare(self, prompt: ChatPromptTemplate) -> None:
+        if self.enabled:
+            self.chains(prompt)
+
+    def chains(self, prompt: ChatPromptTemplate):
+        """Return the (streaming, text) chains of a prompt, compiling them on first use"""
+        chains = self._chains.get(id(prompt))
+        if chains is None:
+            chat_chain = (
+                {"input": RunnablePassthrough()}
+                | prompt
+                | self.llm
+            )
+            chains = (chat_chain, chat_chain | StrOutputParser())
+            self._chains[id(prompt)] = chains
+        return chains
+
+    async def complete(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> str:
+        return await self.chains(prompt)[1].ainvoke(text)
+
+    async def stream(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> AsyncIterator[str]:
+        async for chunk in self.chains(prompt)[0].astream(text):
+            if hasattr(chunk, 'content'):
+                yield chunk.content
+
+    async def aclose(self) -> None:
+        if self.http_client is not None:
+            await self.http_client.aclose()
+
+
+class StubLLMBackend(LLMBackend):
+    """Deterministic offline backend for load tests and local development
+
+    Answers are derived from a hash of the prompt so identical requests get
+    identical output. Streams are paced by ``token_delay`` (seconds between
+    chunks) and ``tokens_per_chunk``; JSON requests return a valid document.
+    """
+
+    name = "stub"
+    enabled = True
+    model = "stub"
+
+    WORDS = (
+        "the", "model", "class", "entity", "service", "relation", "field", "generate",
+        "endpoint", "schema", "controller", "repository", "should", "use", "a", "for",
+        "each", "with", "and", "to", "validate", "property", "component", "page",
+    )
+
+    def __init__(
+        self,
+        response_tokens: Optional[int] = None,
+        token_delay: Optional[float] = None,
+        tokens_per_chunk: Optional[int] = None,
+        first_token_delay: Optional[float] = None
+    ):
+        self.response_tokens = settings.LLM_STUB_RESPONSE_TOKENS if response_tokens is None else response_tokens
+        self.token_delay = settings.LLM_STUB_TOKEN_DELAY if token_delay is None else token_delay
+        self.tokens_per_chunk = max(
+            settings.LLM_STUB_TOKENS_PER_CHUNK if tokens_per_chunk is None else tokens_per_chunk, 1
+        )
+        self.first_token_delay = (
+            settings.LLM_STUB_FIRST_TOKEN_DELAY if first_token_delay is None else first_token_delay
+        )
+
+    @staticmethod
+    def _seed(prompt: ChatPromptTemplate, text: str) -> int:
+        rendered = prompt.format(input=text)
+        return int.from_bytes(hashlib.sha256(rendered.encode("utf-8")).digest()[:8], "big")
+
+    def _tokens(self, seed: int):
+        rng = random.Random(seed)
+        for index in range(self.response_tokens):
+            word = rng.choice(self.WORDS)
+            yield word if index == 0 else f" {word}"
+
+    async def stream(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> AsyncIterator[str]:
+        if self.first_token_delay:
+            await asyncio.sleep(self.first_token_delay)
+        seed = self._seed(prompt, text)
+        if response_format == "json":
+            tokens = self._json_tokens(seed, text)
+        else:
+            tokens = self._tokens(seed)
+        chunk = []
+        for token in tokens:
+            chunk.append(token)
+            if len(chunk) == self.tokens_per_chunk:
+                yield "".join(chunk)
+                chunk = []
+                if self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+        if chunk:
+            yield "".join(chunk)
+
+    def _json_tokens(self, seed: int, text: str):
+        """Split the JSON answer into ~4 character tokens"""
+        document = json.dumps({
+            "stub": True,
+            "id": f"{seed:016x}",
+            "request": text,
+            "summary": "".join(self._tokens(seed)),
+        })
+        for start in range(0, len(document), 4):
+            yield document[start:start + 4]
+
+    async def complete(self, prompt: ChatPromptTemplate, text: str, response_format: str = "text") -> str:
+        return "".join([chunk async for chunk in self.stream(prompt, text, response_format)])
+
+
+def create_llm_backend() -> LLMBackend:
+    """Build the backend selected by settings.LLM_BACKEND"""
+    if settings.LLM_BACKEND == "openai":
+        return OpenAIBackend()
+    if settings.LLM_BACKEND == "stub":
+        return StubLLMBackend()
+    raise ValueError(f"Unsupported LLM backend: {settings.LLM_BACKEND}")
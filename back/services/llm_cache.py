@@ -0,0 +1,175 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Optional
+from pathlib import Path
+import hashlib
+import json
+import logging
+import time
+
+from config import settings
+from services.sqlite_lru import SQLiteLRUStore
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(model: str, temperature: float, prompt_template: str, payload: Any) -> str:
+    """
+    Build the cache key of an LLM call
+
+    The payload is canonicalised (sorted keys, compact separators) so that
+    semantically identical inputs share an entry regardless of key order.
+
+    Args:
+        model: Model name
+        temperature: Sampling temperature
+        prompt_template: Text of the prompt template the payload is rendered into
+        payload: JSON-serialisable input of the call
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    canonical = json.dumps(
+        [model, temperature, prompt_template, payload],
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class LLMCache(ABC):
+    """Interface of LLM response cache backends"""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None on a miss or an expired entry"""
+
+    @abstractmethod
+    def set(self, key: str, value: Any) -> None:
+        """Store a JSON-serialisable value"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return the backend name and its counters"""
+
+
+class NullLLMCache(LLMCache):
+    """Backend used when caching is disabled"""
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def set(self, key: str, value: Any) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "none"}
+
+
+class SQLiteLLMCache(LLMCache):
+    """LLM response cache stored in a local SQLite database
+
+    Entries expire ``ttl_seconds`` after they were written. When the stored
+    values exceed ``max_bytes`` the least recently used entries are evicted.
+    """
+
+    def __init__(self, path: Path, ttl_seconds: int, max_bytes: int):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file (":memory:" for a private in-memory cache)
+            ttl_seconds: Lifetime of an entry (0 = never expires)
+            max_bytes: Upper bound of the stored values size
+        """
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._store = SQLiteLRUStore(path, "llm_cache", max_bytes, columns=["created_at REAL NOT NULL"])
+
+    def get(self, key: str) -> Optional[Any]:
+        now = time.time()
+        store = self._store
+        with store.lock:
+            row = store.conn.execute(
+                "SELECT value, created_at FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or self._expired(row[1], now):
+                if row is not None:
+                    store.conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    store.conn.commit()
+                self.misses += 1
+                return None
+            store.conn.execute("UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            store.conn.commit()
+            self.hits += 1
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any) -> None:
+        data = json.dumps(value, ensure_ascii=False)
+        size = len(data.encode("utf-8"))
+        if size > self.max_bytes:
+            logger.info(f"Not caching LLM response of {size} bytes (limit {self.max_bytes})")
+            return
+
+        now = time.time()
+        store = self._store
+        with store.lock:
+            store.conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, data, size, now, now)
+            )
+            self._expire(now)
+            store.evict()
+            store.conn.commit()
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        entries, total = self._store.usage()
+        return {
+            "backend": "sqlite",
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._store.evictions,
+        }
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and now - created_at > self.ttl_seconds
+
+    def _expire(self, now: float) -> None:
+        """Drop the expired entries"""
+        if self.ttl_seconds:
+            cursor = self._store.conn.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+            )
+            self._store.evictions += cursor.rowcount
+
+
+def create_llm_cache() -> LLMCache:
+    """Build the cache backend selected by the settings"""
+    if not settings.LLM_CACHE_ENABLED or settings.LLM_CACHE_BACKEND == "none":
+        return NullLLMCache()
+    if settings.LLM_CACHE_BACKEND == "sqlite":
+        return SQLiteLLMCache(
+            settings.LLM_CACHE_PATH,
+            ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+            max_bytes=settings.LLM_CACHE_MAX_BYTES
+        )
+    raise ValueError(f"Unsupported LLM cache backend: {settings.LLM_CACHE_BACKEND}")
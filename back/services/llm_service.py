@@ -1,28 +1,43 @@
-from langchain_openai import ChatOpenAI
 from langchain.prompts import ChatPromptTemplate
-from langchain.schema.output_parser import StrOutputParser
-from langchain.schema.runnable import RunnablePassthrough
-from typing import Dict, Any, AsyncIterator
+from typing import Dict, Any, AsyncIterator, Optional
+from contextlib import aclosing, asynccontextmanager
+import asyncio
 import json
+import logging
 from config import settings
+from services.llm_backends import LLMBackend, create_llm_backend
+from services.llm_cache import LLMCache, create_llm_cache, make_cache_key
+from services.json_stream import JSONStreamExtractor
+from services.dsl_validation_service import dsl_validation_service
+
+logger = logging.getLogger(__name__)
+
+
+class LLMBusyError(Exception):
+    """Raised when no LLM slot frees up within LLM_QUEUE_TIMEOUT"""
 
 
 class LLMService:
     """Service for interacting with Language Models using LangChain"""
     
-    def __init__(self):
-        self.enabled = bool(settings.OPENAI_API_KEY)
-        
-        if self.enabled:
-            self.llm = ChatOpenAI(
-                model=settings.OPENAI_MODEL,
-                temperature=settings.OPENAI_TEMPERATURE,
-                max_tokens=settings.OPENAI_MAX_TOKENS,
-                streaming=True,
-                api_key=settings.OPENAI_API_KEY
-            )
-        else:
-            self.llm = None
+    UML_ANALYSIS_PROMPT = """Given the following UML class diagram data, provide suggestions for code generation in {target_language}.
+Analyze the classes, attributes, methods, and relationships.
+
+UML Data:
+{uml_data}
+
+Provide a brief analysis of the structure and any recommendations for the code generation."""
+    
+    def __init__(self, cache: Optional[LLMCache] = None, backend: Optional[LLMBackend] = None):
+        self.backend = backend if backend is not None else create_llm_backend()
+        self.enabled = self.backend.enabled
+        self.cache = cache if cache is not None else create_llm_cache()
+        
+        # Bounds the in-flight LLM calls; waiters queue in FIFO order
+        self.max_concurrency = settings.LLM_MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._active = 0
+        self._waiting = 0
         
         self.json_generation_prompt = ChatPromptTemplate.from_messages([
             ("system", """You are a helpful assistant that generates valid JSON based on user requests.
@@ -37,58 +52,150 @@ You help users with programming questions, code scaffolding, and technical discu
 Be concise and provide practical solutions."""),
             ("user", "{input}")
         ])
+        
+        # Compile the chains once, up front
+        self.backend.prepare(self.json_generation_prompt)
+        self.backend.prepare(self.chat_prompt)
+    
+    @asynccontextmanager
+    async def _slot(self):
+        """Hold one of the LLM_MAX_CONCURRENCY call slots"""
+        self._waiting += 1
+        try:
+            await asyncio.wait_for(self._semaphore.acquire(), settings.LLM_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise LLMBusyError(
+                f"All {self.max_concurrency} LLM slots stayed busy for {settings.LLM_QUEUE_TIMEOUT}s, retry later"
+            )
+        finally:
+            self._waiting -= 1
+        
+        self._active += 1
+        try:
+            yield
+        finally:
+            self._active -= 1
+            self._semaphore.release()
+    
+    def concurrency_stats(self) -> Dict[str, int]:
+        """Return the number of running and queued LLM calls"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "active": self._active,
+            "waiting": self._waiting,
+        }
+    
+    async def aclose(self) -> None:
+        """Release the backend's connections"""
+        await self.backend.aclose()
+    
+    def _cache_key(self, prompt: ChatPromptTemplate, template: str, payload: Any) -> str:
+        """Key an LLM call by model, temperature, prompt template and input"""
+        messages = [
+            [type(message).__name__, getattr(getattr(message, "prompt", None), "template", str(message))]
+            for message in prompt.messages
+        ]
+        return make_cache_key(
+            f"{self.backend.name}:{self.backend.model}",
+            self.backend.temperature,
+            json.dumps([messages, template]),
+            payload
+        )
+    
+    async def _cache_get(self, key: str) -> Optional[Any]:
+        return await asyncio.to_thread(self.cache.get, key)
+    
+    async def _cache_set(self, key: str, value: Any) -> None:
+        await asyncio.to_thread(self.cache.set, key, value)
     
     def _check_enabled(self):
         """Check if LLM service is enabled"""
         if not self.enabled:
             raise ValueError(
-                "LLM service is not enabled. Please set OPENAI_API_KEY in your environment variables or .env file."
+                "LLM service is not enabled. Please set OPENAI_API_KEY in your environment variables or .env file "
+                "(or LLM_BACKEND=stub for the offline backend)."
             )
     
-    async def generate_json(self, prompt: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
+    async def generate_json(
+        self,
+        prompt: str,
+        context: Dict[str, Any] = None,
+        use_cache: bool = True,
+        validate_spec: bool = False
+    ) -> Dict[str, Any]:
         """
         Generate JSON output from a prompt
         
         Args:
             prompt: The user's request
             context: Additional context for the generation
+            use_cache: Return a cached response for an identical request
+                (the fresh response is stored either way)
+            validate_spec: Check the result against the DSL schema
             
         Returns:
             Generated JSON as a dictionary
+            
+        Raises:
+            ValueError: If no JSON value can be parsed from the answer, or
+                the generated spec is invalid
         """
         self._check_enabled()
         
+        cache_key = self._cache_key(
+            self.json_generation_prompt,
+            "generate_json",
+            {"prompt": prompt, "context": context}
+        )
+        parsed = await self._cache_get(cache_key) if use_cache else None
+        if parsed is None:
+            parsed = await self._generate_json(prompt, context)
+            await self._cache_set(cache_key, parsed)
+        
+        if validate_spec:
+            self._validate_spec(parsed)
+        return parsed
+    
+    @staticmethod
+    def _validate_spec(spec: Any) -> None:
+        """Raise a ValueError listing the schema errors of a generated spec"""
+        result = dsl_validation_service.validate_spec(spec)
+        if not result["valid"]:
+            details = "; ".join(f"{error['path']}: {error['message']}" for error in result["errors"][:10])
+            raise ValueError(f"Generated spec is invalid ({result['error_count']} errors): {details}")
+    
+    async def _generate_json(self, prompt: str, context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        """Stream the model answer and stop at the end of its first JSON value"""
         full_prompt = prompt
         if context:
             full_prompt = f"Context: {json.dumps(context)}\n\nRequest: {prompt}"
         
-        chain = (
-            {"input": RunnablePassthrough()}
-            | self.json_generation_prompt
-            | self.llm
-            | StrOutputParser()
-        )
-        
-        result = await chain.ainvoke(full_prompt)
+        extractor = JSONStreamExtractor()
+        async with self._slot():
+            stream = self.backend.stream(self.json_generation_prompt, full_prompt, response_format="json")
+            async with aclosing(stream):
+                async for chunk in stream:
+                    if extractor.feed(chunk):
+                        # Closing the stream cancels the rest of the generation
+                        break
         
-        # Parse the JSON response
-        try:
-            return json.loads(result)
-        except json.JSONDecodeError:
-            # Try to extract JSON from the response if wrapped in text
-            import re
-            json_match = re.search(r'\{.*\}|\[.*\]', result, re.DOTALL)
-            if json_match:
-                return json.loads(json_match.group())
+        if not extractor.done:
             raise ValueError("Failed to parse JSON from LLM response")
+        return extractor.value
     
-    async def chat_stream(self, message: str, context: Dict[str, Any] = None) -> AsyncIterator[str]:
+    async def chat_stream(
+        self,
+        message: str,
+        context: Dict[str, Any] = None,
+        history: Optional[str] = None
+    ) -> AsyncIterator[str]:
         """
         Stream chat responses using Server-Sent Events
         
         Args:
             message: The user's message
             context: Additional context for the chat
+            history: Rendered conversation history of a chat session
             
         Yields:
             Chunks of the response as they are generated
@@ -96,48 +203,61 @@ Be concise and provide practical solutions."""),
         self._check_enabled()
         
         full_message = message
-        if context:
-            full_message = f"Context: {json.dumps(context)}\n\nMessage: {message}"
+        if context or history:
+            parts = []
+            if history:
+                parts.append(history)
+            if context:
+                parts.append(f"Context: {json.dumps(context)}")
+            parts.append(f"Message: {message}")
+            full_message = "\n\n".join(parts)
         
-        chain = (
-            {"input": RunnablePassthrough()}
-            | self.chat_prompt
-            | self.llm
-        )
-        
-        async for chunk in chain.astream(full_message):
-            if hasattr(chunk, 'content'):
-                yield chunk.content
+        # The slot is held for the whole stream; closing this generator
+        # (e.g. on client disconnect) closes the upstream stream at once
+        async with self._slot():
+            async with aclosing(self.backend.stream(self.chat_prompt, full_message)) as stream:
+                async for chunk in stream:
+                    yield chunk
     
-    async def generate_code_from_uml(self, uml_data: Dict[str, Any], target_language: str = "python") -> str:
+    async def generate_code_from_uml(
+        self,
+        uml_data: Dict[str, Any],
+        target_language: str = "python",
+        use_cache: bool = True
+    ) -> str:
         """
         Generate code from UML diagram data
         
         Args:
             uml_data: UML diagram data with classes and relations
             target_language: Target programming language
+            use_cache: Return a cached response for an identical diagram
+                (the fresh response is stored either way)
             
         Returns:
             Generated code suggestions
         """
         self._check_enabled()
         
-        prompt = f"""Given the following UML class diagram data, provide suggestions for code generation in {target_language}.
-Analyze the classes, attributes, methods, and relationships.
-
-UML Data:
-{json.dumps(uml_data, indent=2)}
-
-Provide a brief analysis of the structure and any recommendations for the code generation."""
+        cache_key = self._cache_key(
+            self.chat_prompt,
+            self.UML_ANALYSIS_PROMPT,
+            {"uml_data": uml_data, "target_language": target_language}
+        )
+        if use_cache:
+            cached = await self._cache_get(cache_key)
+            if cached is not None:
+                return cached
         
-        chain = (
-            {"input": RunnablePassthrough()}
-            | self.chat_prompt
-            | self.llm
-            | StrOutputParser()
+        prompt = self.UML_ANALYSIS_PROMPT.format(
+            target_language=target_language,
+            uml_data=json.dumps(uml_data, indent=2)
         )
         
-        return await chain.ainvoke(prompt)
+        async with self._slot():
+            result = await self.backend.complete(self.chat_prompt, prompt)
+        await self._cache_set(cache_key, result)
+        return result
 
 
 # Singleton instance
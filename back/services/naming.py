@@ -0,0 +1,113 @@
+from functools import lru_cache
+from typing import Any, Dict, Tuple
+import re
+
+# Conversions are called with the same few model and property names
+# thousands of times per project; each one keeps this many results
+CACHE_SIZE = 4096
+
+_CAMEL_HUMP = re.compile(r"(.)([A-Z][a-z]+)")
+_LOWER_UPPER = re.compile(r"([a-z0-9])([A-Z])")
+_WORD_BOUNDARY = re.compile(r"(?<=[a-z0-9])(?=[A-Z])|[^A-Za-z0-9]+")
+
+
+# Jinja filters (camel_case, snake_case, pascal_case, kebab_case). They split
+# on "_" and "-" only, as they always have, so existing templates render the
+# same output.
+
+@lru_cache(maxsize=CACHE_SIZE)
+def camel_case(text: str) -> str:
+    """Convert text to camelCase"""
+    words = text.replace('-', '_').split('_')
+    return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def snake_case(text: str) -> str:
+    """Convert text to snake_case"""
+    s1 = _CAMEL_HUMP.sub(r'\1_\2', text)
+    return _LOWER_UPPER.sub(r'\1_\2', s1).lower().replace('-', '_')
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pascal_case(text: str) -> str:
+    """Convert text to PascalCase"""
+    words = text.replace('-', '_').split('_')
+    return ''.join(word.capitalize() for word in words)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def kebab_case(text: str) -> str:
+    """Convert text to kebab-case"""
+    s1 = _CAMEL_HUMP.sub(r'\1-\2', text)
+    return _LOWER_UPPER.sub(r'\1-\2', s1).lower().replace('_', '-')
+
+
+# Identifier conversions of the application generator. Words are split on
+# case changes as well as separators and keep their inner capitals
+# (orderDate -> OrderDate, order-date -> OrderDate).
+
+@lru_cache(maxsize=CACHE_SIZE)
+def split_words(name: str) -> Tuple[str, ...]:
+    return tuple(word for word in _WORD_BOUNDARY.split(name) if word)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def pascal_name(name: str) -> str:
+    return "".join(word[:1].upper() + word[1:] for word in split_words(name))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def camel_name(name: str) -> str:
+    pascal = pascal_name(name)
+    return pascal[:1].lower() + pascal[1:]
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def kebab_name(name: str) -> str:
+    return "-".join(word.lower() for word in split_words(name))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def upper_snake_name(name: str) -> str:
+    return "_".join(word.upper() for word in split_words(name))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def plural_name(name: str) -> str:
+    """English plural of a PascalCase name (Client -> Clients, Category -> Categories)"""
+    lower = name.lower()
+    if lower.endswith("y") and lower[-2:-1] not in ("a", "e", "i", "o", "u"):
+        return name[:-1] + "ies"
+    if lower.endswith(("s", "x", "z", "ch", "sh")):
+        return name + "es"
+    return name + "s"
+
+
+_CONVERSIONS = (
+    camel_case, snake_case, pascal_case, kebab_case,
+    split_words, pascal_name, camel_name, kebab_name, upper_snake_name, plural_name,
+)
+
+
+def cache_stats() -> Dict[str, Any]:
+    """Return the hit/miss counters of every conversion cache"""
+    conversions = {}
+    for conversion in _CONVERSIONS:
+        info = conversion.cache_info()
+        conversions[conversion.__name__] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "entries": info.currsize,
+            "max_entries": info.maxsize,
+        }
+    return {
+        "hits": sum(stats["hits"] for stats in conversions.values()),
+        "misses": sum(stats["misses"] for stats in conversions.values()),
+        "conversions": conversions,
+    }
+
+
+def clear_caches() -> None:
+    for conversion in _CONVERSIONS:
+        conversion.cache_clear()
@@ -0,0 +1,249 @@
+from typing import Dict, List, Optional, Union
+from pathlib import Path
+import hashlib
+import json
+import logging
+import os
+import tempfile
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+# A Path is a verbatim source file copied without being loaded into memory
+FileContent = Union[str, bytes, Path]
+
+ASSET_COPY_MODES = ("copy", "hardlink")
+
+_COPY_CHUNK = 1024 * 1024
+
+
+class OutputWriter:
+    """Service for writing generated files to disk"""
+
+    # Written at the root of every incremental output directory; maps each
+    # generated file (relative path) to the SHA-256 of its content.
+    MANIFEST_NAME = ".generated-manifest.json"
+
+    def write_snapshot(self, output_path: Path, files: Dict[str, FileContent]) -> Path:
+        """
+        Write every file into a fresh output directory
+
+        Args:
+            output_path: Directory to write into
+            files: Mapping of relative file path to content
+
+        Returns:
+            The output directory
+        """
+        output_path.mkdir(parents=True, exist_ok=True)
+
+        # Create each directory once instead of once per file
+        created = {output_path}
+        for filename, content in files.items():
+            file_path = output_path / filename
+            if file_path.parent not in created:
+                file_path.parent.mkdir(parents=True, exist_ok=True)
+                created.add(file_path.parent)
+            if isinstance(content, Path):
+                self.copy_file(content, file_path)
+            else:
+                file_path.write_bytes(self._to_bytes(content))
+            logger.debug(f"Generated file: {file_path}")
+
+        logger.info(f"Wrote {len(files)} files to {output_path}")
+        return output_path
+
+    def write_incremental(
+        self,
+        output_path: Path,
+        files: Dict[str, FileContent],
+        previous_files: Optional[Dict[str, FileContent]] = None
+    ) -> Dict[str, List[str]]:
+        """
+        Synchronise a stable output directory with the generated files
+
+        Each file is hashed and compared with the manifest left by the
+        previous run: unchanged files are not touched, new and modified files
+        are written atomically (temporary file + rename) and files that are
+        no longer generated are removed.
+
+        Args:
+            output_path: Stable directory reused across generations
+            files: Mapping of relative file path to content
+            previous_files: Files of the previous write to this directory,
+                when the caller kept them (watch mode). Files whose content
+                equals their previous content are not hashed again; asset
+                paths must be left out once the asset itself was edited.
+
+        Returns:
+            Manifest with the added, changed, removed and unchanged paths
+        """
+        output_path.mkdir(parents=True, exist_ok=True)
+        previous = self._read_manifest(output_path)
+        current: Dict[str, str] = {}
+
+        manifest: Dict[str, List[str]] = {
+            "added": [],
+            "changed": [],
+            "removed": [],
+            "unchanged": [],
+        }
+
+        for filename, content in files.items():
+            if previous_files is not None and filename in previous:
+                known = previous_files.get(filename)
+                if known is not None and known == content:
+                    current[filename] = previous[filename]
+                    manifest["unchanged"].append(filename)
+                    continue
+
+            if isinstance(content, Path):
+                data = None
+                digest = self._file_digest(content)
+            else:
+                data = self._to_bytes(content)
+                digest = hashlib.sha256(data).hexdigest()
+            current[filename] = digest
+            file_path = output_path / filename
+
+            if previous.get(filename) == digest and file_path.exists():
+                manifest["unchanged"].append(filename)
+                continue
+
+            if data is None:
+                self._atomic_copy(content, file_path)
+            else:
+                self._atomic_write(file_path, data)
+            manifest["changed" if filename in previous else "added"].append(filename)
+
+        for filename in previous.keys() - current.keys():
+            (output_path / filename).unlink(missing_ok=True)
+            manifest["removed"].append(filename)
+
+        manifest["removed"].sort()
+        if current != previous:
+            self._atomic_write(
+                output_path / self.MANIFEST_NAME,
+                json.dumps(current, indent=2, sort_keys=True).encode("utf-8")
+            )
+
+        logger.info(
+            f"Incremental write to {output_path}: "
+            f"{len(manifest['added'])} added, {len(manifest['changed'])} changed, "
+            f"{len(manifest['removed'])} removed, {len(manifest['unchanged'])} unchanged"
+        )
+        return manifest
+
+    def _read_manifest(self, output_path: Path) -> Dict[str, str]:
+        """Load the manifest of the previous incremental run, if any"""
+        manifest_path = output_path / self.MANIFEST_NAME
+        if not manifest_path.exists():
+            return {}
+        try:
+            return json.loads(manifest_path.read_text())
+        except (json.JSONDecodeError, OSError) as e:
+            logger.warning(f"Ignoring unreadable manifest {manifest_path}: {e}")
+            return {}
+
+    def copy_file(self, source: Path, target: Path, mode: Optional[str] = None) -> None:
+        """
+        Copy a verbatim file without passing its content through Python
+
+        Args:
+            source: File to copy
+            target: Destination path (its directory must exist)
+            mode: "copy" (kernel-side copy) or "hardlink" (defaults to
+                settings.ASSET_COPY_MODE); a hard link that cannot be made,
+                e.g. across file systems, falls back to a copy
+        """
+        mode = mode or settings.ASSET_COPY_MODE
+        if mode not in ASSET_COPY_MODES:
+            raise ValueError(f"Unsupported asset copy mode: {mode}")
+
+        if mode == "hardlink":
+            try:
+                os.link(source, target)
+                return
+            except FileExistsError:
+                target.unlink()
+                return self.copy_file(source, target, mode)
+            except OSError as e:
+                logger.debug(f"Cannot hard link {source}, copying it instead: {e}")
+
+        src = os.open(source, os.O_RDONLY)
+        try:
+            dst = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                self._copy_fd(src, dst)
+            finally:
+                os.close(dst)
+        finally:
+            os.close(src)
+
+    @staticmethod
+    def _copy_fd(src: int, dst: int) -> None:
+        """Copy until EOF with copy_file_range, else sendfile, else read/write"""
+        try:
+            while os.copy_file_range(src, dst, _COPY_CHUNK):
+                pass
+            return
+        except (AttributeError, OSError):
+            # Not supported by the platform or between these file systems;
+            # both offsets have advanced together, so the next method resumes
+            pass
+        try:
+            while os.sendfile(dst, src, None, _COPY_CHUNK):
+                pass
+            return
+        except (AttributeError, OSError):
+            pass
+        while True:
+            block = os.read(src, _COPY_CHUNK)
+            if not block:
+                break
+            while block:
+                block = block[os.write(dst, block):]
+
+    def _atomic_copy(self, source: Path, file_path: Path) -> None:
+        """Copy a verbatim file to a temporary name in the same directory, then rename it"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        os.close(fd)
+        try:
+            self.copy_file(source, Path(tmp_name))
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as source:
+            for block in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(block)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _atomic_write(file_path: Path, data: bytes) -> None:
+        """Write to a temporary file in the same directory, then rename it"""
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(data)
+            os.replace(tmp_name, file_path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    @staticmethod
+    def _to_bytes(content: FileContent) -> bytes:
+        if isinstance(content, Path):
+            return content.read_bytes()
+        return content if isinstance(content, bytes) else content.encode("utf-8")
+
+
+# Singleton instance
+output_writer = OutputWriter()
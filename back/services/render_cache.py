@@ -0,0 +1,217 @@
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from pathlib import Path
+import hashlib
+import pickle
+import logging
+import threading
+import time
+
+from config import settings
+from services.sqlite_lru import SQLiteLRUStore
+
+logger = logging.getLogger(__name__)
+
+# SQLite's default limit on host parameters is 999
+_BATCH_SIZE = 500
+
+# Fixed so that keys stay stable across Python versions
+_PICKLE_PROTOCOL = 5
+
+
+def hash_value(value: Any) -> str:
+    """
+    Hash a template context made of builtin types
+
+    The context is pickled rather than dumped to JSON, which is about three
+    times faster on generator contexts. Identical bytes imply equal values,
+    so a stale hit is impossible; an equal value built differently (other
+    dict order, shared sub-objects) only costs a cache miss.
+
+    Args:
+        value: Template context or part of it
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(pickle.dumps(value, protocol=_PICKLE_PROTOCOL)).hexdigest()
+
+
+def make_render_key(template_digest: str, context_digest: str, config_digest: str) -> str:
+    """
+    Build the cache key of a rendered file
+
+    Args:
+        template_digest: TemplateManifest.digest of the template
+        context_digest: Hash of the context the template is rendered with
+        config_digest: Hash of the global configuration of the application
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    return hashlib.sha256(f"{template_digest}:{context_digest}:{config_digest}".encode("ascii")).hexdigest()
+
+
+class RenderCache(ABC):
+    """Interface of rendered template caches"""
+
+    @abstractmethod
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        """Return the cached output of every key found"""
+
+    @abstractmethod
+    def set_many(self, items: Mapping[str, str]) -> None:
+        """Store rendered outputs"""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Drop every entry"""
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """Return the backend name and its counters"""
+
+
+class NullRenderCache(RenderCache):
+    """Backend used when caching is disabled"""
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        return {}
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        pass
+
+    def clear(self) -> None:
+        pass
+
+    def stats(self) -> Dict[str, Any]:
+        return {"backend": "none"}
+
+
+class SQLiteRenderCache(RenderCache):
+    """Rendered template cache stored in a local SQLite database
+
+    A whole generation is looked up and stored in batches, in one
+    transaction each. When the stored outputs exceed ``max_bytes`` the least
+    recently used entries are evicted; entries of edited templates or
+    changed models are never hit again and age out the same way.
+    """
+
+    def __init__(self, path: Path, max_bytes: int):
+        """
+        Initialize the cache
+
+        Args:
+            path: SQLite database file (":memory:" for a private in-memory cache)
+            max_bytes: Upper bound of the stored outputs size
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._store = SQLiteLRUStore(path, "render_cache", max_bytes)
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        found: Dict[str, str] = {}
+        store = self._store
+        with store.lock:
+            for start in range(0, len(keys), _BATCH_SIZE):
+                batch = keys[start:start + _BATCH_SIZE]
+                placeholders = ",".join("?" * len(batch))
+                found.update(store.conn.execute(
+                    f"SELECT key, value FROM render_cache WHERE key IN ({placeholders})", batch
+                ))
+            if found:
+                now = time.time()
+                store.conn.executemany(
+                    "UPDATE render_cache SET accessed_at = ? WHERE key = ?", [(now, key) for key in found]
+                )
+                store.conn.commit()
+            self.hits += len(found)
+            self.misses += len(keys) - len(found)
+        return found
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        now = time.time()
+        rows: List[Tuple[str, str, int, float]] = []
+        for key, value in items.items():
+            size = len(value.encode("utf-8"))
+            if size <= self.max_bytes:
+                rows.append((key, value, size, now))
+        if not rows:
+            return
+
+        store = self._store
+        with store.lock:
+            store.conn.executemany(
+                "INSERT OR REPLACE INTO render_cache (key, value, size, accessed_at) VALUES (?, ?, ?, ?)", rows
+            )
+            store.evict()
+            store.conn.commit()
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        entries, total = self._store.usage()
+        return {
+            "backend": "sqlite",
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self._store.evictions,
+        }
+
+
+class MemoryRenderCache(RenderCache):
+    """Outputs of the latest generation kept in memory in front of another cache
+
+    Used when the same project is generated over and over (watch mode): the
+    files of unchanged models are served from memory without a database
+    round trip. Each lookup keeps only the entries it was asked for, so the
+    memory held is about one generated project.
+    """
+
+    def __init__(self, backend: RenderCache):
+        self.backend = backend
+        self.hits = 0
+        self._entries: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Iterable[str]) -> Dict[str, str]:
+        keys = list(dict.fromkeys(keys))
+        with self._lock:
+            entries = self._entries
+            found = {key: entries[key] for key in keys if key in entries}
+        missing = [key for key in keys if key not in found]
+        if missing:
+            found.update(self.backend.get_many(missing))
+        with self._lock:
+            self._entries = dict(found)
+            self.hits += len(keys) - len(missing)
+        return found
+
+    def set_many(self, items: Mapping[str, str]) -> None:
+        with self._lock:
+            self._entries.update(items)
+        self.backend.set_many(items)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries = {}
+        self.backend.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._entries)
+        return {**self.backend.stats(), "memory_entries": entries, "memory_hits": self.hits}
+
+
+def create_render_cache(path: Optional[Path] = None) -> RenderCache:
+    """Build the render cache selected by the settings"""
+    if not settings.RENDER_CACHE_ENABLED:
+        return NullRenderCache()
+    return SQLiteRenderCache(path or settings.RENDER_CACHE_PATH, max_bytes=settings.RENDER_CACHE_MAX_BYTES)
@@ -0,0 +1,169 @@
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import asyncio
+import logging
+import os
+
+from services.template_service import TemplateService, template_service
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+RenderJob = Tuple[str, Dict[str, Any]]
+
+# Template service owned by each worker process of a process pool
+_worker_template_service: Optional[TemplateService] = None
+
+
+def _init_worker(templates_dir: str) -> None:
+    """Build a private template service in a freshly started worker process"""
+    global _worker_template_service
+    _worker_template_service = TemplateService(templates_dir=Path(templates_dir))
+
+
+def _render_in_worker(template_name: str, context: Dict[str, Any]) -> str:
+    """Render a template inside a worker process"""
+    return _worker_template_service.render_template(template_name, context)
+
+
+def _render_batch_in_worker(
+    shared: Dict[str, Any],
+    jobs: Sequence[RenderJob]
+) -> List[Union[str, BaseException]]:
+    """Render a batch of jobs inside a worker process, all with the same shared context"""
+    results: List[Union[str, BaseException]] = []
+    for template_name, context in jobs:
+        try:
+            results.append(_worker_template_service.render_template(template_name, {**shared, **context}))
+        except Exception as e:
+            results.append(e)
+    return results
+
+
+class RenderExecutor:
+    """Renders templates off the event loop on a thread or process pool"""
+
+    def __init__(
+        self,
+        mode: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        templates: Optional[TemplateService] = None
+    ):
+        """
+        Initialize the render executor
+
+        Args:
+            mode: 'thread' or 'process' (defaults to settings.RENDER_EXECUTOR)
+            max_workers: Pool size, 0 meaning one worker per CPU
+                (defaults to settings.RENDER_WORKERS)
+            templates: Template service used by the thread pool
+        """
+        self.mode = (mode or settings.RENDER_EXECUTOR).lower()
+        if self.mode not in ("thread", "process"):
+            raise ValueError(f"Unsupported render executor: {self.mode}")
+
+        workers = settings.RENDER_WORKERS if max_workers is None else max_workers
+        self.max_workers = workers or os.cpu_count() or 1
+        self.template_service = templates or template_service
+        self._executor: Optional[Executor] = None
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.mode == "process":
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    initializer=_init_worker,
+                    initargs=(str(self.template_service.templates_dir),)
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="render"
+                )
+            logger.info(f"Started {self.mode} render pool with {self.max_workers} workers")
+        return self._executor
+
+    async def render(self, template_name: str, context: Dict[str, Any]) -> str:
+        """
+        Render a single template on the pool
+
+        Args:
+            template_name: Name of the template file
+            context: Dictionary of variables to pass to the template
+
+        Returns:
+            Rendered template as a string
+        """
+        loop = asyncio.get_running_loop()
+        if self.mode == "process":
+            return await loop.run_in_executor(
+                self._get_executor(), _render_in_worker, template_name, context
+            )
+        return await loop.run_in_executor(
+            self._get_executor(), self.template_service.render_template, template_name, context
+        )
+
+    async def render_many(
+        self,
+        jobs: Sequence[RenderJob],
+        shared: Optional[Dict[str, Any]] = None
+    ) -> List[Union[str, BaseException]]:
+        """
+        Render several templates concurrently
+
+        A failing job does not cancel the others: its exception is returned
+        in place of the content so callers can fall back per job.
+
+        In process mode the jobs are sent in one batch per worker, so the
+        shared context is pickled once per worker rather than once per job.
+
+        Args:
+            jobs: (template name, context) pairs
+            shared: Variables common to every job (e.g. the whole diagram),
+                overridden by the job's own context
+
+        Returns:
+            Rendered content or exception for each job, in order
+        """
+        shared = shared or {}
+        if self.mode == "process":
+            return await self._render_batches(jobs, shared)
+        return await asyncio.gather(
+            *(self.render(name, {**shared, **context}) for name, context in jobs),
+            return_exceptions=True
+        )
+
+    async def _render_batches(
+        self,
+        jobs: Sequence[RenderJob],
+        shared: Dict[str, Any]
+    ) -> List[Union[str, BaseException]]:
+        """Split the jobs into one contiguous batch per worker"""
+        if not jobs:
+            return []
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        size = -(-len(jobs) // self.max_workers)
+        batches = [jobs[i:i + size] for i in range(0, len(jobs), size)]
+        outcomes = await asyncio.gather(
+            *(loop.run_in_executor(executor, _render_batch_in_worker, shared, batch) for batch in batches),
+            return_exceptions=True
+        )
+
+        results: List[Union[str, BaseException]] = []
+        for batch, outcome in zip(batches, outcomes):
+            # A batch fails as a whole when the pool breaks or a result
+            # cannot be sent back
+            results.extend([outcome] * len(batch) if isinstance(outcome, BaseException) else outcome)
+        return results
+
+    def shutdown(self) -> None:
+        """Stop the worker pool; it is recreated on next use"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+
+# Singleton instance
+render_executor = RenderExecutor()
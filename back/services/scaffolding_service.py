@@ -1,15 +1,24 @@
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional, Tuple
 from pathlib import Path
+import asyncio
+import functools
 import logging
+import re
 from datetime import datetime
 
 from services.template_service import template_service
 from services.llm_service import llm_service
+from services.output_writer import output_writer
+from services.render_executor import render_executor
 from models.uml import UMLDiagram, Class, Relation
+from models.diagram_index import DiagramIndex
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Resolves the LLM insights once they are needed (None without insights)
+InsightsProvider = Callable[[], Awaitable[Optional[str]]]
+
 
 class ScaffoldingService:
     """Service for generating code scaffolding from UML diagrams"""
@@ -17,6 +26,8 @@ class ScaffoldingService:
     def __init__(self):
         self.template_service = template_service
         self.llm_service = llm_service
+        self.output_writer = output_writer
+        self.render_executor = render_executor
         self.output_dir = settings.OUTPUT_DIR
         self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -25,7 +36,10 @@ class ScaffoldingService:
         uml_data: Dict[str, Any],
         language: str = "python",
         framework: Optional[str] = None,
-        use_llm: bool = False
+        use_llm: bool = False,
+        use_llm_cache: bool = True,
+        incremental: bool = False,
+        project_name: Optional[str] = None
     ) -> Dict[str, Any]:
         """
         Generate code scaffolding from UML diagram
@@ -35,66 +49,159 @@ class ScaffoldingService:
             language: Target programming language
             framework: Optional framework (e.g., 'fastapi', 'django', 'express')
             use_llm: Whether to use LLM for enhanced generation
+            use_llm_cache: Reuse cached LLM insights of an identical diagram
+            incremental: Sync a stable project directory instead of writing
+                a new timestamped one
+            project_name: Name of the stable directory in incremental mode
             
         Returns:
             Dictionary containing generated files and metadata
         """
+        generated_files, llm_insights = await self.render_from_uml(
+            uml_data,
+            language=language,
+            framework=framework,
+            use_llm=use_llm,
+            use_llm_cache=use_llm_cache
+        )
+        
+        # Save files to output directory
+        manifest = None
+        if incremental:
+            output_path, manifest = self._save_incremental(generated_files, language, project_name)
+        else:
+            output_path = self._save_generated_files(generated_files, language)
+        
+        return {
+            "success": True,
+            "language": language,
+            "framework": framework,
+            "output_path": str(output_path),
+            "files": list(generated_files.keys()),
+            "llm_insights": llm_insights,
+            "manifest": manifest,
+            "timestamp": datetime.now().isoformat()
+        }
+    
+    async def render_from_uml(
+        self,
+        uml_data: Dict[str, Any],
+        language: str = "python",
+        framework: Optional[str] = None,
+        use_llm: bool = False,
+        use_llm_cache: bool = True
+    ) -> Tuple[Dict[str, str], Optional[str]]:
+        """
+        Render the code scaffolding of a UML diagram without writing it
+        
+        Args:
+            uml_data: UML diagram data with classes and relations
+            language: Target programming language
+            framework: Optional framework (e.g., 'fastapi', 'django', 'express')
+            use_llm: Whether to use LLM for enhanced generation
+            use_llm_cache: Reuse cached LLM insights of an identical diagram
+            
+        Returns:
+            Mapping of relative file path to content, and the LLM insights
+        """
         logger.info(f"Generating {language} code from UML diagram")
         
         # Parse UML data
         uml_diagram = UMLDiagram(**uml_data)
+        index = DiagramIndex.from_diagram(uml_diagram)
         
-        # Get LLM insights if requested
-        llm_insights = None
+        # Get LLM insights if requested; in pipelined mode the request runs
+        # while the insight-independent files are rendered
+        insights_task = None
+        deadline = None
         if use_llm:
-            llm_insights = await self.llm_service.generate_code_from_uml(
-                uml_data, 
-                target_language=language
+            insights_task = asyncio.create_task(
+                self.llm_service.generate_code_from_uml(
+                    uml_data, 
+                    target_language=language,
+                    use_cache=use_llm_cache
+                )
             )
-            logger.info(f"LLM insights: {llm_insights}")
+            if settings.SCAFFOLDING_LLM_MODE == "pipelined":
+                deadline = asyncio.get_running_loop().time() + settings.LLM_INSIGHTS_TIMEOUT
+            else:
+                await insights_task
+        insights = functools.partial(self._await_insights, insights_task, deadline)
         
         # Generate code based on language
         generated_files = {}
         
-        if language.lower() == "python":
-            generated_files = await self._generate_python_code(
-                uml_diagram, 
-                framework,
-                llm_insights
-            )
-        elif language.lower() == "typescript":
-            generated_files = await self._generate_typescript_code(
-                uml_diagram,
-                framework,
-                llm_insights
-            )
-        elif language.lower() == "csharp":
-            generated_files = await self._generate_csharp_code(
-                uml_diagram,
-                framework,
-                llm_insights
-            )
-        else:
-            raise ValueError(f"Unsupported language: {language}")
+        try:
+            if language.lower() == "python":
+                generated_files = await self._generate_python_code(
+                    uml_diagram,
+                    index,
+                    framework,
+                    insights
+                )
+            elif language.lower() == "typescript":
+                generated_files = await self._generate_typescript_code(
+                    uml_diagram,
+                    index,
+                    framework,
+                    insights
+                )
+            elif language.lower() == "csharp":
+                generated_files = await self._generate_csharp_code(
+                    uml_diagram,
+                    index,
+                    framework,
+                    insights
+                )
+            else:
+                raise ValueError(f"Unsupported language: {language}")
+            
+            llm_insights = await insights()
+        finally:
+            if insights_task is not None and not insights_task.done():
+                insights_task.cancel()
         
-        # Save files to output directory
-        output_path = self._save_generated_files(generated_files, language)
+        if llm_insights:
+            logger.info(f"LLM insights: {llm_insights}")
         
-        return {
-            "success": True,
-            "language": language,
-            "framework": framework,
-            "output_path": str(output_path),
-            "files": list(generated_files.keys()),
-            "llm_insights": llm_insights,
-            "timestamp": datetime.now().isoformat()
-        }
+        return generated_files, llm_insights
+    
+    @staticmethod
+    async def _await_insights(task: Optional[asyncio.Task], deadline: Optional[float]) -> Optional[str]:
+        """
+        Wait for the LLM insights until the deadline
+        
+        Args:
+            task: The running LLM request, or None without insights
+            deadline: Event loop time after which generation continues
+                without insights, or None to wait for the answer
+            
+        Returns:
+            The insights, or None if there are none or the request timed out
+        """
+        if task is None:
+            return None
+        if not task.done() and deadline is not None:
+            timeout = max(deadline - asyncio.get_running_loop().time(), 0)
+            try:
+                await asyncio.wait_for(asyncio.shield(task), timeout)
+            except asyncio.TimeoutError:
+                task.cancel()
+                logger.warning(
+                    f"LLM insights not received within {settings.LLM_INSIGHTS_TIMEOUT}s, "
+                    "continuing without them"
+                )
+                return None
+        if task.cancelled():
+            return None
+        return await task
     
     async def _generate_python_code(
         self,
         uml_diagram: UMLDiagram,
+        index: DiagramIndex,
         framework: Optional[str],
-        llm_insights: Optional[str]
+        insights: InsightsProvider
     ) -> Dict[str, str]:
         """Generate Python code from UML diagram"""
         generated_files = {}
@@ -107,35 +214,40 @@ class ScaffoldingService:
         else:
             class_template = "python/class.py.jinja2"
         
-        # Generate models for each class
+        # Only wait for the LLM when the template actually uses its insights
+        llm_insights = None
+        if "llm_insights" in self.template_service.template_variables(class_template):
+            llm_insights = await insights()
+        
+        # Build one render job per class
+        class_relations = []
+        jobs = []
         for cls in uml_diagram.classes:
-            # Find relations for this class
-            relations = [
-                r for r in uml_diagram.relations 
-                if r.sourceId == cls.id or r.targetId == cls.id
-            ]
+            relations = index.relations_for(cls.id)
+            class_relations.append(relations)
             
             context = {
                 "class": cls,
                 "relations": relations,
-                "all_classes": uml_diagram.classes,
-                "timestamp": datetime.now().isoformat(),
-                "llm_insights": llm_insights
+                "timestamp": datetime.now().isoformat()
             }
-            
-            try:
-                content = self.template_service.render_template(class_template, context)
-                filename = f"{cls.name.lower()}.py"
-                generated_files[filename] = content
-            except Exception as e:
+            jobs.append((class_template, context))
+        
+        # Render all classes concurrently on the render pool; the diagram is
+        # shared by every job and sent to each worker once
+        shared = {"all_classes": uml_diagram.classes, "llm_insights": llm_insights}
+        results = await self.render_executor.render_many(jobs, shared)
+        
+        for cls, relations, content in zip(uml_diagram.classes, class_relations, results):
+            filename = f"{cls.name.lower()}.py"
+            if isinstance(content, BaseException):
                 logger.warning(f"Template {class_template} not found, using default")
                 # Fallback to string template
                 content = self._generate_python_class_default(cls, relations)
-                filename = f"{cls.name.lower()}.py"
-                generated_files[filename] = content
+            generated_files[filename] = content
         
-        # Generate __init__.py
-        generated_files["__init__.py"] = self._generate_python_init(uml_diagram)
+        # Generate __init__.py, whose header carries the insights
+        generated_files["__init__.py"] = self._generate_python_init(uml_diagram, await insights())
         
         return generated_files
     
@@ -189,12 +301,17 @@ class ScaffoldingService:
         
         return "\n".join(lines)
     
-    def _generate_python_init(self, uml_diagram: UMLDiagram) -> str:
+    def _generate_python_init(self, uml_diagram: UMLDiagram, llm_insights: Optional[str] = None) -> str:
         """Generate __init__.py file"""
-        lines = [
+        lines = []
+        if llm_insights:
+            lines.append("# Design notes:")
+            lines.extend(f"# {line}".rstrip() for line in llm_insights.strip().splitlines())
+            lines.append("")
+        lines.extend([
             '"""Generated models from UML diagram"""',
             "",
-        ]
+        ])
         
         for cls in uml_diagram.classes:
             lines.append(f"from .{cls.name.lower()} import {cls.name}")
@@ -210,8 +327,9 @@ class ScaffoldingService:
     async def _generate_typescript_code(
         self,
         uml_diagram: UMLDiagram,
+        index: DiagramIndex,
         framework: Optional[str],
-        llm_insights: Optional[str]
+        insights: InsightsProvider
     ) -> Dict[str, str]:
         """Generate TypeScript code from UML diagram"""
         # Similar implementation for TypeScript
@@ -222,8 +340,9 @@ class ScaffoldingService:
     async def _generate_csharp_code(
         self,
         uml_diagram: UMLDiagram,
+        index: DiagramIndex,
         framework: Optional[str],
-        llm_insights: Optional[str]
+        insights: InsightsProvider
     ) -> Dict[str, str]:
         """Generate C# code from UML diagram"""
         # Similar implementation for C#
@@ -235,14 +354,24 @@ class ScaffoldingService:
         """Save generated files to output directory"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_path = self.output_dir / f"{language}_{timestamp}"
-        output_path.mkdir(parents=True, exist_ok=True)
-        
-        for filename, content in files.items():
-            file_path = output_path / filename
-            file_path.write_text(content)
-            logger.info(f"Generated file: {file_path}")
-        
-        return output_path
+        return self.output_writer.write_snapshot(output_path, files)
+    
+    def _save_incremental(
+        self,
+        files: Dict[str, str],
+        language: str,
+        project_name: Optional[str]
+    ) -> Tuple[Path, Dict[str, List[str]]]:
+        """Sync generated files into the stable directory of a project"""
+        output_path = self.output_dir / self.project_dir_name(language, project_name)
+        manifest = self.output_writer.write_incremental(output_path, files)
+        return output_path, manifest
+    
+    @staticmethod
+    def project_dir_name(language: str, project_name: Optional[str]) -> str:
+        """Stable directory (or archive) name of a generated project"""
+        slug = re.sub(r"[^A-Za-z0-9_-]+", "_", project_name or "default").strip("_") or "default"
+        return f"{language}_{slug}"
 
 
 # Singleton instance
@@ -0,0 +1,284 @@
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional
+import copy
+import json
+import logging
+import re
+
+from pydantic import ValidationError
+
+from models.app_spec import ApplicationSpec
+from models.spec_ir import ApplicationIR, ModelIR, PropertyIR, RelationIR
+from services.dsl_validation_service import dsl_validation_service
+from services.naming import camel_name, kebab_name, pascal_name, plural_name, upper_snake_name
+from services.type_system import LEGACY_TYPES, resolve_property_type
+
+logger = logging.getLogger(__name__)
+
+# Columns every generated model gets from BaseModel and IArchivable; spec
+# properties with these names are not generated twice
+BASE_MODEL_FIELDS = frozenset({"Id", "CreatedAt", "UpdatedAt", "ArchivedAt"})
+
+# The project name becomes directory and file names, the archive root and the
+# download file name: a single path segment without separators or quotes
+_PROJECT_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_.-]*")
+
+
+class _ModelBuilder:
+    """Mutable model while relations are still being attached"""
+
+    __slots__ = ("name", "properties", "relations")
+
+    def __init__(self, name: str, properties: List[PropertyIR]):
+        self.name = name
+        self.properties = properties
+        self.relations: List[RelationIR] = []
+
+    def add_reference(self, target: str, foreign_key: str) -> None:
+        self.relations.append(RelationIR("reference", target, target, foreign_key))
+
+    def add_collection(self, target: str) -> None:
+        self.relations.append(RelationIR("collection", target, plural_name(target), None))
+
+    def build(self) -> ModelIR:
+        relations = tuple(self.relations)
+        foreign_keys = tuple(relation.foreign_key for relation in relations if relation.kind == "reference")
+        return ModelIR(
+            name=self.name,
+            plural=plural_name(self.name),
+            camel=camel_name(self.name),
+            kebab=kebab_name(self.name),
+            upper_snake=upper_snake_name(self.name),
+            properties=tuple(self.properties),
+            relations=relations,
+            has_relationships=bool(foreign_keys),
+            has_collections=any(relation.kind == "collection" for relation in relations),
+            # Every generated model is soft-deleted through IArchivable
+            is_archivable=True,
+            foreign_keys=foreign_keys,
+        )
+
+
+class SpecNormalizer:
+    """Turns DSL and legacy application specs into an ApplicationIR
+
+    Each property is visited once: its names, types (services/type_system)
+    and C# default are resolved there, and every generator reads the
+    resulting immutable objects instead of re-deriving them per template.
+    """
+
+    def normalize(
+        self,
+        spec: Dict[str, Any],
+        document_id: Optional[str] = None,
+        changed: Optional[List[str]] = None
+    ) -> ApplicationIR:
+        """
+        Validate a specification and build its intermediate representation
+
+        DSL specs are checked against docs/schema.json; legacy specs are
+        parsed with ApplicationSpec and their types and relations mapped onto
+        the DSL ones.
+
+        Args:
+            spec: Application specification (DSL format with ``config`` and
+                ``models``, or the legacy format of models/app_spec.py)
+            document_id: Validate a DSL spec incrementally against the
+                previous version of this document (see
+                DSLValidationService.validate_incremental)
+            changed: JSON pointers changed since that previous version
+
+        Returns:
+            The normalised application
+
+        Raises:
+            ValueError: If the specification is invalid
+        """
+        if not isinstance(spec, dict):
+            raise ValueError("Specification must be a JSON object")
+        if "config" in spec:
+            return self._normalize_dsl_spec(spec, document_id, changed)
+        return self._normalize_legacy_spec(spec)
+
+    def _normalize_dsl_spec(
+        self,
+        spec: Dict[str, Any],
+        document_id: Optional[str],
+        changed: Optional[List[str]]
+    ) -> ApplicationIR:
+        if document_id is None:
+            result = dsl_validation_service.validate_spec(spec)
+        else:
+            result = dsl_validation_service.validate_incremental(spec, document_id, changed=changed)
+        if not result["valid"]:
+            details = "; ".join(f"{error['path']}: {error['message']}" for error in result["errors"][:10])
+            raise ValueError(f"{result['error_count']} errors: {details}")
+
+        config = spec["config"]
+        project_name = self._project_name(config["project_name"])
+        models = []
+        for model in spec["models"]:
+            name = pascal_name(model["name"])
+            properties = [
+                self._property(
+                    name,
+                    prop["name"],
+                    prop["type"],
+                    required=prop.get("required", True),
+                    nullable=prop.get("nullable", False),
+                    unique=prop.get("unique", False),
+                    max_length=prop.get("max_length"),
+                    min_value=prop.get("min_value"),
+                    max_value=prop.get("max_value"),
+                    default=prop.get("default"),
+                    label=prop.get("label") or prop["name"],
+                    options=prop.get("options") or (),
+                )
+                for prop in model["properties"]
+                if pascal_name(prop["name"]) not in BASE_MODEL_FIELDS
+            ]
+            models.append(_ModelBuilder(name, properties).build())
+
+        return ApplicationIR(
+            project_name=project_name,
+            namespace=f"{project_name}_api",
+            description=config.get("description", ""),
+            # A private copy: the IR must not change with the caller's spec
+            config=MappingProxyType(copy.deepcopy(config)),
+            models=tuple(models),
+        )
+
+    def _normalize_legacy_spec(self, spec: Dict[str, Any]) -> ApplicationIR:
+        try:
+            parsed = ApplicationSpec(**spec)
+        except ValidationError as e:
+            raise ValueError(str(e)) from e
+
+        project_name = self._project_name(parsed.project_name)
+        models: Dict[str, _ModelBuilder] = {}
+        for model in parsed.models:
+            name = pascal_name(model.name)
+            properties = []
+            for prop in model.properties:
+                # Every generated model inherits its key from BaseModel
+                if prop.isPrimaryKey or prop.name.lower() == "id":
+                    continue
+                dsl_type = LEGACY_TYPES.get(prop.type.lower())
+                if dsl_type is None:
+                    raise ValueError(f"{model.name}.{prop.name}: unsupported type {prop.type}")
+                if pascal_name(prop.name) in BASE_MODEL_FIELDS:
+                    continue
+                properties.append(self._property(
+                    name,
+                    camel_name(prop.name),
+                    dsl_type,
+                    required=prop.isRequired,
+                    nullable=not prop.isRequired,
+                    unique=prop.isUnique,
+                    max_length=prop.maxLength,
+                    default=prop.defaultValue,
+                    label=prop.name,
+                ))
+            models[model.name] = _ModelBuilder(name, properties)
+
+        for relation in parsed.relations:
+            source = models.get(relation.from_model)
+            target = models.get(relation.to_model)
+            if source is None or target is None:
+                raise ValueError(
+                    f"Relation {relation.name} links unknown models {relation.from_model} -> {relation.to_model}"
+                )
+            if relation.type in ("many-to-one", "one-to-one"):
+                owner, referenced = source, target
+            elif relation.type == "one-to-many":
+                owner, referenced = target, source
+            elif relation.type == "many-to-many":
+                source.add_collection(target.name)
+                target.add_collection(source.name)
+                continue
+            else:
+                raise ValueError(f"Relation {relation.name}: unsupported type {relation.type}")
+
+            owner.add_reference(referenced.name, pascal_name(relation.foreignKey or f"{referenced.name}Id"))
+            if relation.type == "one-to-many":
+                referenced.add_collection(owner.name)
+
+        return ApplicationIR(
+            project_name=project_name,
+            namespace=f"{project_name}_api",
+            description=parsed.description,
+            config=MappingProxyType({
+                "database": parsed.database.model_dump(),
+                "frontend": {"framework": parsed.frontend.framework},
+            }),
+            models=tuple(builder.build() for builder in models.values()),
+        )
+
+    @staticmethod
+    def _project_name(name: str) -> str:
+        """Check that a project name is safe to use as a path segment"""
+        if not _PROJECT_NAME.fullmatch(name) or ".." in name:
+            raise ValueError(
+                f"Invalid project name {name!r}: use letters, digits, '_', '.' and '-', "
+                "starting with a letter or '_'"
+            )
+        return name
+
+    @staticmethod
+    def _property(
+        model_name: str,
+        name: str,
+        dsl_type: str,
+        required: bool,
+        nullable: bool,
+        unique: bool,
+        max_length: Optional[int],
+        default: Any,
+        label: str,
+        min_value: Optional[float] = None,
+        max_value: Optional[float] = None,
+        options: Any = (),
+    ) -> PropertyIR:
+        """Resolve the names, types and C# default of a property"""
+        optional = not required or nullable
+        prop_type = resolve_property_type(dsl_type, max_length, optional)
+        pascal = pascal_name(name)
+        if prop_type.is_reference and not pascal.endswith("Id"):
+            pascal += "Id"
+
+        csharp_default = None
+        if default is not None:
+            if isinstance(default, bool):
+                csharp_default = "true" if default else "false"
+            elif isinstance(default, (int, float)):
+                csharp_default = f"{default}m" if dsl_type == "number" else str(default)
+            elif dsl_type in ("text", "textarea", "select"):
+                csharp_default = json.dumps(str(default))
+        elif dsl_type == "multiselect":
+            csharp_default = "new()"
+        elif prop_type.csharp_type == "string" and not optional:
+            csharp_default = "string.Empty"
+
+        return PropertyIR(
+            name=name,
+            pascal=pascal,
+            camel=camel_name(pascal),
+            label=label,
+            label_key=f"{upper_snake_name(model_name)}_{upper_snake_name(name)}",
+            type=prop_type,
+            required=required,
+            nullable=nullable,
+            optional=optional,
+            unique=unique,
+            max_length=max_length,
+            min_value=min_value,
+            max_value=max_value,
+            default=default,
+            csharp_default=csharp_default,
+            options=tuple(options),
+            is_email="email" in name.lower() and dsl_type == "text",
+        )
+
+
+# Singleton instance
+spec_normalizer = SpecNormalizer()
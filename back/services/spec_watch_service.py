@@ -0,0 +1,257 @@
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Set
+import asyncio
+import json
+import logging
+import time
+
+from config import settings
+from models.spec_ir import ModelIR
+from services.application_generator_service import ApplicationGeneratorService
+from services.output_writer import FileContent
+from services.render_cache import MemoryRenderCache, create_render_cache
+
+logger = logging.getLogger(__name__)
+
+
+class SpecWatchSession:
+    """A watched specification and the output of its last generation
+
+    The models and files of the previous generation are kept in memory:
+    unchanged models are served by the render cache and only the files whose
+    content changed are written.
+    """
+
+    def __init__(self, spec_path: Path, generator: ApplicationGeneratorService):
+        self.spec_path = Path(spec_path).resolve()
+        self.generator = generator
+        self.generation = 0
+        self.document_id = f"watch:{self.spec_path}"
+        self._spec: Any = None
+        self._models: Dict[str, ModelIR] = {}
+        self._files: Dict[str, FileContent] = {}
+        self._output_path: Optional[Path] = None
+
+    async def regenerate(self, trigger: str = "spec", template_paths: Iterable[Path] = ()) -> Dict[str, Any]:
+        """
+        Render the specification again and write the files that changed
+
+        Args:
+            trigger: Cause of the regeneration ("start", "spec" or "templates")
+            template_paths: Files of the templates directory changed since
+                the previous generation
+
+        Returns:
+            Event with the added, changed and removed models, the affected
+            templates, the written files and the duration of each stage in
+            milliseconds. When the specification or a template is invalid
+            the event has ``success`` False and the error, and the previous
+            output is left as is.
+        """
+        start = time.perf_counter()
+        self.generation += 1
+        event: Dict[str, Any] = {
+            "generation": self.generation,
+            "trigger": trigger,
+            "spec_path": str(self.spec_path),
+        }
+        timings: Dict[str, float] = {}
+
+        templates: Set[str] = set()
+        template_paths = list(template_paths)
+        if template_paths:
+            stage = time.perf_counter()
+            templates = await asyncio.to_thread(self._refresh_templates, template_paths)
+            timings["templates_ms"] = (time.perf_counter() - stage) * 1000
+        event["templates"] = sorted(templates)
+
+        try:
+            stage = time.perf_counter()
+            spec = json.loads(await asyncio.to_thread(self.spec_path.read_text))
+            timings["read_ms"] = (time.perf_counter() - stage) * 1000
+
+            try:
+                rendered = await self.generator.render_application(
+                    spec, self.document_id, self._changed_pointers(self._spec, spec)
+                )
+            finally:
+                # The validation service now remembers this version
+                self._spec = spec
+            timings.update(rendered["timings"])
+
+            stage = time.perf_counter()
+            output_path = self.generator.output_dir / rendered["project_name"]
+            previous = self._files if output_path == self._output_path else None
+            manifest = await asyncio.to_thread(
+                self.generator.output_writer.write_incremental, output_path, rendered["files"], previous
+            )
+            timings["write_ms"] = (time.perf_counter() - stage) * 1000
+        except Exception as e:
+            # Keep watching: the next save usually fixes it
+            logger.warning(f"Generation {self.generation} of {self.spec_path} failed: {e}")
+            timings["total_ms"] = (time.perf_counter() - start) * 1000
+            event.update(success=False, error=str(e), timings=timings)
+            return event
+
+        models = {model.name: model for model in rendered["application"].models}
+        event.update(
+            success=True,
+            project_name=rendered["project_name"],
+            output_path=str(output_path),
+            models={
+                "added": [name for name in models if name not in self._models],
+                "changed": [
+                    name for name, model in models.items()
+                    if name in self._models and self._models[name] != model
+                ],
+                "removed": [name for name in self._models if name not in models],
+            },
+            render_cache=rendered["render_cache"],
+            files={key: len(paths) for key, paths in manifest.items()},
+            written=sorted(manifest["added"] + manifest["changed"]),
+            removed=manifest["removed"],
+        )
+        self._models = models
+        self._files = rendered["files"]
+        self._output_path = output_path
+
+        timings["total_ms"] = (time.perf_counter() - start) * 1000
+        event["timings"] = timings
+        return event
+
+    @staticmethod
+    def _changed_pointers(previous: Any, spec: Any) -> Optional[List[str]]:
+        """
+        JSON pointers of the parts of a spec that differ from its previous version
+
+        Returns:
+            The changed top-level keys and models (the whole model list when
+            models were added or removed), or None when there is no usable
+            previous version and the spec must be validated in full
+        """
+        if not isinstance(previous, dict) or not isinstance(spec, dict):
+            return None
+        pointers = []
+        for key in sorted(previous.keys() | spec.keys()):
+            before, after = previous.get(key), spec.get(key)
+            if before == after:
+                continue
+            if key == "models" and isinstance(before, list) and isinstance(after, list) and len(before) == len(after):
+                pointers.extend(f"/models/{i}" for i, model in enumerate(after) if model != before[i])
+            else:
+                pointers.append(f"/{key}")
+        return pointers
+
+    def _refresh_templates(self, paths: Iterable[Path]) -> Set[str]:
+        """Re-index changed templates and forget the previous copy of edited assets"""
+        template_service = self.generator.template_service
+        affected = template_service.manifest.refresh(paths)
+        if affected:
+            stale = {template_service.templates_dir / name for name in affected}
+            self._files = {
+                target: content for target, content in self._files.items()
+                if not isinstance(content, Path) or content not in stale
+            }
+        return affected
+
+
+class SpecWatchService:
+    """Regenerates an application whenever its specification or the templates change"""
+
+    def __init__(self, generator: Optional[ApplicationGeneratorService] = None):
+        self._generator = generator
+
+    @property
+    def generator(self) -> ApplicationGeneratorService:
+        """Generator with the render cache of the latest generation kept in memory"""
+        if self._generator is None:
+            self._generator = ApplicationGeneratorService(render_cache=MemoryRenderCache(create_render_cache()))
+        return self._generator
+
+    async def watch(
+        self,
+        spec_path: Path,
+        stop_event: Optional[asyncio.Event] = None,
+        debounce_ms: Optional[int] = None,
+        watch_templates: bool = True
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Generate an application, then regenerate it on every change
+
+        A burst of saves is handled as one change: a regeneration starts
+        once no file changed for ``debounce_ms``. Spec and template changes
+        seen while a generation runs are merged into the next one.
+
+        Args:
+            spec_path: Application specification (JSON)
+            stop_event: Set to stop watching
+            debounce_ms: Quiet period after the last change (defaults to
+                settings.SPEC_WATCH_DEBOUNCE_MS)
+            watch_templates: Also regenerate when the templates change
+
+        Yields:
+            One event per generation (see SpecWatchSession.regenerate)
+
+        Raises:
+            RuntimeError: If watchfiles is not installed
+        """
+        try:
+            from watchfiles import awatch
+        except ImportError as e:
+            raise RuntimeError("Watch mode needs watchfiles (installed with uvicorn[standard])") from e
+
+        session = SpecWatchSession(spec_path, self.generator)
+        step = settings.SPEC_WATCH_DEBOUNCE_MS if debounce_ms is None else debounce_ms
+
+        spec_file = str(session.spec_path)
+        sources = {
+            "spec": awatch(
+                session.spec_path.parent,
+                watch_filter=lambda _, path: path == spec_file,
+                recursive=False,
+                step=step,
+                stop_event=stop_event,
+            ),
+        }
+        if watch_templates:
+            sources["templates"] = awatch(
+                self.generator.template_service.templates_dir.resolve(), step=step, stop_event=stop_event
+            )
+
+        queue: asyncio.Queue = asyncio.Queue()
+        watchers = [asyncio.create_task(self._forward(name, changes, queue)) for name, changes in sources.items()]
+        logger.info(f"Watching {session.spec_path}")
+        try:
+            yield await session.regenerate("start")
+            while True:
+                batches = [await queue.get()]
+                while not queue.empty():
+                    batches.append(queue.get_nowait())
+                if None in batches:
+                    break
+
+                spec_changed = False
+                template_paths: Set[Path] = set()
+                for source, paths in batches:
+                    if source == "spec":
+                        spec_changed = True
+                    else:
+                        template_paths.update(paths)
+                yield await session.regenerate("spec" if spec_changed else "templates", template_paths)
+        finally:
+            for watcher in watchers:
+                watcher.cancel()
+            await asyncio.gather(*watchers, return_exceptions=True)
+
+    @staticmethod
+    async def _forward(source: str, changes: Any, queue: asyncio.Queue) -> None:
+        """Push the batches of a watcher to the queue, then None when it stops"""
+        try:
+            async for batch in changes:
+                await queue.put((source, {Path(path) for _, path in batch}))
+        finally:
+            queue.put_nowait(None)
+
+
+# Singleton instance
+spec_watch_service = SpecWatchService()
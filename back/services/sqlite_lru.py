@@ -0,0 +1,80 @@
+from typing import Iterable, Tuple
+from pathlib import Path
+import logging
+import sqlite3
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteLRUStore:
+    """Size-bounded SQLite table evicting the least recently used entries
+
+    Storage shared by the LLM and render caches. Every row has a key, a text
+    value, its size in bytes and its last access time, plus the extra columns
+    of the cache. The caches run their own statements on ``conn`` while
+    holding ``lock``, then call ``evict`` after a write and commit.
+    """
+
+    def __init__(self, path: Path, table: str, max_bytes: int, columns: Iterable[str] = ()):
+        """
+        Open the database and create the table
+
+        Args:
+            path: SQLite database file (":memory:" for a private in-memory cache)
+            table: Table name
+            max_bytes: Upper bound of the stored values size
+            columns: Extra column definitions, e.g. "created_at REAL NOT NULL"
+        """
+        self.path = path
+        self.table = table
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self.lock = threading.Lock()
+
+        if str(path) != ":memory:":
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        definitions = ["key TEXT PRIMARY KEY", "value TEXT NOT NULL", "size INTEGER NOT NULL", *columns,
+                       "accessed_at REAL NOT NULL"]
+        self.conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({', '.join(definitions)})")
+        self.conn.execute(f"CREATE INDEX IF NOT EXISTS {table}_accessed ON {table} (accessed_at)")
+        self.conn.commit()
+
+    def evict(self) -> int:
+        """
+        Drop the least recently used entries over the size limit
+
+        Must be called with ``lock`` held; the caller commits.
+
+        Returns:
+            Number of entries evicted
+        """
+        total = self.conn.execute(f"SELECT COALESCE(SUM(size), 0) FROM {self.table}").fetchone()[0]
+        if total <= self.max_bytes:
+            return 0
+
+        victims = []
+        for key, size in self.conn.execute(f"SELECT key, size FROM {self.table} ORDER BY accessed_at"):
+            if total <= self.max_bytes:
+                break
+            victims.append((key,))
+            total -= size
+        self.conn.executemany(f"DELETE FROM {self.table} WHERE key = ?", victims)
+        self.evictions += len(victims)
+        logger.debug(f"Evicted {len(victims)} entries from {self.table}")
+        return len(victims)
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self.lock:
+            self.conn.execute(f"DELETE FROM {self.table}")
+            self.conn.commit()
+
+    def usage(self) -> Tuple[int, int]:
+        """Return the number of entries and their total size in bytes"""
+        with self.lock:
+            return self.conn.execute(
+                f"SELECT COUNT(*), COALESCE(SUM(size), 0) FROM {self.table}"
+            ).fetchone()
@@ -0,0 +1,109 @@
+from typing import AsyncIterator, List, Optional
+import asyncio
+import logging
+
+from config import settings
+
+logger = logging.getLogger(__name__)
+
+
+async def coalesce_stream(
+    chunks: AsyncIterator[str],
+    max_chars: Optional[int] = None,
+    max_delay: Optional[float] = None,
+    heartbeat_interval: Optional[float] = None
+) -> AsyncIterator[Optional[str]]:
+    """
+    Merge small text chunks of an upstream stream into larger ones
+
+    Buffered text is flushed once it reaches ``max_chars`` or ``max_delay``
+    seconds after its first chunk arrived, whichever comes first. When
+    nothing has been sent for ``heartbeat_interval`` seconds ``None`` is
+    yielded so the caller can emit a keep-alive.
+
+    The upstream iterator is closed as soon as this generator is closed or
+    cancelled (e.g. when the client disconnects), which releases the LLM
+    slot and stops the model stream instead of consuming it to the end.
+
+    Args:
+        chunks: Upstream text chunks
+        max_chars: Flush threshold in characters (defaults to SSE_COALESCE_MAX_CHARS)
+        max_delay: Longest time text is held back (defaults to
+            SSE_COALESCE_MAX_DELAY, 0 disables coalescing)
+        heartbeat_interval: Idle time before a keep-alive (defaults to
+            SSE_HEARTBEAT_INTERVAL, 0 disables heartbeats)
+
+    Yields:
+        Coalesced text, or None for a heartbeat
+    """
+    max_chars = settings.SSE_COALESCE_MAX_CHARS if max_chars is None else max_chars
+    max_delay = settings.SSE_COALESCE_MAX_DELAY if max_delay is None else max_delay
+    heartbeat_interval = settings.SSE_HEARTBEAT_INTERVAL if heartbeat_interval is None else heartbeat_interval
+
+    loop = asyncio.get_running_loop()
+    iterator = chunks.__aiter__()
+    pending: Optional[asyncio.Future] = None
+    buffer: List[str] = []
+    size = 0
+    flush_at = 0.0
+    last_sent = loop.time()
+
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+
+            if buffer:
+                timeout = max(flush_at - loop.time(), 0)
+            elif heartbeat_interval:
+                timeout = max(last_sent + heartbeat_interval - loop.time(), 0)
+            else:
+                timeout = None
+            done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+            if not done:
+                if buffer:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                else:
+                    yield None
+                last_sent = loop.time()
+                continue
+
+            task, pending = pending, None
+            try:
+                chunk = task.result()
+            except StopAsyncIteration:
+                break
+            except Exception:
+                # Deliver what was received before the failure
+                if buffer:
+                    yield "".join(buffer)
+                raise
+
+            if not chunk:
+                continue
+            if not buffer:
+                flush_at = loop.time() + max_delay
+            buffer.append(chunk)
+            size += len(chunk)
+
+            if size >= max_chars or max_delay <= 0:
+                yield "".join(buffer)
+                buffer, size = [], 0
+                last_sent = loop.time()
+
+        if buffer:
+            yield "".join(buffer)
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except (asyncio.CancelledError, StopAsyncIteration):
+                pass
+            except Exception as e:
+                logger.debug(f"Upstream stream failed while closing: {e}")
+        aclose = getattr(iterator, "aclose", None)
+        if aclose is not None:
+            await aclose()
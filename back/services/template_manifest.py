@@ -0,0 +1,324 @@
+from collections import OrderedDict
+from jinja2 import Environment, TemplateSyntaxError, meta
+from pathlib import Path
+from typing import Callable, Dict, FrozenSet, Iterable, List, Optional, Set
+import hashlib
+import logging
+import os
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Called with the names of the templates whose rendered output may have changed
+InvalidationListener = Callable[[Set[str]], None]
+
+# Listings kept per manifest version; patterns come from API queries, so only
+# the most recently used ones are kept
+MAX_LISTINGS = 64
+
+
+class TemplateEntry:
+    """One file of the templates directory"""
+
+    __slots__ = ("name", "kind", "size", "mtime_ns", "sha256", "dependencies")
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        size: int,
+        mtime_ns: int,
+        sha256: str,
+        dependencies: FrozenSet[str]
+    ):
+        self.name = name
+        # "template" (rendered by Jinja) or "asset" (copied verbatim)
+        self.kind = kind
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.sha256 = sha256
+        # Templates pulled in with include/import/extends
+        self.dependencies = dependencies
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "size": self.size,
+            "sha256": self.sha256,
+            "dependencies": sorted(self.dependencies),
+        }
+
+
+class TemplateManifest:
+    """In-memory index of the templates directory
+
+    Every file is recorded with its kind, size and content hash, and every
+    template with the templates it references (read from its Jinja AST).
+    The reverse edges give, for any file, the templates whose output depends
+    on it: editing ``macros.j2`` invalidates exactly the templates importing
+    it, directly or through another template.
+
+    The index is built once and then updated from the paths reported by a
+    file watcher (see ``refresh``); listings are served from memory.
+    Listeners registered with ``subscribe`` are told which templates to drop
+    from their caches.
+    """
+
+    def __init__(self, templates_dir: Path, env: Environment, is_template: Callable[[str], bool]):
+        self.templates_dir = templates_dir.resolve()
+        self.env = env
+        self.is_template = is_template
+
+        self.entries: Dict[str, TemplateEntry] = {}
+        # template name -> templates referencing it directly
+        self.dependants: Dict[str, Set[str]] = {}
+        # Incremented on every change, so listings can be cached per version
+        self.version = 0
+
+        self._listings: "OrderedDict[Optional[str], List[str]]" = OrderedDict()
+        # template name -> digest of its source and everything it pulls in
+        self._digests: Dict[str, str] = {}
+        self._listeners: List[InvalidationListener] = []
+        self._lock = threading.RLock()
+
+    def build(self) -> "TemplateManifest":
+        """Index the whole templates directory"""
+        start = time.perf_counter()
+        with self._lock:
+            self.entries.clear()
+            self.dependants.clear()
+            for dirpath, _, filenames in os.walk(self.templates_dir):
+                for filename in filenames:
+                    self._index(Path(dirpath) / filename)
+            self._changed()
+
+        logger.info(
+            f"Indexed {len(self.entries)} template files "
+            f"in {(time.perf_counter() - start) * 1000:.1f} ms"
+        )
+        return self
+
+    def refresh(self, paths: Iterable[Path]) -> Set[str]:
+        """
+        Re-index changed paths and notify the listeners
+
+        Args:
+            paths: Files or directories that were added, modified or removed
+
+        Returns:
+            Names of the templates whose output may have changed: the
+            modified files and all their dependants
+        """
+        changed: Set[str] = set()
+        with self._lock:
+            for path in paths:
+                path = Path(path).absolute()
+                try:
+                    name = path.relative_to(self.templates_dir).as_posix()
+                except ValueError:
+                    continue
+
+                if path.is_dir():
+                    for dirpath, _, filenames in os.walk(path):
+                        for filename in filenames:
+                            changed |= self._reindex(Path(dirpath) / filename)
+                elif path.is_file():
+                    changed |= self._reindex(path)
+                else:
+                    # Removed file, or removed directory with everything under it
+                    prefix = f"{name}/"
+                    for removed in [n for n in self.entries if n == name or n.startswith(prefix)]:
+                        self._drop(removed)
+                        changed.add(removed)
+
+            if not changed:
+                return set()
+            affected = self.dependants_of(changed) | changed
+            self._changed()
+            listeners = list(self._listeners)
+
+        logger.info(f"Template files changed: {sorted(changed)}; invalidating {len(affected)} templates")
+        for listener in listeners:
+            try:
+                listener(affected)
+            except Exception as e:
+                logger.warning(f"Template invalidation listener failed: {e}")
+        return affected
+
+    def subscribe(self, listener: InvalidationListener) -> None:
+        """Register a callback receiving the names of invalidated templates"""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def dependants_of(self, names: Iterable[str]) -> Set[str]:
+        """
+        Templates depending on any of ``names``, directly or transitively
+
+        Args:
+            names: Template names
+
+        Returns:
+            Set of dependant template names (``names`` excluded unless they
+            depend on each other)
+        """
+        result: Set[str] = set()
+        pending = list(names)
+        while pending:
+            for dependant in self.dependants.get(pending.pop(), ()):
+                if dependant not in result:
+                    result.add(dependant)
+                    pending.append(dependant)
+        return result
+
+    def list(self, pattern: Optional[str] = None) -> List[str]:
+        """
+        Sorted file names, optionally filtered with a glob pattern
+
+        ``**`` matches any number of directories, ``*`` and ``?`` stay
+        within one path segment, as with ``Path.glob``. Listings are
+        computed once per manifest version, for the MAX_LISTINGS most
+        recently used patterns.
+        """
+        with self._lock:
+            listing = self._listings.get(pattern)
+            if listing is not None:
+                self._listings.move_to_end(pattern)
+                return listing
+
+            listing = sorted(self.entries)
+            if pattern:
+                regex = self._glob_regex(pattern)
+                listing = [name for name in listing if regex.fullmatch(name)]
+            self._listings[pattern] = listing
+            if len(self._listings) > MAX_LISTINGS:
+                self._listings.popitem(last=False)
+        return listing
+
+    def get(self, name: str) -> Optional[TemplateEntry]:
+        return self.entries.get(name)
+
+    def digest(self, name: str) -> str:
+        """
+        Hash of a template's source and of every template it references
+
+        Changes whenever the template or anything it includes, imports or
+        extends (transitively) changes, so it can key rendered output. The
+        files involved are checked with a stat, so an edit is noticed even
+        when no file watcher is running.
+
+        Args:
+            name: Template name
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        closure = sorted({name} | self._dependencies_of(name))
+        stale = [
+            self.templates_dir / dependency for dependency in closure
+            if self._is_stale(dependency)
+        ]
+        if stale:
+            self.refresh(stale)
+            closure = sorted({name} | self._dependencies_of(name))
+
+        digest = self._digests.get(name)
+        if digest is None:
+            hasher = hashlib.sha256()
+            for dependency in closure:
+                entry = self.entries.get(dependency)
+                hasher.update(f"{dependency}:{entry.sha256 if entry else '-'}\n".encode("utf-8"))
+            digest = hasher.hexdigest()
+            with self._lock:
+                self._digests[name] = digest
+        return digest
+
+    def _dependencies_of(self, name: str) -> Set[str]:
+        """Templates referenced by ``name``, directly or transitively"""
+        result: Set[str] = set()
+        pending = [name]
+        while pending:
+            entry = self.entries.get(pending.pop())
+            for dependency in entry.dependencies if entry else ():
+                if dependency not in result:
+                    result.add(dependency)
+                    pending.append(dependency)
+        return result
+
+    def _is_stale(self, name: str) -> bool:
+        entry = self.entries.get(name)
+        try:
+            mtime = os.stat(self.templates_dir / name).st_mtime_ns
+        except OSError:
+            return entry is not None
+        return entry is None or entry.mtime_ns != mtime
+
+    def _changed(self) -> None:
+        self.version += 1
+        self._listings = OrderedDict()
+        self._digests = {}
+
+    def _reindex(self, path: Path) -> Set[str]:
+        """Index a file again; returns its name if its content changed"""
+        name = path.relative_to(self.templates_dir).as_posix()
+        previous = self.entries.get(name)
+        entry = self._index(path)
+        if entry is None or (previous is not None and previous.sha256 == entry.sha256):
+            return set()
+        return {name}
+
+    def _index(self, path: Path) -> Optional[TemplateEntry]:
+        name = path.relative_to(self.templates_dir).as_posix()
+        try:
+            stat = path.stat()
+            data = path.read_bytes()
+        except OSError:
+            return None
+
+        kind = "template" if self.is_template(name) else "asset"
+        dependencies: FrozenSet[str] = frozenset()
+        if kind == "template":
+            dependencies = self._dependencies(name, data)
+
+        self._drop(name)
+        entry = TemplateEntry(name, kind, stat.st_size, stat.st_mtime_ns, hashlib.sha256(data).hexdigest(), dependencies)
+        self.entries[name] = entry
+        for dependency in dependencies:
+            self.dependants.setdefault(dependency, set()).add(name)
+        return entry
+
+    def _drop(self, name: str) -> None:
+        entry = self.entries.pop(name, None)
+        if entry is None:
+            return
+        for dependency in entry.dependencies:
+            dependants = self.dependants.get(dependency)
+            if dependants is not None:
+                dependants.discard(name)
+                if not dependants:
+                    del self.dependants[dependency]
+
+    def _dependencies(self, name: str, data: bytes) -> FrozenSet[str]:
+        """Templates referenced by include/import/extends with a constant name"""
+        try:
+            ast = self.env.parse(data.decode("utf-8"), name)
+        except (TemplateSyntaxError, UnicodeDecodeError) as e:
+            logger.warning(f"Cannot parse template {name}: {e}")
+            return frozenset()
+        return frozenset(ref for ref in meta.find_referenced_templates(ast) if ref)
+
+    @staticmethod
+    def _glob_regex(pattern: str) -> "re.Pattern[str]":
+        segments = pattern.split("/")
+        regex = ""
+        for i, segment in enumerate(segments):
+            last = i == len(segments) - 1
+            if segment == "**":
+                regex += ".*" if last else "(?:[^/]+/)*"
+                continue
+            regex += re.escape(segment).replace(r"\*", "[^/]*").replace(r"\?", "[^/]")
+            if not last:
+                regex += "/"
+        return re.compile(regex)
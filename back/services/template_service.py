@@ -1,8 +1,13 @@
-from jinja2 import Environment, FileSystemLoader, Template, TemplateNotFound
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, Template, TemplateNotFound, meta
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Set, Tuple
 from config import settings
+from services.template_manifest import TemplateManifest
+from services.naming import cache_stats as naming_cache_stats, camel_case, kebab_case, pascal_case, snake_case
+import asyncio
 import logging
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -10,54 +15,71 @@ logger = logging.getLogger(__name__)
 class TemplateService:
     """Service for managing and rendering Jinja2 templates"""
     
-    def __init__(self, templates_dir: Optional[Path] = None):
+    # Only files with these extensions are Jinja templates; everything else
+    # under the templates directory is a verbatim asset.
+    TEMPLATE_EXTENSIONS = (".j2", ".jinja", ".jinja2")
+    
+    def __init__(
+        self,
+        templates_dir: Optional[Path] = None,
+        cache_dir: Optional[Path] = None
+    ):
         """
         Initialize the template service
         
         Args:
             templates_dir: Directory containing Jinja2 templates
+            cache_dir: Directory for the compiled template bytecode cache
+                (defaults to settings.TEMPLATE_CACHE_DIR when enabled)
         """
         self.templates_dir = templates_dir or settings.TEMPLATES_DIR
         self.templates_dir.mkdir(parents=True, exist_ok=True)
         
+        self.bytecode_cache = self._create_bytecode_cache(cache_dir)
+        
         self.env = Environment(
             loader=FileSystemLoader(str(self.templates_dir)),
             autoescape=False,  # We're generating code, not HTML
             trim_blocks=True,
             lstrip_blocks=True,
+            bytecode_cache=self.bytecode_cache,
         )
         
+        # template name -> (source mtime, variables read by the template)
+        self._variables_cache: Dict[str, Tuple[int, Set[str]]] = {}
+        
+        # Built on first use (render workers never need it)
+        self._manifest: Optional[TemplateManifest] = None
+        self._manifest_lock = threading.Lock()
+        
         # Add custom filters
-        self.env.filters['camel_case'] = self._to_camel_case
-        self.env.filters['snake_case'] = self._to_snake_case
-        self.env.filters['pascal_case'] = self._to_pascal_case
-        self.env.filters['kebab_case'] = self._to_kebab_case
-    
-    @staticmethod
-    def _to_camel_case(text: str) -> str:
-        """Convert text to camelCase"""
-        words = text.replace('-', '_').split('_')
-        return words[0].lower() + ''.join(word.capitalize() for word in words[1:])
-    
-    @staticmethod
-    def _to_snake_case(text: str) -> str:
-        """Convert text to snake_case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower().replace('-', '_')
+        self.env.filters['camel_case'] = camel_case
+        self.env.filters['snake_case'] = snake_case
+        self.env.filters['pascal_case'] = pascal_case
+        self.env.filters['kebab_case'] = kebab_case
     
     @staticmethod
-    def _to_pascal_case(text: str) -> str:
-        """Convert text to PascalCase"""
-        words = text.replace('-', '_').split('_')
-        return ''.join(word.capitalize() for word in words)
-    
-    @staticmethod
-    def _to_kebab_case(text: str) -> str:
-        """Convert text to kebab-case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1-\2', text)
-        return re.sub('([a-z0-9])([A-Z])', r'\1-\2', s1).lower().replace('_', '-')
+    def _create_bytecode_cache(cache_dir: Optional[Path]) -> Optional[FileSystemBytecodeCache]:
+        """
+        Create the on-disk bytecode cache
+        
+        Jinja keys each cache entry by template name and file path, and
+        stores a checksum of the template source with it, so an edited
+        template is recompiled and its entry overwritten automatically.
+        
+        Args:
+            cache_dir: Explicit cache directory, or None to use the settings
+            
+        Returns:
+            The bytecode cache, or None when caching is disabled
+        """
+        if cache_dir is None:
+            if not settings.TEMPLATE_CACHE_ENABLED:
+                return None
+            cache_dir = settings.TEMPLATE_CACHE_DIR
+        
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return FileSystemBytecodeCache(str(cache_dir), "%s.jinja.cache")
     
     def render_template(self, template_name: str, context: Dict[str, Any]) -> str:
         """
@@ -83,6 +105,94 @@ class TemplateService:
             logger.error(f"Error rendering template {template_name}: {e}")
             raise
     
+    def template_variables(self, template_name: str) -> Set[str]:
+        """
+        Return the context variables a template reads
+        
+        Templates pulled in through include/extends/import are followed, so
+        the result covers everything rendered by ``template_name``. Missing
+        templates read nothing.
+        
+        Args:
+            template_name: Name of the template file
+            
+        Returns:
+            Set of undeclared variable names
+        """
+        template_path = self.templates_dir / template_name
+        try:
+            mtime = template_path.stat().st_mtime_ns
+        except OSError:
+            return set()
+        
+        cached = self._variables_cache.get(template_name)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        
+        variables: Set[str] = set()
+        seen: Set[str] = set()
+        pending = [template_name]
+        while pending:
+            name = pending.pop()
+            if name in seen:
+                continue
+            seen.add(name)
+            try:
+                source = self.env.loader.get_source(self.env, name)[0]
+            except TemplateNotFound:
+                continue
+            ast = self.env.parse(source)
+            variables |= meta.find_undeclared_variables(ast)
+            pending.extend(ref for ref in meta.find_referenced_templates(ast) if ref)
+        
+        self._variables_cache[template_name] = (mtime, variables)
+        return variables
+    
+    def is_template(self, name: str) -> bool:
+        """
+        Check whether a file under the templates directory is a Jinja template
+        
+        Args:
+            name: Path of the file relative to the templates directory
+            
+        Returns:
+            True if the file must be rendered, False if it is a verbatim asset
+        """
+        return name.endswith(self.TEMPLATE_EXTENSIONS)
+    
+    def warm_templates(self) -> Dict[str, Any]:
+        """
+        Compile every template once so that later renders hit the caches
+        
+        Loading a template fills the environment's in-memory cache and, when
+        enabled, writes its bytecode to disk; on the next worker start the
+        compiled bytecode is read back instead of re-parsing the source.
+        
+        Returns:
+            Dictionary with the number of warmed templates, failures and
+            the elapsed time in milliseconds
+        """
+        start = time.perf_counter()
+        warmed = 0
+        failed: List[str] = []
+        
+        for name in self.env.list_templates(filter_func=self.is_template):
+            try:
+                self.env.get_template(name)
+                warmed += 1
+            except Exception as e:
+                logger.warning(f"Failed to warm template {name}: {e}")
+                failed.append(name)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Warmed {warmed} templates in {elapsed_ms:.1f} ms")
+        
+        return {
+            "warmed": warmed,
+            "failed": failed,
+            "elapsed_ms": elapsed_ms,
+        }
+    
     def render_string(self, template_string: str, context: Dict[str, Any]) -> str:
         """
         Render a template from a string
@@ -97,21 +207,74 @@ class TemplateService:
         template = self.env.from_string(template_string)
         return template.render(**context)
     
+    @property
+    def manifest(self) -> TemplateManifest:
+        """Index of the templates directory, built on first access"""
+        if self._manifest is None:
+            with self._manifest_lock:
+                if self._manifest is None:
+                    manifest = TemplateManifest(self.templates_dir, self.env, self.is_template)
+                    manifest.subscribe(self._invalidate_variables)
+                    self._manifest = manifest.build()
+        return self._manifest
+    
+    def _invalidate_variables(self, names: Set[str]) -> None:
+        """Drop the cached variables of templates whose includes changed"""
+        for name in names:
+            self._variables_cache.pop(name, None)
+    
+    async def watch_templates(self, stop_event: asyncio.Event) -> None:
+        """
+        Keep the manifest in sync with the templates directory until stopped
+        
+        Uses watchfiles (installed with uvicorn[standard]); without it the
+        manifest keeps the state indexed at startup.
+        
+        Args:
+            stop_event: Set to stop watching
+        """
+        try:
+            from watchfiles import awatch
+        except ImportError:
+            logger.warning("watchfiles is not installed, template changes will not be picked up")
+            return
+        
+        manifest = self.manifest
+        logger.info(f"Watching templates in {self.templates_dir}")
+        async for changes in awatch(self.templates_dir, stop_event=stop_event, debounce=200):
+            paths = {path for _, path in changes}
+            await asyncio.to_thread(manifest.refresh, paths)
+    
     def list_templates(self, pattern: Optional[str] = None) -> List[str]:
         """
         List available templates
         
+        Served from the manifest, so repeated listings do not touch the
+        file system.
+        
         Args:
             pattern: Optional glob pattern to filter templates
             
         Returns:
             List of template names
         """
-        if pattern:
-            return [str(p.relative_to(self.templates_dir)) 
-                   for p in self.templates_dir.glob(pattern)]
-        else:
-            return self.env.list_templates()
+        return self.manifest.list(pattern)
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return template manifest and naming cache counters
+        
+        Returns:
+            Number of indexed files, manifest version and the hit/miss
+            counters of the naming conversions
+        """
+        manifest = self.manifest
+        return {
+            "files": len(manifest.entries),
+            "templates": sum(1 for entry in manifest.entries.values() if entry.kind == "template"),
+            "manifest_version": manifest.version,
+            "naming": naming_cache_stats(),
+        }
     
     def create_template(self, name: str, content: str) -> Path:
         """
@@ -127,6 +290,8 @@ class TemplateService:
         template_path = self.templates_dir / name
         template_path.parent.mkdir(parents=True, exist_ok=True)
         template_path.write_text(content)
+        if self._manifest is not None:
+            self._manifest.refresh([template_path])
         logger.info(f"Created template: {name}")
         return template_path
     
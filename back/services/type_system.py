@@ -0,0 +1,153 @@
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, NamedTuple, Optional, Tuple
+
+
+class TypeMapping(NamedTuple):
+    """How one DSL type maps to every target (docs/TYPES.md)"""
+
+    dsl_type: str
+    csharp: str
+    typescript: str
+    sql: str
+    # EF Core [Column(TypeName = ...)] when the provider default is not wanted
+    column_type: Optional[str]
+    # Angular field component: class, folder and selector without "app-"
+    component: str
+    component_folder: str
+    component_tag: str
+    # Datagrid column type and its filter operators (empty: not filterable)
+    grid_column: str
+    filter_options: Tuple[str, ...]
+    # Stored as a foreign key, so the C# property name ends with "Id"
+    is_reference: bool = False
+    # Values come from the property's fixed option list
+    has_choices: bool = False
+    is_date: bool = False
+
+
+class PropertyType(NamedTuple):
+    """Types of one property, resolved once and shared by every template"""
+
+    dsl_type: str
+    csharp_type: str
+    ts_type: str
+    sql_type: str
+    column_type: Optional[str]
+    component: str
+    component_folder: str
+    component_tag: str
+    grid_column: str
+    filter_options: Tuple[str, ...]
+    nullable: bool
+    is_reference: bool
+    has_choices: bool
+    is_date: bool
+
+
+_TEXT_FILTERS = ("contains", "equals", "startsWith")
+_RANGE_FILTERS = ("equals", "lessThan", "greaterThan", "inRange")
+
+# An address is stored as a foreign key to its own table, so the API models
+# expose its id (string) rather than the Address type listed in TYPES.md
+TYPE_MAPPINGS: Mapping[str, TypeMapping] = MappingProxyType({
+    mapping.dsl_type: mapping
+    for mapping in (
+        TypeMapping("text", "string", "string", "VARCHAR(255)", None,
+                    "EditTextFieldComponent", "edit-text-field", "edit-text-field",
+                    "text", _TEXT_FILTERS),
+        TypeMapping("textarea", "string", "string", "TEXT", "text",
+                    "EditTextareaFieldComponent", "edit-textarea-field", "edit-textarea-field",
+                    "text", _TEXT_FILTERS),
+        TypeMapping("integer", "int", "number", "INT", None,
+                    "EditNumberFieldComponent", "edit-number-field", "edit-number-field",
+                    "number", _RANGE_FILTERS),
+        TypeMapping("number", "decimal", "number", "DECIMAL(18,2)", "decimal(18,2)",
+                    "EditNumberFieldComponent", "edit-number-field", "edit-number-field",
+                    "number", _RANGE_FILTERS),
+        TypeMapping("select", "string", "string", "VARCHAR(50)", "varchar(50)",
+                    "EditSelectFieldComponent", "edit-select-field", "edit-select-field",
+                    "text", _TEXT_FILTERS, has_choices=True),
+        TypeMapping("multiselect", "List<string>", "string[]", "JSON", None,
+                    "EditMultiSelectFieldComponent", "edit-multi-select-field", "edit-multi-select-field",
+                    "array", (), has_choices=True),
+        TypeMapping("autocomplete", "Guid", "string", "UNIQUEIDENTIFIER", None,
+                    "EditAutocompleteFieldComponent", "edit-async-autocomplete-field",
+                    "edit-async-autocomplete-field",
+                    "text", _TEXT_FILTERS, is_reference=True),
+        TypeMapping("boolean", "bool", "boolean", "BIT", None,
+                    "SwitchButtonComponent", "switch-button", "switch-button",
+                    "text", _TEXT_FILTERS),
+        TypeMapping("date", "DateOnly", "Date", "DATE", None,
+                    "EditDateFieldComponent", "edit-date-field", "edit-date-field",
+                    "date", _RANGE_FILTERS, is_date=True),
+        TypeMapping("datetime", "DateTime", "Date", "DATETIME2", None,
+                    "EditDateFieldComponent", "edit-date-field", "edit-date-field",
+                    "date", _RANGE_FILTERS, is_date=True),
+        TypeMapping("address", "Guid", "string", "UNIQUEIDENTIFIER", None,
+                    "AddressComponent", "address", "address",
+                    "text", _TEXT_FILTERS, is_reference=True),
+    )
+})
+
+# Legacy application spec (models/app_spec.py) type -> DSL type
+LEGACY_TYPES: Mapping[str, str] = MappingProxyType({
+    "string": "text",
+    "int": "integer",
+    "long": "integer",
+    "bool": "boolean",
+    "boolean": "boolean",
+    "datetime": "datetime",
+    "dateonly": "date",
+    "decimal": "number",
+    "double": "number",
+    "float": "number",
+    "guid": "autocomplete",
+})
+
+
+@lru_cache(maxsize=1024)
+def resolve_property_type(dsl_type: str, max_length: Optional[int], nullable: bool) -> PropertyType:
+    """
+    Resolve the types of a property
+
+    Properties with the same type, length and nullability share one
+    descriptor, so a spec with hundreds of models resolves a handful.
+
+    Args:
+        dsl_type: DSL type of the property
+        max_length: Maximum length of text properties, if any
+        nullable: Whether the property may be empty
+
+    Returns:
+        The property's type descriptor
+
+    Raises:
+        ValueError: If the type is not a DSL type
+    """
+    mapping = TYPE_MAPPINGS.get(dsl_type)
+    if mapping is None:
+        raise ValueError(f"Unsupported property type: {dsl_type}")
+
+    sql_type = mapping.sql
+    column_type = mapping.column_type
+    if dsl_type == "text" and max_length:
+        sql_type = f"VARCHAR({max_length})"
+        column_type = f"varchar({max_length})"
+
+    return PropertyType(
+        dsl_type=dsl_type,
+        csharp_type=mapping.csharp,
+        ts_type=mapping.typescript,
+        sql_type=sql_type,
+        column_type=column_type,
+        component=mapping.component,
+        component_folder=mapping.component_folder,
+        component_tag=mapping.component_tag,
+        grid_column=mapping.grid_column,
+        filter_options=mapping.filter_options,
+        nullable=nullable,
+        is_reference=mapping.is_reference,
+        has_choices=mapping.has_choices,
+        is_date=mapping.is_date,
+    )
@@ -0,0 +1,108 @@
+import asyncio
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from services.application_generator_service import ApplicationGeneratorService, TemplateTreeManifest
+from services.render_cache import NullRenderCache
+
+SPEC = json.loads((Path(__file__).resolve().parents[2] / "example-app-spec.json").read_text())
+
+LEGACY_SPEC = {
+    "project_name": "TaskManager",
+    "description": "Tasks",
+    "database": {"provider": "postgres", "connection_string_template": "Host=db"},
+    "models": [
+        {"name": "User", "properties": [{"name": "Id", "type": "int", "isPrimaryKey": True},
+                                        {"name": "Email", "type": "string", "isRequired": True}]},
+        {"name": "Task", "properties": [{"name": "Title", "type": "string", "maxLength": 200}]},
+    ],
+    "relations": [{"name": "UserTasks", "from": "User", "to": "Task", "type": "one-to-many"}],
+    "api": {"endpoints": [{"model": "Task", "methods": ["GET"]}]},
+    "frontend": {"framework": "Angular", "components": []},
+}
+
+
+def _service():
+    # Every test renders from scratch and leaves no cache behind
+    return ApplicationGeneratorService(render_cache=NullRenderCache())
+
+
+def test_generates_project_and_model_files(tmp_path):
+    service = _service()
+    service.output_dir = tmp_path
+
+    result = asyncio.run(service.generate_application(SPEC))
+
+    output = Path(result["output_path"])
+    assert result["models"] == ["Client", "Commande", "Mission"]
+    assert result["files_generated"] == len(result["files"])
+    assert set(result["timings"]) >= {"normalize_ms", "context_ms", "render_ms", "write_ms", "total_ms"}
+
+    # Project templates are rendered, placeholders in paths substituted
+    assert "using GestionClients_api.Models;" in (output / "backend/Program.cs").read_text()
+    assert (output / "backend/GestionClients-api.csproj").exists()
+    assert not list(output.rglob("*.jinja"))
+
+    model = (output / "backend/Models/Commande.cs").read_text()
+    assert "public class Commande : BaseModel, IArchivable" in model
+    assert '[Column(TypeName = "decimal(18,2)")] public decimal Amount' in model
+    assert "public class ClientInput" in (output / "backend/DTOs/ClientDTO.cs").read_text()
+    assert "public class MissionsController(" in (output / "backend/Controllers/MissionsController.cs").read_text()
+
+    details = (output / "frontend/src/app/pages/commande-details/commande-details.component.ts").read_text()
+    assert "export class CommandeDetailsComponent" in details
+    assert 'statusOptions = signal<Option<string>[]>([{"id": "nouvelle"' in details
+    assert (output / "frontend/src/app/pages/client-list/client-list.component.scss").exists()
+
+    # Verbatim assets are copied byte for byte
+    asset = service.template_service.templates_dir / "front/package.json"
+    assert (output / "frontend/package.json").read_bytes() == asset.read_bytes()
+
+
+def test_base_model_fields_are_not_duplicated():
+    rendered = asyncio.run(_service().render_application(SPEC))
+
+    dto = rendered["files"]["backend/DTOs/ClientDTO.cs"]
+    assert dto.count("DateTimeOffset CreatedAt") == 2  # output and list output only
+
+
+def test_legacy_spec_relations_become_foreign_keys():
+    rendered = asyncio.run(_service().render_application(LEGACY_SPEC))
+
+    task = rendered["files"]["backend/Models/Task.cs"]
+    user = rendered["files"]["backend/Models/User.cs"]
+    assert "[ForeignKey(nameof(UserId))] public User? User" in task
+    assert "public List<Task> Tasks { get; set; } = new();" in user
+    assert "public int Id" not in user
+
+
+def test_invalid_spec_raises_value_error():
+    spec = copy.deepcopy(SPEC)
+    spec["models"][0]["properties"][0]["type"] = "blob"
+
+    with pytest.raises(ValueError):
+        asyncio.run(_service().render_application(spec))
+
+
+def test_tree_manifest_is_cached_until_a_directory_changes():
+    service = _service()
+    manifest = service.tree_manifest()
+
+    assert service.tree_manifest() is manifest
+    assert ("front/package.json", "frontend/package.json") in [
+        (str(source.relative_to(service.template_service.templates_dir)), target)
+        for source, target in manifest.assets
+    ]
+
+    manifest.directories[next(iter(manifest.directories))] -= 1
+    assert service.tree_manifest() is not manifest
+
+
+def test_project_name_is_substituted_literally():
+    target = "backend/{{ project_name }}.csproj"
+
+    assert TemplateTreeManifest.resolve(target, "Demo\\App") == "backend/Demo\\App.csproj"
+    assert TemplateTreeManifest.resolve(target, r"Demo\g<0>") == r"backend/Demo\g<0>.csproj"
@@ -0,0 +1,55 @@
+import io
+import random
+import tarfile
+import zipfile
+
+import pytest
+
+from services.archive_service import ArchiveService
+
+
+def _files(count=50):
+    # Incompressible enough for the archive to span many chunks
+    return {f"pkg/module_{i}.py": f"# {random.Random(i).randbytes(4096).hex()}\n" for i in range(count)}
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar.gz"])
+def test_stream_yields_chunks_and_roundtrips(archive_format):
+    service = ArchiveService(chunk_size=4096)
+    files = _files()
+    files["assets/logo.bin"] = bytes(range(256))
+
+    chunks = list(service.stream(files, archive_format, root="demo"))
+    data = b"".join(chunks)
+
+    assert len(chunks) > 2
+    if archive_format == "zip":
+        with zipfile.ZipFile(io.BytesIO(data)) as archive:
+            assert archive.read("demo/pkg/module_3.py").decode() == files["pkg/module_3.py"]
+            assert archive.read("demo/assets/logo.bin") == files["assets/logo.bin"]
+            assert len(archive.namelist()) == len(files)
+    else:
+        with tarfile.open(fileobj=io.BytesIO(data), mode="r:gz") as archive:
+            assert archive.extractfile("demo/pkg/module_3.py").read().decode() == files["pkg/module_3.py"]
+            assert archive.extractfile("demo/assets/logo.bin").read() == files["assets/logo.bin"]
+            assert len(archive.getnames()) == len(files)
+
+
+def test_first_chunk_is_available_before_all_entries_are_consumed():
+    service = ArchiveService(chunk_size=1024)
+    consumed = []
+
+    def entries():
+        for name, content in _files(20).items():
+            consumed.append(name)
+            yield name, content
+
+    stream = service.stream(entries(), "zip")
+    assert next(stream)
+    assert len(consumed) < 20
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        ArchiveService().normalize_format("rar")
+    assert ArchiveService().normalize_format("tgz") == "tar.gz"
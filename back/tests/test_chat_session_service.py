@@ -0,0 +1,96 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routes import chat
+from services.chat_session_service import ChatSessionService, estimate_tokens
+from services.llm_backends import StubLLMBackend
+from services.llm_cache import NullLLMCache
+from services.llm_service import LLMService
+
+
+def _app():
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/chat")
+    return app
+
+
+def test_history_stays_within_budget():
+    service = ChatSessionService(max_sessions=10, ttl_seconds=0, history_budget=100, summary_budget=60)
+    session = service.create()
+
+    for index in range(50):
+        session.append("user", f"question {index} " + "about the spec " * 10)
+        session.append("assistant", f"answer {index} " + "with details " * 10)
+
+    assert session.turn_count == 100
+    assert session.history_tokens <= 100
+    assert session.summary_tokens <= 60
+    assert session.compacted_turns == 100 - len(session.turns)
+    assert session.turns[-1].content.startswith("answer 49")
+    assert estimate_tokens(session.prompt_history()) < 200
+
+
+def test_sessions_are_bounded_lru():
+    service = ChatSessionService(max_sessions=2, ttl_seconds=0, history_budget=100, summary_budget=50)
+    first = service.create()
+    second = service.create()
+    service.get(first.id)
+    service.create()
+
+    assert service.get(first.id) is first
+    assert service.get(second.id) is None
+
+
+def test_session_stream_stores_turns(monkeypatch):
+    stub = LLMService(cache=NullLLMCache(), backend=StubLLMBackend(
+        response_tokens=8, token_delay=0, tokens_per_chunk=2, first_token_delay=0
+    ))
+    prompts = []
+    original = stub.chat_stream
+
+    def recording_stream(message, context=None, history=None):
+        prompts.append(history)
+        return original(message, context, history=history)
+
+    monkeypatch.setattr(chat, "llm_service", stub)
+    monkeypatch.setattr(stub, "chat_stream", recording_stream)
+    monkeypatch.setattr(chat, "chat_session_service", ChatSessionService(
+        max_sessions=10, ttl_seconds=0, history_budget=1000, summary_budget=100
+    ))
+    client = TestClient(_app())
+
+    session_id = client.post("/api/chat/sessions").json()["sessionId"]
+    for text in ("first question", "second question"):
+        response = client.post(f"/api/chat/sessions/{session_id}/stream", json={"message": text})
+        events = [json.loads(line[6:]) for line in response.text.splitlines() if line.startswith("data: ")]
+        assert events[-1] == {"done": True}
+
+    state = client.get(f"/api/chat/sessions/{session_id}").json()
+
+    assert [turn["role"] for turn in state["turns"]] == ["user", "assistant", "user", "assistant"]
+    assert prompts[0] == ""
+    assert "user: first question" in prompts[1]
+    assert client.delete(f"/api/chat/sessions/{session_id}").status_code == 204
+    assert client.get(f"/api/chat/sessions/{session_id}").status_code == 404
+
+
+def test_failed_session_stream_leaves_history_unchanged(monkeypatch):
+    async def failing_stream(message, context=None, history=None):
+        yield "partial answer"
+        raise RuntimeError("upstream closed")
+
+    stub = LLMService(cache=NullLLMCache(), backend=StubLLMBackend(token_delay=0, first_token_delay=0))
+    monkeypatch.setattr(chat, "llm_service", stub)
+    monkeypatch.setattr(stub, "chat_stream", failing_stream)
+    monkeypatch.setattr(chat, "chat_session_service", ChatSessionService(
+        max_sessions=10, ttl_seconds=0, history_budget=1000, summary_budget=100
+    ))
+    client = TestClient(_app())
+
+    session_id = client.post("/api/chat/sessions").json()["sessionId"]
+    response = client.post(f"/api/chat/sessions/{session_id}/stream", json={"message": "question"})
+
+    assert '"error": "upstream closed"' in response.text
+    assert client.get(f"/api/chat/sessions/{session_id}").json()["turns"] == []
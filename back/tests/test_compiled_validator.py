@@ -0,0 +1,98 @@
+from pathlib import Path
+import copy
+import json
+
+import pytest
+from jsonschema import Draft7Validator
+
+from services.compiled_validator import SchemaCompileError, compile_schema
+from services.dsl_validation_service import DSLValidationService
+
+# Values substituted at every node of the example spec
+ODD_VALUES = [None, True, False, 0, 1, -1, 1.0, 1.5, 70000, "", "x", "Bad name", "text", [], ["a"], [1], {}, {"extra": 1}]
+
+
+def _load_example_spec():
+    root = Path(__file__).resolve().parents[2]
+    return json.loads((root / "example-app-spec.json").read_text())
+
+
+def _pointers(value, path=()):
+    yield path
+    if isinstance(value, dict):
+        for key, item in value.items():
+            yield from _pointers(item, path + (key,))
+    elif isinstance(value, list):
+        for index, item in enumerate(value):
+            yield from _pointers(item, path + (index,))
+
+
+def _replace(spec, path, value):
+    if not path:
+        return copy.deepcopy(value)
+    mutated = copy.deepcopy(spec)
+    node = mutated
+    for part in path[:-1]:
+        node = node[part]
+    node[path[-1]] = copy.deepcopy(value)
+    return mutated
+
+
+def _remove(spec, path):
+    mutated = copy.deepcopy(spec)
+    node = mutated
+    for part in path[:-1]:
+        node = node[part]
+    del node[path[-1]]
+    return mutated
+
+
+def _mutations():
+    spec = _load_example_spec()
+    yield spec
+    for path in _pointers(spec):
+        for value in ODD_VALUES:
+            yield _replace(spec, path, value)
+        if path:
+            yield _remove(spec, path)
+
+
+@pytest.fixture(scope="module")
+def engines():
+    return (
+        DSLValidationService(engine="jsonschema", cache_size=0),
+        DSLValidationService(engine="compiled", cache_size=0),
+    )
+
+
+def test_compiled_engine_matches_jsonschema(engines):
+    reference, compiled = engines
+    checked = 0
+
+    for spec in _mutations():
+        assert compiled.validate_spec(spec) == reference.validate_spec(spec), spec
+        checked += 1
+
+    assert checked > 1000
+    assert compiled._compiled is not None
+
+
+def test_compiled_engine_reports_multiple_extras(engines):
+    reference, compiled = engines
+    spec = {"config": {"project_name": "App", "b": 1, "a": 2}, "models": [], "z": None}
+
+    assert compiled.validate_spec(spec) == reference.validate_spec(spec)
+
+
+def test_unsupported_keyword_is_rejected():
+    with pytest.raises(SchemaCompileError):
+        compile_schema({"anyOf": [{"type": "string"}, {"type": "integer"}]})
+
+
+def test_mixed_enum_matches_jsonschema():
+    schema = {"enum": [1, True, "a", [0, {"k": False}], {"k": [1.0]}]}
+    validate = compile_schema(schema)
+    reference = Draft7Validator(schema)
+
+    for instance in [1, 1.0, True, False, 0, "a", [0, {"k": False}], [False, {"k": 0}], {"k": [1]}, {"k": [True]}, None]:
+        assert bool(validate(instance)) == (not reference.is_valid(instance)), instance
@@ -0,0 +1,32 @@
+from models.uml import UMLDiagram
+from models.diagram_index import DiagramIndex
+
+
+def _diagram():
+    return UMLDiagram(
+        classes=[{"id": cid, "name": cid.upper()} for cid in ("a", "b", "c")],
+        relations=[
+            {"id": "r1", "sourceId": "b", "targetId": "a", "type": "inheritance"},
+            {"id": "r2", "sourceId": "a", "targetId": "c", "type": "association"},
+            {"id": "r3", "sourceId": "c", "targetId": "c", "type": "dependency"},
+        ],
+    )
+
+
+def test_relations_for_matches_scan():
+    diagram = _diagram()
+    index = DiagramIndex.from_diagram(diagram)
+
+    for cls in diagram.classes:
+        expected = [r for r in diagram.relations if r.sourceId == cls.id or r.targetId == cls.id]
+        assert index.relations_for(cls.id) == expected
+
+
+def test_inheritance_and_directions():
+    index = DiagramIndex.from_diagram(_diagram())
+
+    assert [c.id for c in index.parents_of("b")] == ["a"]
+    assert [c.id for c in index.children_of("a")] == ["b"]
+    assert [r.id for r in index.outgoing_relations("a")] == ["r2"]
+    assert [r.id for r in index.incoming_relations("c")] == ["r2", "r3"]
+    assert index.get_class("missing") is None
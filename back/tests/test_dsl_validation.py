@@ -38,3 +38,96 @@ def test_lex_spec_tokens():
 
     assert len(tokens) > 0
     assert any(token["type"] == "property" for token in tokens)
+
+
+def test_iter_tokens_yields_pointer_tokens():
+    service = DSLValidationService()
+    spec = {"config": {"name": "Demo"}, "models": [{"tags": [1, True, None]}]}
+
+    assert list(service.iter_tokens(spec)) == [
+        {"type": "object_start", "path": ""},
+        {"type": "property", "path": "/config", "value": "config"},
+        {"type": "object_start", "path": "/config"},
+        {"type": "property", "path": "/config/name", "value": "name"},
+        {"type": "string", "path": "/config/name", "value": "Demo"},
+        {"type": "object_end", "path": "/config"},
+        {"type": "property", "path": "/models", "value": "models"},
+        {"type": "array_start", "path": "/models"},
+        {"type": "index", "path": "/models/0", "value": 0},
+        {"type": "object_start", "path": "/models/0"},
+        {"type": "property", "path": "/models/0/tags", "value": "tags"},
+        {"type": "array_start", "path": "/models/0/tags"},
+        {"type": "index", "path": "/models/0/tags/0", "value": 0},
+        {"type": "number", "path": "/models/0/tags/0", "value": 1},
+        {"type": "index", "path": "/models/0/tags/1", "value": 1},
+        {"type": "boolean", "path": "/models/0/tags/1", "value": True},
+        {"type": "index", "path": "/models/0/tags/2", "value": 2},
+        {"type": "null", "path": "/models/0/tags/2", "value": None},
+        {"type": "array_end", "path": "/models/0/tags"},
+        {"type": "object_end", "path": "/models/0"},
+        {"type": "array_end", "path": "/models"},
+        {"type": "object_end", "path": ""},
+    ]
+    assert service.lex_spec({"name": "Demo"}) == [
+        {"type": "object_start", "path": ""},
+        {"type": "property", "path": "/name", "value": "name"},
+        {"type": "string", "path": "/name", "value": "Demo"},
+        {"type": "object_end", "path": ""},
+    ]
+
+
+def test_lex_deeply_nested_spec():
+    service = DSLValidationService()
+    spec = current = {}
+    for _ in range(5000):
+        current["child"] = {}
+        current = current["child"]
+
+    tokens = list(service.iter_tokens(spec))
+
+    assert len(tokens) == 3 * 5000 + 2
+    assert tokens[-1] == {"type": "object_end", "path": ""}
+
+
+def test_validate_spec_uses_cache():
+    service = DSLValidationService()
+    spec = _load_example_spec()
+
+    first = service.validate_spec(spec)
+    second = service.validate_spec(json.loads(json.dumps(spec)))
+
+    assert first == second
+    assert service.cache_stats()["hits"] == 1
+    assert service.cache_stats()["misses"] == 1
+
+
+def test_validation_cache_invalidated_on_schema_change(tmp_path):
+    schema_path = tmp_path / "schema.json"
+    schema_path.write_text(json.dumps({"type": "object"}))
+    service = DSLValidationService(schema_path=schema_path)
+
+    assert service.validate_spec({"models": []})["valid"] is True
+
+    schema_path.write_text(json.dumps({"type": "object", "required": ["config"]}))
+
+    assert service.validate_spec({"models": []})["valid"] is False
+    assert service.cache_stats()["hits"] == 0
+
+
+def test_validate_incremental_matches_full_validation():
+    service = DSLValidationService()
+    spec = _load_example_spec()
+    service.validate_spec(spec, document_id="doc")
+
+    spec["models"][1]["properties"][0]["type"] = "unknown"
+    spec["models"][2]["properties"].insert(0, {"name": "code"})
+    patch = [
+        {"op": "replace", "path": "/models/1/properties/0/type", "value": "unknown"},
+        {"op": "add", "path": "/models/2/properties/0", "value": {"name": "code"}},
+    ]
+
+    result = service.validate_incremental(spec, "doc", patch=patch)
+
+    assert result["incremental"] is True
+    assert result["revalidated"] == ["/models/1/properties/0/type", "/models/2/properties"]
+    assert result["errors"] == service.validate_spec(spec, use_cache=False)["errors"]
@@ -0,0 +1,88 @@
+import asyncio
+
+import pytest
+
+from services.job_service import JobService, JobQueueFullError
+
+
+def test_jobs_run_and_report_results():
+    async def scenario():
+        service = JobService(max_queue_size=4, workers=2)
+
+        async def work(value):
+            await asyncio.sleep(0)
+            return value * 2
+
+        jobs = [service.submit(lambda v=v: work(v)) for v in range(3)]
+        failing = service.submit(lambda: work(None))
+        await service._queue.join()
+        await service.stop()
+        return service, jobs, failing
+
+    service, jobs, failing = asyncio.run(scenario())
+
+    assert [job.status for job in jobs] == ["succeeded"] * 3
+    assert [job.result for job in jobs] == [0, 2, 4]
+    assert failing.status == "failed"
+    assert service.metrics()["succeeded"] == 3
+    assert service.metrics()["run_time_ms"]["max"] is not None
+
+
+def test_full_queue_rejects_and_cancel():
+    async def scenario():
+        service = JobService(max_queue_size=1, workers=1)
+        started = asyncio.Event()
+
+        async def block():
+            started.set()
+            await asyncio.sleep(60)
+
+        running = service.submit(block)
+        await started.wait()
+        queued = service.submit(block)
+        with pytest.raises(JobQueueFullError):
+            service.submit(block)
+
+        service.cancel(queued.id)
+        service.cancel(running.id)
+        await service._queue.join()
+        await service.stop()
+        return service, running, queued
+
+    service, running, queued = asyncio.run(scenario())
+
+    assert running.status == "cancelled"
+    assert queued.status == "cancelled"
+    assert service.metrics()["rejected"] == 1
+
+
+def test_cancelled_jobs_free_their_queue_place():
+    async def scenario():
+        service = JobService(max_queue_size=2, workers=1)
+        started = asyncio.Event()
+
+        async def block():
+            started.set()
+            await asyncio.sleep(60)
+
+        running = service.submit(block)
+        await started.wait()
+        first, second = service.submit(block), service.submit(block)
+        service.cancel(first.id)
+        service.cancel(second.id)
+        assert service.metrics()["queue_depth"] == 0
+
+        # The cancelled jobs are still in the queue behind the running one
+        replacements = [service.submit(block), service.submit(block)]
+        assert service.metrics()["queue_depth"] == 2
+        with pytest.raises(JobQueueFullError):
+            service.submit(block)
+
+        service.cancel(running.id)
+        await asyncio.sleep(0)
+        await service.stop()
+        return replacements
+
+    replacements = asyncio.run(scenario())
+
+    assert [job.status for job in replacements] == ["cancelled", "cancelled"]
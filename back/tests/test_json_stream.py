@@ -0,0 +1,92 @@
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from services.json_stream import JSONStreamExtractor
+from services.llm_backends import LLMBackend
+from services.llm_cache import NullLLMCache
+from services.llm_service import LLMService
+
+ANSWER = 'Sure, fill in {name} and {x: 1}. ```json\n{"a": "b}]\\"{", "c": [1, {"d": null}]}\n``` and {"other": 1}'
+
+
+def _extract(text, step):
+    extractor = JSONStreamExtractor()
+    for start in range(0, len(text), step):
+        if extractor.feed(text[start:start + step]):
+            return extractor.value, start
+    return None, None
+
+
+@pytest.mark.parametrize("step", [1, 2, 5, 13, 1000])
+def test_first_value_is_found_whatever_the_chunking(step):
+    value, _ = _extract(ANSWER, step)
+
+    assert value == {"a": 'b}]"{', "c": [1, {"d": None}]}
+    assert _extract('[1, {"x": "]"}] tail', step)[0] == [1, {"x": "]"}]
+    assert _extract('{"a": [1}, {"b": 2}', step)[0] == {"b": 2}
+    assert _extract("no json here", step)[0] is None
+
+
+@pytest.mark.parametrize("step", [1, 7, 1000])
+def test_malformed_value_is_not_replaced_by_a_fragment(step):
+    assert _extract('{"a": 1, "b": {"c": 2},}', step)[0] is None
+    assert _extract('{"models": [{"name": "A",}], "config": {"x": 1}}', step)[0] is None
+    assert _extract('{"a": 1,} then {"b": 2}', step)[0] == {"b": 2}
+
+
+def test_deeply_nested_text_is_scanned_once():
+    start = time.perf_counter()
+
+    assert _extract("{" * 4000 + "}" * 4000, 64)[0] is None
+    assert _extract("[" * 4000 + "]" * 4000 + ' {"a": 1}', 64)[0] == {"a": 1}
+    assert _extract("[" * 500 + "]" * 500, 64)[0] is not None
+    assert time.perf_counter() - start < 1
+
+
+class EndlessJSONBackend(LLMBackend):
+    enabled = True
+    name = model = "endless"
+
+    def __init__(self, document):
+        self.document = document
+        self.chunks_sent = 0
+        self.closed = False
+
+    async def complete(self, prompt, text, response_format="text"):
+        return self.document
+
+    async def stream(self, prompt, text, response_format="text"):
+        try:
+            for start in range(0, len(self.document), 3):
+                self.chunks_sent += 1
+                yield self.document[start:start + 3]
+            while True:
+                self.chunks_sent += 1
+                yield " and more prose"
+        finally:
+            self.closed = True
+
+
+def test_generate_json_stops_at_the_first_value():
+    backend = EndlessJSONBackend('Here you go: {"answer": [1, 2, 3]}')
+    service = LLMService(cache=NullLLMCache(), backend=backend)
+
+    value = asyncio.run(service.generate_json("numbers"))
+
+    assert value == {"answer": [1, 2, 3]}
+    assert backend.closed
+    assert backend.chunks_sent == 12
+
+
+def test_generated_spec_is_validated():
+    spec = json.loads((Path(__file__).resolve().parents[2] / "example-app-spec.json").read_text())
+    service = LLMService(cache=NullLLMCache(), backend=EndlessJSONBackend(json.dumps(spec)))
+    assert asyncio.run(service.generate_json("a spec", validate_spec=True)) == spec
+
+    service = LLMService(cache=NullLLMCache(), backend=EndlessJSONBackend('{"models": 3}'))
+    with pytest.raises(ValueError, match="Generated spec is invalid"):
+        asyncio.run(service.generate_json("a spec", validate_spec=True))
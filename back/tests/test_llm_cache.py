@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from services.llm_cache import LLMCache, SQLiteLLMCache, make_cache_key
+from services.llm_service import LLMService
+
+
+def test_cache_key_is_canonical():
+    first = make_cache_key("gpt", 0.7, "tpl", {"a": 1, "b": [1, 2]})
+    second = make_cache_key("gpt", 0.7, "tpl", {"b": [1, 2], "a": 1})
+
+    assert first == second
+    assert first != make_cache_key("gpt", 0.2, "tpl", {"a": 1, "b": [1, 2]})
+    assert first != make_cache_key("other", 0.7, "tpl", {"a": 1, "b": [1, 2]})
+
+
+def test_sqlite_cache_ttl_and_size_eviction(tmp_path, monkeypatch):
+    cache = SQLiteLLMCache(tmp_path / "llm.sqlite3", ttl_seconds=60, max_bytes=50)
+    now = [1000.0]
+    monkeypatch.setattr("services.llm_cache.time.time", lambda: now[0])
+
+    cache.set("a", "x" * 20)
+    now[0] += 1
+    cache.set("b", "y" * 20)
+    now[0] += 1
+    assert cache.get("a") == "x" * 20  # refreshes "a"
+
+    now[0] += 1
+    cache.set("c", "z" * 20)  # over 50 bytes: evicts the least recently used "b"
+    assert cache.get("b") is None
+    assert cache.get("c") == "z" * 20
+
+    now[0] += 120
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 1
+
+
+def test_llm_service_reuses_cached_response(tmp_path):
+    service = LLMService(cache=SQLiteLLMCache(tmp_path / "llm.sqlite3", ttl_seconds=0, max_bytes=1 << 20))
+    service.enabled = True
+    calls = []
+
+    async def fake_generate(prompt, context):
+        calls.append(prompt)
+        return {"answer": len(calls)}
+
+    service._generate_json = fake_generate
+
+    async def scenario():
+        first = await service.generate_json("user profile", {"fields": ["a", "b"]})
+        second = await service.generate_json("user profile", {"fields": ["a", "b"]})
+        bypassed = await service.generate_json("user profile", {"fields": ["a", "b"]}, use_cache=False)
+        return first, second, bypassed
+
+    first, second, bypassed = asyncio.run(scenario())
+
+    assert first == second == {"answer": 1}
+    assert bypassed == {"answer": 2}
+    assert len(calls) == 2
+
+
+def test_cache_interface_is_abstract():
+    with pytest.raises(TypeError):
+        LLMCache()
@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from config import settings
+from services.llm_backends import StubLLMBackend
+from services.llm_cache import NullLLMCache
+from services.llm_service import LLMBusyError, LLMService
+
+
+def test_calls_queue_behind_the_concurrency_limit(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(settings, "LLM_QUEUE_TIMEOUT", 5.0)
+    service = LLMService(cache=NullLLMCache())
+    peak = []
+
+    async def call():
+        async with service._slot():
+            peak.append(service.concurrency_stats()["active"])
+            await asyncio.sleep(0.01)
+
+    async def scenario():
+        await asyncio.gather(*(call() for _ in range(6)))
+
+    asyncio.run(scenario())
+
+    assert len(peak) == 6
+    assert max(peak) == 2
+    assert service.concurrency_stats() == {"max_concurrency": 2, "active": 0, "waiting": 0}
+
+
+def test_queue_timeout_raises_busy(monkeypatch):
+    monkeypatch.setattr(settings, "LLM_MAX_CONCURRENCY", 1)
+    monkeypatch.setattr(settings, "LLM_QUEUE_TIMEOUT", 0.01)
+    service = LLMService(cache=NullLLMCache())
+
+    async def scenario():
+        async with service._slot():
+            with pytest.raises(LLMBusyError):
+                async with service._slot():
+                    pass
+
+    asyncio.run(scenario())
+
+
+def test_chains_share_the_pooled_client(monkeypatch):
+    monkeypatch.setattr(settings, "OPENAI_API_KEY", "sk-test")
+    monkeypatch.setattr(settings, "LLM_BACKEND", "openai")
+    service = LLMService(cache=NullLLMCache())
+    backend = service.backend
+
+    assert backend.llm.async_client._client._client is backend.http_client
+    assert backend.chains(service.chat_prompt) is backend.chains(service.chat_prompt)
+    assert len(backend._chains) == 2
+
+    asyncio.run(service.aclose())
+    assert backend.http_client.is_closed
+
+
+def test_stub_backend_is_deterministic_and_returns_json():
+    backend = StubLLMBackend(response_tokens=12, token_delay=0, tokens_per_chunk=5, first_token_delay=0)
+    service = LLMService(cache=NullLLMCache(), backend=backend)
+
+    async def scenario():
+        first = [chunk async for chunk in service.chat_stream("hello")]
+        second = [chunk async for chunk in service.chat_stream("hello")]
+        document = await service.generate_json("a user profile")
+        insights = await service.generate_code_from_uml({"classes": [], "relations": []})
+        return first, second, document, insights
+
+    first, second, document, insights = asyncio.run(scenario())
+
+    assert service.enabled
+    assert first == second
+    assert len(first) == 3
+    assert len("".join(first).split()) == 12
+    assert document["stub"] is True and document["request"] == "a user profile"
+    assert insights
+
+
+def test_closing_chat_stream_closes_the_backend_stream():
+    service = LLMService(cache=NullLLMCache(), backend=StubLLMBackend(token_delay=0, first_token_delay=0))
+    closed = []
+
+    async def stream(prompt, text, **kwargs):
+        try:
+            yield "first"
+            yield "second"
+        finally:
+            closed.append(True)
+
+    service.backend.stream = stream
+
+    async def scenario():
+        chunks = service.chat_stream("hello")
+        assert await chunks.__anext__() == "first"
+        await chunks.aclose()
+        # Before the event loop gets to finalise the abandoned generator
+        assert closed == [True]
+        assert service.concurrency_stats()["active"] == 0
+
+    asyncio.run(scenario())
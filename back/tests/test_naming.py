@@ -0,0 +1,28 @@
+from services import naming
+from services.template_service import TemplateService
+
+
+def test_filters_keep_their_output():
+    assert naming.camel_case("order_date") == "orderDate"
+    assert naming.pascal_case("order-date") == "OrderDate"
+    assert naming.snake_case("HTTPServerError") == "http_server_error"
+    assert naming.kebab_case("OrderDate") == "order-date"
+
+
+def test_identifier_conversions():
+    assert naming.pascal_name("orderDate") == "OrderDate"
+    assert naming.camel_name("Order date") == "orderDate"
+    assert naming.kebab_name("OrderLine") == "order-line"
+    assert naming.upper_snake_name("orderDate") == "ORDER_DATE"
+    assert naming.plural_name("Category") == "Categories"
+
+
+def test_filters_are_memoised(tmp_path):
+    service = TemplateService(templates_dir=tmp_path / "templates", cache_dir=tmp_path / "cache")
+    naming.clear_caches()
+
+    rendered = service.render_string("{{ name|snake_case }} {{ name|snake_case }}", {"name": "OrderLine"})
+
+    assert rendered == "order_line order_line"
+    counters = service.metrics()["naming"]["conversions"]["snake_case"]
+    assert (counters["hits"], counters["misses"]) == (1, 1)
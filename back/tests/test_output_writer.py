@@ -0,0 +1,72 @@
+from services.output_writer import OutputWriter
+
+
+def test_incremental_write_reports_manifest(tmp_path):
+    writer = OutputWriter()
+
+    first = writer.write_incremental(tmp_path, {"a.py": "a", "b.py": "b"})
+    assert sorted(first["added"]) == ["a.py", "b.py"]
+
+    second = writer.write_incremental(tmp_path, {"a.py": "a", "b.py": "B", "pkg/c.py": "c"})
+
+    assert second["unchanged"] == ["a.py"]
+    assert second["changed"] == ["b.py"]
+    assert second["added"] == ["pkg/c.py"]
+    assert (tmp_path / "pkg" / "c.py").read_text() == "c"
+
+    third = writer.write_incremental(tmp_path, {"a.py": "a"})
+
+    assert third["removed"] == ["b.py", "pkg/c.py"]
+    assert not (tmp_path / "b.py").exists()
+
+
+def test_incremental_write_skips_unchanged_files(tmp_path):
+    writer = OutputWriter()
+    writer.write_incremental(tmp_path, {"a.py": "a"})
+    mtime = (tmp_path / "a.py").stat().st_mtime_ns
+
+    writer.write_incremental(tmp_path, {"a.py": "a"})
+
+    assert (tmp_path / "a.py").stat().st_mtime_ns == mtime
+    assert [p.name for p in tmp_path.iterdir() if p.name.endswith(".tmp")] == []
+
+
+def test_copy_file_modes(tmp_path):
+    writer = OutputWriter()
+    source = tmp_path / "asset.png"
+    source.write_bytes(b"\x89PNG" + bytes(range(256)) * 10)
+
+    writer.copy_file(source, tmp_path / "copy.png", mode="copy")
+    writer.copy_file(source, tmp_path / "link.png", mode="hardlink")
+
+    assert (tmp_path / "copy.png").read_bytes() == source.read_bytes()
+    assert (tmp_path / "copy.png").stat().st_ino != source.stat().st_ino
+    assert (tmp_path / "link.png").stat().st_ino == source.stat().st_ino
+
+
+def test_incremental_write_copies_path_contents(tmp_path):
+    writer = OutputWriter()
+    source = tmp_path / "source.txt"
+    source.write_text("asset")
+    output = tmp_path / "out"
+
+    assert writer.write_incremental(output, {"static/asset.txt": source})["added"] == ["static/asset.txt"]
+    assert (output / "static/asset.txt").read_text() == "asset"
+
+    second = writer.write_incremental(output, {"static/asset.txt": source})
+    assert second["unchanged"] == ["static/asset.txt"]
+
+
+def test_incremental_write_trusts_previous_files(tmp_path, monkeypatch):
+    writer = OutputWriter()
+    files = {"a.py": "a", "b.py": "b"}
+    writer.write_incremental(tmp_path, files)
+    digested = []
+    monkeypatch.setattr(writer, "_to_bytes", lambda content: digested.append(content) or content.encode())
+
+    manifest = writer.write_incremental(tmp_path, {"a.py": "a", "b.py": "B"}, previous_files=files)
+
+    assert digested == ["B"]
+    assert manifest["unchanged"] == ["a.py"]
+    assert manifest["changed"] == ["b.py"]
+    assert writer.write_incremental(tmp_path, {"a.py": "a", "b.py": "B"})["unchanged"] == ["a.py", "b.py"]
@@ -0,0 +1,66 @@
+import asyncio
+import copy
+import json
+from pathlib import Path
+
+import pytest
+
+from services.application_generator_service import MODEL_TEMPLATES, ApplicationGeneratorService
+from services.render_cache import MemoryRenderCache, RenderCache, SQLiteRenderCache
+
+SPEC = json.loads((Path(__file__).resolve().parents[2] / "example-app-spec.json").read_text())
+
+
+def test_sqlite_cache_size_eviction(tmp_path, monkeypatch):
+    cache = SQLiteRenderCache(tmp_path / "render.sqlite3", max_bytes=50)
+    now = [1000.0]
+    monkeypatch.setattr("services.render_cache.time.time", lambda: now[0])
+
+    cache.set_many({"a": "x" * 20, "b": "y" * 20})
+    now[0] += 1
+    assert cache.get_many(["a", "c"]) == {"a": "x" * 20}  # refreshes "a"
+
+    now[0] += 1
+    cache.set_many({"c": "z" * 20})  # over 50 bytes: evicts the least recently used "b"
+    assert cache.get_many(["a", "b", "c"]) == {"a": "x" * 20, "c": "z" * 20}
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 40, 1)
+    assert (stats["hits"], stats["misses"]) == (3, 2)
+
+
+def test_only_changed_model_is_rendered_again(tmp_path):
+    service = ApplicationGeneratorService(render_cache=SQLiteRenderCache(tmp_path / "render.sqlite3", 1 << 26))
+
+    first = asyncio.run(service.render_application(SPEC))
+    second = asyncio.run(service.render_application(SPEC))
+    assert first["render_cache"]["cached"] == 0
+    assert second["render_cache"] == {"cached": first["render_cache"]["rendered"], "rendered": 0}
+    assert second["files"] == first["files"]
+
+    spec = copy.deepcopy(SPEC)
+    spec["models"][0]["properties"].append({"name": "notes", "type": "textarea", "required": False})
+    changed = asyncio.run(service.render_application(spec))
+
+    # Only the files of the changed model: no project template reads the model list
+    assert changed["render_cache"]["rendered"] == len(MODEL_TEMPLATES)
+    assert "Notes" in changed["files"]["backend/Models/Client.cs"]
+    assert changed["files"]["backend/Models/Commande.cs"] == first["files"]["backend/Models/Commande.cs"]
+
+
+def test_memory_cache_keeps_latest_generation(tmp_path):
+    backend = SQLiteRenderCache(tmp_path / "render.sqlite3", max_bytes=1 << 20)
+    cache = MemoryRenderCache(backend)
+
+    cache.set_many({"a": "x", "b": "y"})
+    assert cache.get_many(["a", "c"]) == {"a": "x"}
+    backend.clear()
+
+    # "a" was looked up by the latest generation, "b" was not
+    assert cache.get_many(["a", "b"]) == {"a": "x"}
+    assert cache.stats()["memory_hits"] == 2
+
+
+def test_cache_interface_is_abstract():
+    with pytest.raises(TypeError):
+        RenderCache()
@@ -0,0 +1,53 @@
+import asyncio
+
+import pytest
+
+from services.render_executor import RenderExecutor
+from services.template_service import TemplateService
+
+
+@pytest.mark.parametrize("mode", ["thread", "process"])
+def test_render_many_keeps_order_and_returns_errors(tmp_path, mode):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "class.py.j2").write_text("class {{ name }}: pass")
+    templates = TemplateService(templates_dir=templates_dir, cache_dir=tmp_path / "cache")
+    executor = RenderExecutor(mode=mode, max_workers=2, templates=templates)
+
+    jobs = [("class.py.j2", {"name": f"C{i}"}) for i in range(5)]
+    jobs.append(("missing.py.j2", {}))
+    try:
+        results = asyncio.run(executor.render_many(jobs))
+    finally:
+        executor.shutdown()
+
+    assert results[:5] == [f"class C{i}: pass" for i in range(5)]
+    assert isinstance(results[5], Exception)
+
+
+class _CountedPickles(list):
+    """List counting how many times it is sent to a worker"""
+
+    pickles = 0
+
+    def __reduce__(self):
+        type(self).pickles += 1
+        return list, (list(self),)
+
+
+def test_process_mode_sends_shared_context_once_per_worker(tmp_path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "class.py.j2").write_text("{{ name }} of {{ all_classes | length }}")
+    templates = TemplateService(templates_dir=templates_dir, cache_dir=tmp_path / "cache")
+    executor = RenderExecutor(mode="process", max_workers=2, templates=templates)
+
+    all_classes = _CountedPickles(f"C{i}" for i in range(1000))
+    jobs = [("class.py.j2", {"name": name}) for name in all_classes]
+    try:
+        results = asyncio.run(executor.render_many(jobs, {"all_classes": all_classes}))
+    finally:
+        executor.shutdown()
+
+    assert results == [f"C{i} of 1000" for i in range(1000)]
+    assert _CountedPickles.pickles == 2
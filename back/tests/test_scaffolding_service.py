@@ -0,0 +1,63 @@
+import asyncio
+import io
+import zipfile
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from config import settings
+from routes import scaffolding
+from services.scaffolding_service import ScaffoldingService
+
+UML = {
+    "classes": [{"id": "c1", "name": "User", "isAbstract": False, "attributes": [], "methods": []}],
+    "relations": [],
+}
+
+
+class SlowLLM:
+    def __init__(self, delay):
+        self.delay = delay
+
+    async def generate_code_from_uml(self, uml_data, target_language="python", use_cache=True):
+        await asyncio.sleep(self.delay)
+        return "Users own missions"
+
+
+def _render(delay, monkeypatch, timeout=5.0):
+    monkeypatch.setattr(settings, "SCAFFOLDING_LLM_MODE", "pipelined")
+    monkeypatch.setattr(settings, "LLM_INSIGHTS_TIMEOUT", timeout)
+    service = ScaffoldingService()
+    service.llm_service = SlowLLM(delay)
+    return asyncio.run(service.render_from_uml(UML, use_llm=True))
+
+
+def test_pipelined_insights_fill_the_header(monkeypatch):
+    files, insights = _render(0.05, monkeypatch)
+
+    assert insights == "Users own missions"
+    assert files["__init__.py"].startswith("# Design notes:\n# Users own missions\n")
+    assert "class User" in files["user.py"]
+
+
+def test_pipelined_insights_time_out_without_failing(monkeypatch):
+    files, insights = _render(5, monkeypatch, timeout=0.05)
+
+    assert insights is None
+    assert files["__init__.py"].startswith('"""Generated models')
+
+
+def test_generate_route_streams_archive():
+    app = FastAPI()
+    app.include_router(scaffolding.router, prefix="/api/scaffolding")
+    client = TestClient(app)
+
+    response = client.post(
+        "/api/scaffolding/generate?archive=zip",
+        json={"umlData": UML, "language": "python", "projectName": "Demo"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-disposition"] == 'attachment; filename="python_Demo.zip"'
+    with zipfile.ZipFile(io.BytesIO(response.content)) as archive:
+        assert sorted(archive.namelist()) == ["python_Demo/__init__.py", "python_Demo/user.py"]
@@ -0,0 +1,88 @@
+import copy
+import dataclasses
+import json
+from pathlib import Path
+
+import pytest
+
+from services.spec_normalizer import SpecNormalizer
+
+SPEC = json.loads((Path(__file__).resolve().parents[2] / "example-app-spec.json").read_text())
+
+LEGACY_SPEC = {
+    "project_name": "Shop",
+    "description": "Orders",
+    "database": {"provider": "postgres", "connection_string_template": "Host=db"},
+    "models": [
+        {"name": "customer", "properties": [{"name": "Id", "type": "int", "isPrimaryKey": True},
+                                            {"name": "CreatedAt", "type": "datetime"},
+                                            {"name": "Email", "type": "string", "isRequired": True}]},
+        {"name": "Order", "properties": [{"name": "Total", "type": "decimal"}]},
+        {"name": "Tag", "properties": [{"name": "Label", "type": "string"}]},
+    ],
+    "relations": [
+        {"name": "CustomerOrders", "from": "customer", "to": "Order", "type": "one-to-many"},
+        {"name": "OrderTags", "from": "Order", "to": "Tag", "type": "many-to-many"},
+    ],
+    "api": {"endpoints": []},
+    "frontend": {"framework": "Angular", "components": []},
+}
+
+
+def test_dsl_spec_is_normalised_once_per_property():
+    app = SpecNormalizer().normalize(SPEC)
+
+    assert app.model_names() == ("Client", "Commande", "Mission")
+    commande = app.models[1]
+    status = next(prop for prop in commande.properties if prop.name == "status")
+    assert status.type.has_choices and status.options[0] == "nouvelle"
+    assert status.label_key == "COMMANDE_STATUS"
+    assert not commande.has_relationships and commande.is_archivable
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        commande.name = "Order"
+    with pytest.raises(TypeError):
+        app.config["project_name"] = "Other"
+
+
+def test_ir_config_does_not_follow_the_callers_spec():
+    spec = copy.deepcopy(SPEC)
+    app = SpecNormalizer().normalize(spec)
+
+    spec["config"]["description"] = "Edited"
+    spec["config"]["api"]["port"] = 8080
+
+    assert app.config["description"] == SPEC["config"]["description"]
+    assert app.config["api"]["port"] == SPEC["config"]["api"]["port"]
+
+
+def test_legacy_relations_become_navigations():
+    app = SpecNormalizer().normalize(LEGACY_SPEC)
+    customer, order, tag = app.models
+
+    assert customer.name == "Customer"
+    assert [prop.pascal for prop in customer.properties] == ["Email"]
+    assert customer.has_collections and not customer.has_relationships
+    assert order.foreign_keys == ("CustomerId",)
+    assert [(r.kind, r.navigation) for r in order.relations] == [("reference", "Customer"), ("collection", "Tags")]
+    assert [(r.kind, r.navigation) for r in tag.relations] == [("collection", "Orders")]
+    assert not hasattr(order.properties[0], "__dict__")
+
+
+def test_invalid_specs_raise_value_error():
+    with pytest.raises(ValueError):
+        SpecNormalizer().normalize([])
+    with pytest.raises(ValueError):
+        SpecNormalizer().normalize({**LEGACY_SPEC, "relations": [
+            {"name": "Broken", "from": "Order", "to": "Missing", "type": "many-to-one"},
+        ]})
+
+
+@pytest.mark.parametrize("project_name", ["../escaped", "/abs", "Demo\\App", 'Demo"; x="', "Demo..App", "1Demo", ""])
+def test_unsafe_project_names_are_rejected(project_name):
+    with pytest.raises(ValueError, match="Invalid project name"):
+        SpecNormalizer().normalize({**LEGACY_SPEC, "project_name": project_name})
+
+    spec = {**SPEC, "config": {**SPEC["config"], "project_name": project_name}}
+    with pytest.raises(ValueError):
+        SpecNormalizer().normalize(spec)
@@ -0,0 +1,105 @@
+import asyncio
+import copy
+import json
+from pathlib import Path
+
+from services.application_generator_service import MODEL_TEMPLATES, ApplicationGeneratorService
+from services.render_cache import MemoryRenderCache, SQLiteRenderCache
+from services.spec_watch_service import SpecWatchService, SpecWatchSession
+
+SPEC = json.loads((Path(__file__).resolve().parents[2] / "example-app-spec.json").read_text())
+
+
+def _make_generator(tmp_path):
+    cache = MemoryRenderCache(SQLiteRenderCache(tmp_path / "render.sqlite3", max_bytes=1 << 26))
+    generator = ApplicationGeneratorService(render_cache=cache)
+    generator.output_dir = tmp_path / "output"
+    return generator
+
+
+def _add_notes(spec):
+    spec = copy.deepcopy(spec)
+    spec["models"][0]["properties"].append({"name": "notes", "type": "textarea", "required": False})
+    return spec
+
+
+def test_session_regenerates_changed_models_only(tmp_path):
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(SPEC))
+    session = SpecWatchSession(spec_path, _make_generator(tmp_path))
+
+    start = asyncio.run(session.regenerate("start"))
+    assert start["success"]
+    assert start["models"]["added"] == ["Client", "Commande", "Mission"]
+    assert start["files"]["added"] == len(start["written"]) > 0
+    assert set(start["timings"]) >= {"read_ms", "normalize_ms", "context_ms", "render_ms", "write_ms", "total_ms"}
+
+    spec_path.write_text(json.dumps(_add_notes(SPEC)))
+    edit = asyncio.run(session.regenerate())
+    assert edit["models"] == {"added": [], "changed": ["Client"], "removed": []}
+    assert edit["render_cache"]["rendered"] == len(MODEL_TEMPLATES)
+    assert "backend/Models/Client.cs" in edit["written"]
+    assert all("Commande" not in path for path in edit["written"])
+    output = Path(edit["output_path"])
+    assert "Notes" in (output / "backend/Models/Client.cs").read_text()
+
+    # A broken save is reported and leaves the output as it was
+    spec_path.write_text("{")
+    broken = asyncio.run(session.regenerate())
+    assert not broken["success"] and broken["error"]
+    assert "Notes" in (output / "backend/Models/Client.cs").read_text()
+
+    spec_path.write_text(json.dumps(SPEC))
+    reverted = asyncio.run(session.regenerate())
+    assert reverted["models"]["changed"] == ["Client"]
+    assert reverted["render_cache"]["rendered"] == 0
+    assert "Notes" not in (output / "backend/Models/Client.cs").read_text()
+
+
+def test_invalid_spec_edit_is_reported(tmp_path):
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(SPEC))
+    session = SpecWatchSession(spec_path, _make_generator(tmp_path))
+    asyncio.run(session.regenerate("start"))
+
+    spec = copy.deepcopy(SPEC)
+    spec["models"][1]["properties"][0]["type"] = "unknown"
+    spec_path.write_text(json.dumps(spec))
+    event = asyncio.run(session.regenerate())
+
+    assert not event["success"]
+    assert "/models/1/properties/0/type" in event["error"]
+
+
+def test_changed_pointers():
+    changed = _add_notes(SPEC)
+    changed["config"] = {**SPEC["config"], "description": "Other"}
+
+    assert SpecWatchSession._changed_pointers(None, SPEC) is None
+    assert SpecWatchSession._changed_pointers(SPEC, copy.deepcopy(SPEC)) == []
+    assert SpecWatchSession._changed_pointers(SPEC, changed) == ["/config", "/models/0"]
+    assert SpecWatchSession._changed_pointers(SPEC, {**SPEC, "models": SPEC["models"][:2]}) == ["/models"]
+
+
+def test_watch_regenerates_on_save(tmp_path):
+    spec_path = tmp_path / "spec.json"
+    spec_path.write_text(json.dumps(SPEC))
+    service = SpecWatchService(generator=_make_generator(tmp_path))
+
+    async def run():
+        stop = asyncio.Event()
+        events = service.watch(spec_path, stop_event=stop, debounce_ms=20, watch_templates=False)
+        start = await asyncio.wait_for(events.__anext__(), timeout=30)
+        # Leave the watcher time to start before saving
+        await asyncio.sleep(0.5)
+        spec_path.write_text(json.dumps(_add_notes(SPEC)))
+        edit = await asyncio.wait_for(events.__anext__(), timeout=10)
+        stop.set()
+        await events.aclose()
+        return start, edit
+
+    start, edit = asyncio.run(run())
+
+    assert start["trigger"] == "start"
+    assert edit["trigger"] == "spec"
+    assert edit["models"]["changed"] == ["Client"]
@@ -0,0 +1,91 @@
+import asyncio
+import json
+
+from fastapi import FastAPI
+
+from routes import chat
+from services.stream_coalescer import coalesce_stream
+
+
+async def _upstream(chunks, delay, state=None):
+    try:
+        for chunk in chunks:
+            await asyncio.sleep(delay)
+            yield chunk
+    finally:
+        if state is not None:
+            state["closed"] = True
+
+
+async def _collect(stream):
+    return [item async for item in stream]
+
+
+def test_small_chunks_are_coalesced_by_size_and_time():
+    text = "abcdefghij" * 10
+    events = asyncio.run(_collect(coalesce_stream(_upstream(text, 0), max_chars=25, max_delay=1, heartbeat_interval=0)))
+
+    assert "".join(events) == text
+    assert [len(event) for event in events] == [25, 25, 25, 25]
+
+    events = asyncio.run(_collect(coalesce_stream(_upstream("abcd", 0.03), max_chars=100, max_delay=0.01, heartbeat_interval=0)))
+
+    assert events == ["a", "b", "c", "d"]
+
+
+def test_idle_stream_emits_heartbeats():
+    events = asyncio.run(_collect(coalesce_stream(_upstream(["late"], 0.12), max_chars=10, max_delay=0.01, heartbeat_interval=0.05)))
+
+    assert events[-1] == "late"
+    assert events.count(None) >= 1
+
+
+def test_closing_the_stream_closes_upstream():
+    state = {}
+
+    async def scenario():
+        stream = coalesce_stream(_upstream("abc" * 100, 0.01, state), max_chars=1, max_delay=0, heartbeat_interval=0)
+        first = await stream.__anext__()
+        await stream.aclose()
+        return first
+
+    assert asyncio.run(scenario()) == "a"
+    assert state["closed"]
+
+
+def test_client_disconnect_cancels_llm_stream(monkeypatch):
+    state = {}
+    monkeypatch.setattr(
+        chat.llm_service, "chat_stream",
+        lambda message, context=None: _upstream(["token "] * 1000, 0.01, state)
+    )
+    app = FastAPI()
+    app.include_router(chat.router, prefix="/api/chat")
+    body = json.dumps({"message": "hi"}).encode()
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/api/chat/stream", "raw_path": b"/api/chat/stream", "query_string": b"",
+        "root_path": "", "server": ("test", 80), "client": ("test", 1),
+        "headers": [(b"content-type", b"application/json")],
+    }
+
+    async def scenario():
+        first_event = asyncio.Event()
+        received = []
+
+        async def receive():
+            if not received:
+                received.append(True)
+                return {"type": "http.request", "body": body, "more_body": False}
+            await first_event.wait()
+            return {"type": "http.disconnect"}
+
+        async def send(message):
+            if message["type"] == "http.response.body" and message.get("body"):
+                first_event.set()
+
+        await asyncio.wait_for(app(scope, receive, send), timeout=5)
+
+    asyncio.run(scenario())
+
+    assert state["closed"]
@@ -0,0 +1,105 @@
+from services.template_manifest import MAX_LISTINGS
+from services.template_service import TemplateService
+
+
+def _make_service(tmp_path):
+    templates_dir = tmp_path / "templates"
+    templates_dir.mkdir()
+    (templates_dir / "hello.txt.j2").write_text("Hello {{ name }}")
+    (templates_dir / "asset.html").write_text("<p>{{ angular }}</p>")
+    return TemplateService(templates_dir=templates_dir, cache_dir=tmp_path / "cache")
+
+
+def test_warm_templates_fills_bytecode_cache(tmp_path):
+    service = _make_service(tmp_path)
+
+    result = service.warm_templates()
+
+    assert result["warmed"] == 1
+    assert result["failed"] == []
+    assert len(list((tmp_path / "cache").iterdir())) == 1
+
+
+def test_bytecode_cache_is_reused_and_refreshed(tmp_path):
+    _make_service(tmp_path).warm_templates()
+    service = TemplateService(templates_dir=tmp_path / "templates", cache_dir=tmp_path / "cache")
+
+    assert service.render_template("hello.txt.j2", {"name": "World"}) == "Hello World"
+
+    (tmp_path / "templates" / "hello.txt.j2").write_text("Bye {{ name }}")
+    service = TemplateService(templates_dir=tmp_path / "templates", cache_dir=tmp_path / "cache")
+
+    assert service.render_template("hello.txt.j2", {"name": "World"}) == "Bye World"
+
+
+def test_manifest_indexes_files_and_dependencies(tmp_path):
+    service = _make_service(tmp_path)
+    templates_dir = tmp_path / "templates"
+    (templates_dir / "macros.j2").write_text("{% macro greet(n) %}Hi {{ n }}{% endmacro %}")
+    (templates_dir / "py").mkdir()
+    (templates_dir / "py" / "a.py.j2").write_text('{% import "macros.j2" as m %}{{ m.greet(name) }}')
+    (templates_dir / "py" / "b.py.j2").write_text('{% include "py/a.py.j2" %}')
+
+    manifest = service.manifest
+
+    assert manifest.get("asset.html").kind == "asset"
+    assert manifest.get("py/a.py.j2").dependencies == {"macros.j2"}
+    assert manifest.dependants_of(["macros.j2"]) == {"py/a.py.j2", "py/b.py.j2"}
+    assert service.list_templates("py/**/*.j2") == ["py/a.py.j2", "py/b.py.j2"]
+    assert service.list_templates("*.j2") == ["hello.txt.j2", "macros.j2"]
+    assert service.list_templates("py/**/*.j2") is service.list_templates("py/**/*.j2")
+
+
+def test_manifest_refresh_invalidates_dependants(tmp_path):
+    service = _make_service(tmp_path)
+    templates_dir = tmp_path / "templates"
+    (templates_dir / "macros.j2").write_text("{% macro greet() %}Hi{% endmacro %}")
+    (templates_dir / "a.py.j2").write_text('{% import "macros.j2" as m %}{{ m.greet() }}')
+    invalidated = []
+    service.manifest.subscribe(invalidated.append)
+    assert service.template_variables("a.py.j2") == set()
+
+    (templates_dir / "macros.j2").write_text("{% macro greet() %}Hi {{ user }}{% endmacro %}")
+    assert service.manifest.refresh([templates_dir / "macros.j2"]) == {"macros.j2", "a.py.j2"}
+
+    assert invalidated == [{"macros.j2", "a.py.j2"}]
+    assert service.template_variables("a.py.j2") == {"user"}
+
+    # Unchanged content and removals
+    assert service.manifest.refresh([templates_dir / "hello.txt.j2"]) == set()
+    (templates_dir / "asset.html").unlink()
+    (templates_dir / "new.j2").write_text("new")
+    assert service.manifest.refresh([templates_dir / "asset.html", templates_dir / "new.j2"]) == {"asset.html", "new.j2"}
+    assert "asset.html" not in service.list_templates()
+    assert "new.j2" in service.list_templates()
+
+
+def test_manifest_digest_covers_included_templates(tmp_path):
+    service = _make_service(tmp_path)
+    templates_dir = tmp_path / "templates"
+    (templates_dir / "macros.j2").write_text("{% macro greet() %}Hi{% endmacro %}")
+    (templates_dir / "a.py.j2").write_text('{% import "macros.j2" as m %}{{ m.greet() }}')
+    manifest = service.manifest
+    digests = {name: manifest.digest(name) for name in ("a.py.j2", "hello.txt.j2")}
+
+    # Edits are picked up from the file stats, without an explicit refresh
+    (templates_dir / "macros.j2").write_text("{% macro greet() %}Hello{% endmacro %}")
+
+    assert manifest.digest("a.py.j2") != digests["a.py.j2"]
+    assert manifest.digest("hello.txt.j2") == digests["hello.txt.j2"]
+
+
+def test_manifest_keeps_recent_listings_only(tmp_path):
+    service = _make_service(tmp_path)
+    recent = service.list_templates("*.j2")
+    evicted = service.list_templates("*.html")
+
+    for i in range(MAX_LISTINGS):
+        assert service.list_templates(f"missing-{i}/*.j2") == []
+        # Served from the cache while it stays among the most recently used
+        assert service.list_templates("*.j2") is recent
+
+    # Computed again once more than MAX_LISTINGS other patterns were listed
+    listing = service.list_templates("*.html")
+    assert listing == evicted == ["asset.html"]
+    assert listing is not evicted
@@ -0,0 +1,46 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from services.type_system import TYPE_MAPPINGS, resolve_property_type
+
+SCHEMA = json.loads((Path(__file__).resolve().parents[2] / "docs" / "schema.json").read_text())
+
+
+def _schema_types(node):
+    if isinstance(node, dict):
+        if "text" in node.get("enum", []):
+            return node["enum"]
+        for value in node.values():
+            found = _schema_types(value)
+            if found:
+                return found
+    elif isinstance(node, list):
+        for value in node:
+            found = _schema_types(value)
+            if found:
+                return found
+    return None
+
+
+def test_every_schema_type_is_mapped():
+    assert set(TYPE_MAPPINGS) == set(_schema_types(SCHEMA))
+
+
+def test_resolved_types_are_shared():
+    first = resolve_property_type("text", 120, False)
+
+    assert first is resolve_property_type("text", 120, False)
+    assert first.sql_type == "VARCHAR(120)"
+    assert first.column_type == "varchar(120)"
+    assert resolve_property_type("text", None, True).column_type is None
+    assert resolve_property_type("address", None, False).is_reference
+
+
+def test_unknown_type_raises_value_error():
+    with pytest.raises(ValueError):
+        resolve_property_type("blob", None, False)
+
+    with pytest.raises(TypeError):
+        TYPE_MAPPINGS["blob"] = TYPE_MAPPINGS["text"]